@@ -6,11 +6,19 @@ Provides common functionality for agent lifecycle, communication, and workflow e
 
 import sys
 import os
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from collections import deque
+from typing import Awaitable, Callable, Dict, List, Optional, Any, ClassVar, TypeVar
 import threading
 import time
+import subprocess
+
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
 
 # Add tools to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../tools'))
@@ -18,7 +26,85 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../../tools'))
 from core.workflow_parser import WorkflowParser, WorkflowDefinition
 from core.message_bus import MessageBus, Message, MessageType
 from core.context_store import ContextStore
-from core.agent_registry import AgentRegistry, AgentStatus, Task
+from core.agent_registry import AgentRegistry, AgentStatus, Task, load_agent_config
+from core.work_stealing import get_work_pool, WorkStealingDeque
+from core.logging_setup import get_agent_logger
+
+
+# Repository root, resolved once at import; AGENT_PROJECT_ROOT overrides it when
+# agents operate on a checkout other than the one they run from
+PROJECT_ROOT = os.environ.get("AGENT_PROJECT_ROOT") or os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+# Scratch output shared by every agent (.tmp/ under the project root by default)
+TMP_DIR = os.environ.get("AGENT_TMP_DIR") or os.path.join(PROJECT_ROOT, ".tmp")
+
+# Cap on external processes (git, gradle, pip, pytest) running at once across
+# every agent in this process; AGENT_SUBPROCESS_CONCURRENCY overrides it
+SUBPROCESS_CONCURRENCY = int(
+    os.environ.get("AGENT_SUBPROCESS_CONCURRENCY") or min(4, os.cpu_count() or 1)
+)
+SUBPROCESS_SLOTS = threading.BoundedSemaphore(SUBPROCESS_CONCURRENCY)
+
+T = TypeVar("T")
+
+
+async def _acquire_subprocess_slot():
+    """
+    Wait for a SUBPROCESS_SLOTS slot without blocking the event loop
+
+    The blocking acquire runs in a worker thread, which cannot be interrupted.
+    If the waiting coroutine is cancelled, the slot that thread eventually
+    takes is handed straight back instead of being held forever.
+    """
+    acquire = asyncio.ensure_future(asyncio.to_thread(SUBPROCESS_SLOTS.acquire))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        acquire.add_done_callback(
+            lambda done: done.cancelled() or done.exception() or SUBPROCESS_SLOTS.release()
+        )
+        raise
+
+
+class _HeartbeatScheduler:
+    """
+    One timer thread that drives heartbeats for every agent in the process
+
+    Ticks once a second and lets each registered agent beat if its interval
+    has elapsed, instead of every agent sleeping on its own thread.
+    """
+
+    TICK_SECONDS = 1.0
+
+    _agents: set = set()
+    _lock = threading.Lock()
+    _thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def register(cls, agent: 'BaseAgent'):
+        """Start driving heartbeats for an agent"""
+        with cls._lock:
+            cls._agents.add(agent)
+            if cls._thread is None:
+                cls._thread = threading.Thread(target=cls._run, name="heartbeat-scheduler", daemon=True)
+                cls._thread.start()
+
+    @classmethod
+    def unregister(cls, agent: 'BaseAgent'):
+        """Stop driving heartbeats for an agent"""
+        with cls._lock:
+            cls._agents.discard(agent)
+
+    @classmethod
+    def _run(cls):
+        while True:
+            time.sleep(cls.TICK_SECONDS)
+            with cls._lock:
+                agents = list(cls._agents)
+            for agent in agents:
+                agent._maybe_heartbeat()
 
 
 class BaseAgent(ABC):
@@ -33,6 +119,21 @@ class BaseAgent(ABC):
     - Error handling and recovery
     """
 
+    # Workflow listings shared by every agent in the process:
+    # category directory -> (directory mtime_ns, workflow paths)
+    _workflow_cache: ClassVar[Dict[str, tuple]] = {}
+
+    # Parsed workflows shared the same way:
+    # workflow file path -> (file mtime_ns, WorkflowDefinition)
+    _workflow_definitions: ClassVar[Dict[str, tuple]] = {}
+
+    # Idle polling backoff bounds for the main loop (seconds)
+    MIN_IDLE_BACKOFF = 0.01
+    MAX_IDLE_BACKOFF = 1.0
+
+    # Most records an agent keeps in its in-memory task history; older ones drop off
+    HISTORY_CAP = int(os.getenv("HISTORY_CAP", "1024"))
+
     def __init__(self, agent_id: str, role: str, config_path: str = None):
         """
         Initialize base agent
@@ -45,13 +146,12 @@ class BaseAgent(ABC):
         self.agent_id = agent_id
         self.role = role
         self.status = AgentStatus.STARTING
+        self.log = get_agent_logger(agent_id, role)  # Queue-backed; see core.logging_setup
         self.running = False
 
         # Use relative path that works in both local and Railway environments
         if config_path is None:
-            # Try to find config relative to this file
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-            config_path = os.path.join(base_dir, "config", "agent_roles.yaml")
+            config_path = os.path.join(PROJECT_ROOT, "config", "agent_roles.yaml")
 
         self.config_path = config_path
 
@@ -67,11 +167,24 @@ class BaseAgent(ABC):
         self.max_concurrent_tasks: int = 3
 
         # Current tasks
-        self.current_tasks: List[Task] = []
+        self.current_tasks: Dict[str, Task] = {}  # task_id -> task
+
+        # Heartbeats come from the shared scheduler thread and from normal
+        # activity, at most once per interval (see _maybe_heartbeat)
+        self.heartbeat_interval: int = 30  # seconds
+        self._last_heartbeat: float = 0.0
+
+        # Message type -> handler (built in _subscribe_to_messages)
+        self._message_handlers: Dict[MessageType, Any] = {}
+
+        # In-process work stealing (deque registered while run() is active)
+        self.work_pool = get_work_pool()
+        self.work_deque: Optional[WorkStealingDeque] = None
+        self.work_available = threading.Event()
 
-        # Heartbeat thread
-        self.heartbeat_thread: Optional[threading.Thread] = None
-        self.heartbeat_interval: int = 60  # seconds
+        # Event loop for run_async(), started on first use in its own thread
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
 
     def startup(self) -> bool:
         """
@@ -81,7 +194,7 @@ class BaseAgent(ABC):
             True if startup successful
         """
         try:
-            print(f"[{self.agent_id}] Starting {self.role} agent...")
+            self.log.info("Starting %s agent...", self.role)
 
             # 1. Initialize core systems
             self._initialize_core_systems()
@@ -101,63 +214,72 @@ class BaseAgent(ABC):
             # 6. Subscribe to message bus
             self._subscribe_to_messages()
 
-            # 7. Start heartbeat
-            self._start_heartbeat()
-
-            # 8. Update status to IDLE
+            # 7. Update status to IDLE
             self.status = AgentStatus.IDLE
             self.registry.update_agent_status(self.agent_id, AgentStatus.IDLE)
             self.running = True
 
-            print(f"[{self.agent_id}] ✓ Agent started successfully")
+            # 8. Join the shared heartbeat timer
+            _HeartbeatScheduler.register(self)
+
+            self.log.info("✓ Agent started successfully")
             return True
 
         except Exception as e:
-            print(f"[{self.agent_id}] ✗ Startup failed: {e}")
+            self.log.error("✗ Startup failed: %s", e)
             self.status = AgentStatus.ERROR
             return False
 
     def _initialize_core_systems(self):
         """Initialize context store, message bus, and registry"""
-        # Create context store (JSON file for now, can switch to Redis)
-        self.context_store = ContextStore.create("json_file")
+        # Backends come from the environment so agents can run as separate
+        # processes sharing Redis (e.g. MESSAGE_BUS_TYPE=redis_pubsub,
+        # CONTEXT_STORE_TYPE=redis, REDIS_URL=unix:///tmp/redis.sock)
+        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+
+        # Create context store (JSON file unless configured otherwise)
+        self.context_store = ContextStore.create(
+            os.getenv("CONTEXT_STORE_TYPE", "json_file"),
+            redis_url=redis_url
+        )
 
-        # Create message bus (in-memory for now, can switch to Redis)
-        self.message_bus = MessageBus.create("in_memory")
+        # Create message bus (in-memory unless configured otherwise)
+        self.message_bus = MessageBus.create(
+            os.getenv("MESSAGE_BUS_TYPE", "in_memory"),
+            redis_url=redis_url
+        )
 
         # Create agent registry
         self.registry = AgentRegistry(self.context_store, self.config_path)
 
         # Create workflow parser
-        self.workflow_parser = WorkflowParser()
+        self.workflow_parser = WorkflowParser(os.path.join(PROJECT_ROOT, "workflows"))
 
-        print(f"[{self.agent_id}] Core systems initialized")
+        self.log.info("Core systems initialized")
 
     def _load_configuration(self):
         """Load agent capabilities and workflows from config"""
-        import yaml
-
         try:
             if not os.path.exists(self.config_path):
-                print(f"[{self.agent_id}] ⚠️  Config file not found at {self.config_path}, using defaults")
+                self.log.warning("⚠️  Config file not found at %s, using defaults", self.config_path)
                 # Use default configuration
                 self.capabilities = []
                 self.workflows = []
                 self.max_concurrent_tasks = 3
                 return
 
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_agent_config(self.config_path)
 
             if self.role in config.get('agents', {}):
                 role_config = config['agents'][self.role]
-                self.capabilities = role_config.get('capabilities', [])
-                self.workflows = role_config.get('workflows', [])
+                # Copy so the shared parsed config is never mutated through us
+                self.capabilities = list(role_config.get('capabilities', []))
+                self.workflows = list(role_config.get('workflows', []))
                 self.max_concurrent_tasks = role_config.get('max_concurrent_tasks', 3)
 
-            print(f"[{self.agent_id}] Configuration loaded: {len(self.capabilities)} capabilities, {len(self.workflows)} workflows")
+            self.log.info("Configuration loaded: %s capabilities, %s workflows", len(self.capabilities), len(self.workflows))
         except Exception as e:
-            print(f"[{self.agent_id}] ⚠️  Config loading failed: {e}, using defaults")
+            self.log.warning("⚠️  Config loading failed: %s, using defaults", e)
             self.capabilities = []
             self.workflows = []
             self.max_concurrent_tasks = 3
@@ -174,73 +296,110 @@ class BaseAgent(ABC):
         if not success:
             raise Exception("Failed to register with agent registry")
 
-        print(f"[{self.agent_id}] Registered with system")
+        self.log.info("Registered with system")
 
     def _load_context(self):
         """Load current system context"""
         active_agents = self.context_store.get_context("system.active_agents", [])
         current_tasks = self.context_store.get_context("system.current_tasks", [])
 
-        print(f"[{self.agent_id}] Context loaded: {len(active_agents)} active agents, {len(current_tasks)} current tasks")
+        self.log.info("Context loaded: %s active agents, %s current tasks", len(active_agents), len(current_tasks))
 
     def _discover_workflows(self):
         """Discover and cache available workflows"""
-        # Get all workflows for this agent's role
+        # Workflows are only listed here; each one is parsed on first get_workflow()
         available_workflows = []
         for workflow_category in ['core', 'development', 'testing', 'deployment', 'connectors', 'data']:
-            workflows = self.workflow_parser.list_workflows(workflow_category)
+            workflows = self._list_workflows_cached(workflow_category)
             available_workflows.extend(workflows)
 
-        print(f"[{self.agent_id}] Discovered {len(available_workflows)} workflows")
+        self.log.info("Discovered %s workflows", len(available_workflows))
+
+    def _list_workflows_cached(self, category: str) -> List[str]:
+        """
+        List a workflow category, reusing another agent's listing if the
+        directory hasn't changed since
+
+        Args:
+            category: Workflow category subdirectory
+
+        Returns:
+            Workflow paths relative to the workflows directory
+        """
+        category_dir = os.path.join(self.workflow_parser.workflows_dir, category)
+        try:
+            mtime = os.stat(category_dir).st_mtime_ns
+        except OSError:
+            return []
+
+        cached = BaseAgent._workflow_cache.get(category_dir)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        workflows = self.workflow_parser.list_workflows(category)
+        BaseAgent._workflow_cache[category_dir] = (mtime, workflows)
+        return workflows
 
     def _subscribe_to_messages(self):
         """Subscribe to message bus for task assignments"""
+        # Built once; other message types are ignored
+        self._message_handlers = {
+            MessageType.TASK_ASSIGNMENT: self._handle_task_assignment,
+            MessageType.REQUEST: self._handle_request,
+            MessageType.BROADCAST: self._handle_broadcast,
+        }
+
         def message_handler(message: Message):
             """Handle incoming messages"""
+            handler = self._message_handlers.get(message.message_type)
+            if handler is None:
+                return
             try:
-                if message.message_type == MessageType.TASK_ASSIGNMENT:
-                    self._handle_task_assignment(message)
-                elif message.message_type == MessageType.REQUEST:
-                    self._handle_request(message)
-                elif message.message_type == MessageType.BROADCAST:
-                    self._handle_broadcast(message)
+                handler(message)
             except Exception as e:
-                print(f"[{self.agent_id}] Error handling message: {e}")
+                self.log.error("Error handling message: %s", e)
 
         self.message_bus.subscribe_to_messages(self.agent_id, message_handler)
-        print(f"[{self.agent_id}] Subscribed to message bus")
+        self.log.info("Subscribed to message bus")
 
-    def _start_heartbeat(self):
-        """Start heartbeat thread to maintain registration"""
-        def heartbeat_loop():
-            while self.running:
-                try:
-                    self.registry.heartbeat(self.agent_id)
-                    time.sleep(self.heartbeat_interval)
-                except Exception as e:
-                    print(f"[{self.agent_id}] Heartbeat error: {e}")
+    def _maybe_heartbeat(self):
+        """Send a heartbeat if the last one is older than heartbeat_interval"""
+        now = time.monotonic()
+        if now - self._last_heartbeat < self.heartbeat_interval:
+            return
 
-        self.heartbeat_thread = threading.Thread(target=heartbeat_loop, daemon=True)
-        self.heartbeat_thread.start()
-        print(f"[{self.agent_id}] Heartbeat started")
+        self._last_heartbeat = now
+        try:
+            self.registry.heartbeat(self.agent_id)
+        except Exception as e:
+            self.log.error("Heartbeat error: %s", e)
 
     def _handle_task_assignment(self, message: Message):
         """Handle task assignment from coordinator"""
         payload = message.payload
+        # Workflow names and priorities come from a small fixed set; interning
+        # them keeps one copy shared by every in-flight Task
+        workflow = payload.get('workflow')
         task = Task(
             task_id=payload.get('task_id'),
-            workflow=payload.get('workflow'),
+            workflow=sys.intern(workflow) if workflow else workflow,
             description=payload.get('description'),
-            priority=payload.get('priority', 'normal'),
-            assigned_at=datetime.now().isoformat()
+            priority=sys.intern(payload.get('priority', 'normal')),
+            assigned_at=time.time()
         )
 
+        self._start_assigned_task(task)
+
+    def _start_assigned_task(self, task: Task):
+        """Record a task as ours and execute it"""
+        self._maybe_heartbeat()
+
         # Add to current tasks
-        self.current_tasks.append(task)
+        self.current_tasks[task.task_id] = task
         self.registry.assign_task(self.agent_id, task)
         self.status = AgentStatus.BUSY
 
-        print(f"[{self.agent_id}] Task assigned: {task.task_id} - {task.description}")
+        self.log.info("Task assigned: %s - %s", task.task_id, task.description)
 
         # Execute task (subclass implements)
         self.execute_task(task)
@@ -268,33 +427,33 @@ class BaseAgent(ABC):
     def complete_task(self, task_id: str):
         """Mark task as completed"""
         self.registry.complete_task(self.agent_id, task_id)
+        self._maybe_heartbeat()
 
-        # Remove from current tasks
-        self.current_tasks = [t for t in self.current_tasks if t.task_id != task_id]
+        # Remove from current tasks (dict.pop is atomic, no rebuild)
+        self.current_tasks.pop(task_id, None)
+        self._idle_if_drained()
 
-        # Update status
-        if len(self.current_tasks) == 0:
-            self.status = AgentStatus.IDLE
-            self.registry.update_agent_status(self.agent_id, AgentStatus.IDLE)
-
-        print(f"[{self.agent_id}] Task completed: {task_id}")
+        self.log.info("Task completed: %s", task_id)
 
     def fail_task(self, task_id: str, error_message: str):
         """Mark task as failed"""
         self.registry.fail_task(self.agent_id, task_id, error_message)
 
         # Remove from current tasks
-        self.current_tasks = [t for t in self.current_tasks if t.task_id != task_id]
+        self.current_tasks.pop(task_id, None)
+        self._idle_if_drained()
 
-        # Update status
-        if len(self.current_tasks) == 0:
+        self.log.error("Task failed: %s - %s", task_id, error_message)
+
+    def _idle_if_drained(self):
+        """Switch to IDLE once the last current task is gone"""
+        if self.status != AgentStatus.IDLE and not self.current_tasks:
             self.status = AgentStatus.IDLE
             self.registry.update_agent_status(self.agent_id, AgentStatus.IDLE)
 
-        print(f"[{self.agent_id}] Task failed: {task_id} - {error_message}")
-
     def send_message(self, to_agent: str, message_type: MessageType, payload: Dict, priority: str = "normal"):
         """Send message to another agent"""
+        self._maybe_heartbeat()
         msg_id = self.message_bus.publish_message(
             from_agent=self.agent_id,
             to_agent=to_agent,
@@ -314,10 +473,141 @@ class BaseAgent(ABC):
         )
         return msg_ids
 
+    def run_async(self, coro: Awaitable[T]) -> T:
+        """
+        Run a coroutine on this agent's event loop and wait for its result
+
+        Used instead of asyncio.run() so tasks reuse one long-lived loop (uvloop
+        when installed) rather than creating and tearing down a loop each time.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result (its exception is re-raised)
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = _new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name=f"{self.agent_id}-loop",
+                    daemon=True
+                ).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def run_subprocess(self, *args, **kwargs) -> subprocess.CompletedProcess:
+        """
+        subprocess.run(), waiting for a free slot under SUBPROCESS_CONCURRENCY
+
+        Takes the same arguments as subprocess.run(). Code that spawns processes
+        another way (asyncio, GitPython) holds SUBPROCESS_SLOTS directly.
+        """
+        with SUBPROCESS_SLOTS:
+            return subprocess.run(*args, **kwargs)
+
+    async def run_subprocess_async(self, args: List[str], cwd: Optional[str] = None,
+                                   timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """
+        Coroutine version of subprocess.run(args, capture_output=True, text=True)
+
+        Waits for a SUBPROCESS_SLOTS slot like run_subprocess(), so several of
+        these can be gathered without exceeding the process-wide cap.
+
+        Args:
+            args: Command and arguments
+            cwd: Working directory for the command
+            timeout: Seconds before the process is killed
+
+        Returns:
+            CompletedProcess with decoded stdout and stderr
+
+        Raises:
+            subprocess.TimeoutExpired: If the command ran past timeout
+        """
+        await _acquire_subprocess_slot()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise subprocess.TimeoutExpired(args, timeout)
+        finally:
+            SUBPROCESS_SLOTS.release()
+
+        return subprocess.CompletedProcess(
+            args, proc.returncode,
+            stdout.decode(errors="replace"), stderr.decode(errors="replace")
+        )
+
+    async def stream_subprocess_async(self, args: List[str], cwd: Optional[str] = None,
+                                      timeout: Optional[float] = None,
+                                      on_line: Optional[Callable[[str], None]] = None,
+                                      tail_lines: int = 1024) -> subprocess.CompletedProcess:
+        """
+        Run a command, handling its output line by line as it is produced
+
+        Unlike run_subprocess_async(), the output is never held in full: stderr
+        is merged into stdout, each line goes to on_line (and the debug log) as
+        soon as it arrives, and only the last tail_lines lines are kept. Memory
+        stays bounded however long a test or build log gets.
+
+        Args:
+            args: Command and arguments
+            cwd: Working directory for the command
+            timeout: Seconds before the process is killed
+            on_line: Called with every output line (without the newline)
+            tail_lines: Number of trailing lines kept for the result
+
+        Returns:
+            CompletedProcess whose stdout holds the output tail (stderr is None)
+
+        Raises:
+            subprocess.TimeoutExpired: If the command ran past timeout
+        """
+        tail: deque = deque(maxlen=tail_lines)
+
+        async def pump(stream: asyncio.StreamReader):
+            async for raw in stream:
+                line = raw.decode(errors="replace").rstrip("\r\n")
+                tail.append(line)
+                self.log.debug("  | %s", line)
+                if on_line is not None:
+                    on_line(line)
+
+        await _acquire_subprocess_slot()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=1 << 20  # Tolerate long lines (stack traces, minified output)
+            )
+            try:
+                await asyncio.wait_for(asyncio.gather(pump(proc.stdout), proc.wait()), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise subprocess.TimeoutExpired(args, timeout, output="\n".join(tail))
+        finally:
+            SUBPROCESS_SLOTS.release()
+
+        return subprocess.CompletedProcess(args, proc.returncode, "\n".join(tail), None)
+
     def get_workflow(self, workflow_path: str) -> Optional[WorkflowDefinition]:
         """
         Get workflow definition by path
 
+        The parsed definition is reused until the file's mtime changes.
+
         Args:
             workflow_path: Path to workflow file (e.g., "core/agent_startup.md")
 
@@ -325,25 +615,71 @@ class BaseAgent(ABC):
             WorkflowDefinition or None if not found
         """
         try:
-            return self.workflow_parser.parse_workflow(workflow_path)
+            file_path = os.path.join(self.workflow_parser.workflows_dir, workflow_path)
+            try:
+                mtime = os.stat(file_path).st_mtime_ns
+            except OSError:
+                mtime = None  # Let the parser raise its usual error
+
+            cached = BaseAgent._workflow_definitions.get(file_path)
+            if cached and mtime is not None and cached[0] == mtime:
+                return cached[1]
+
+            workflow = self.workflow_parser.parse_workflow(workflow_path)
+            if mtime is not None:
+                BaseAgent._workflow_definitions[file_path] = (mtime, workflow)
+            return workflow
         except Exception as e:
-            print(f"[{self.agent_id}] Error loading workflow {workflow_path}: {e}")
+            self.log.error("Error loading workflow %s: %s", workflow_path, e)
             return None
 
+    def _next_task(self) -> Optional[Task]:
+        """
+        Get the next task from our deque, stealing from a sibling if it is empty
+
+        Returns:
+            Task to execute or None if there is no work anywhere
+        """
+        task = self.work_deque.pop()
+        if task is not None:
+            return task
+
+        stolen = self.work_pool.steal_for(self.agent_id)
+        if not stolen:
+            return None
+
+        self.log.info("Stole %s task(s) from a sibling", len(stolen))
+        for extra in stolen[1:]:
+            self.work_deque.push(extra)
+        return stolen[0]
+
+    def _release_work_deque(self):
+        """Unregister our deque, handing queued tasks to a sibling"""
+        if self.work_deque is None:
+            return
+
+        dropped = self.work_pool.unregister(self.agent_id)
+        self.work_deque = None
+        if dropped:
+            self.log.warning("⚠️  %s queued task(s) dropped, no sibling to take them", len(dropped))
+
     def shutdown(self):
         """Shutdown agent gracefully"""
-        print(f"[{self.agent_id}] Shutting down...")
+        self.log.info("Shutting down...")
         self.running = False
+        _HeartbeatScheduler.unregister(self)
+        self.work_available.set()  # Unpark the main loop so it can exit
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+        self._release_work_deque()
 
         # Deregister from system
         if self.registry:
             self.registry.deregister_agent(self.agent_id)
 
-        # Wait for heartbeat thread to stop
-        if self.heartbeat_thread:
-            self.heartbeat_thread.join(timeout=5)
-
-        print(f"[{self.agent_id}] Shutdown complete")
+        self.log.info("Shutdown complete")
 
     def run(self):
         """
@@ -354,15 +690,28 @@ class BaseAgent(ABC):
         if not self.startup():
             return
 
-        print(f"[{self.agent_id}] Entering main loop...")
+        self.log.info("Entering main loop...")
+
+        # Tasks routed inside this process arrive on our deque; messages from
+        # other processes still arrive via message bus callbacks
+        self.work_deque = self.work_pool.register(self.agent_id, self.role, self.work_available)
+        backoff = self.MIN_IDLE_BACKOFF
 
         try:
             while self.running:
-                # Agent is event-driven via message bus callbacks
-                # Just keep alive and let callbacks handle work
-                time.sleep(1)
+                task = self._next_task()
+                if task is not None:
+                    self._start_assigned_task(task)
+                    backoff = self.MIN_IDLE_BACKOFF
+                    continue
+
+                # Park until a push wakes us; the timeout backs off exponentially
+                # so idle thieves still poll busy siblings without spinning
+                self.work_available.wait(timeout=backoff)
+                self.work_available.clear()
+                backoff = min(backoff * 2, self.MAX_IDLE_BACKOFF)
         except KeyboardInterrupt:
-            print(f"\n[{self.agent_id}] Interrupted by user")
+            self.log.info("Interrupted by user")
         finally:
             self.shutdown()
 
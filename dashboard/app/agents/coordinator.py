@@ -10,30 +10,62 @@ Responsibilities:
 
 import sys
 import os
-from typing import Dict, List, Optional
+import re
+import uuid
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Set, Pattern, Final
 import time
 
 # Add tools to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../tools'))
 
 from .base_agent import BaseAgent
-from core.agent_registry import Task, AgentStatus
+from core.agent_registry import Agent, Task, AgentStatus, load_agent_config
 from core.message_bus import MessageType
 
 
+# Routing keywords mapped to the category they signal
+_TASK_KEYWORDS: Final[Dict[str, str]] = {
+    'add': 'feature', 'create': 'feature', 'implement': 'feature', 'new feature': 'feature',
+    'fix': 'bug', 'bug': 'bug', 'error': 'bug', 'issue': 'bug',
+    'test': 'test', 'verify': 'test', 'validate': 'test',
+    'deploy': 'deploy', 'release': 'deploy', 'publish': 'deploy',
+    'scrape': 'scrape', 'fetch': 'scrape', 'download': 'scrape',
+    'post': 'social', 'tweet': 'social', 'social': 'social',
+    'watch': 'watch', 'android': 'android',
+    'dashboard': 'dashboard',
+}
+
+# One pass over the description finds every keyword; the lookahead keeps
+# overlapping matches so results equal the old per-keyword substring checks
+_TASK_KEYWORD_RE: Final[Pattern[str]] = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_TASK_KEYWORDS, key=len, reverse=True)) + "))"
+)
+
+
 class CoordinatorAgent(BaseAgent):
     """
     Central coordination agent that routes tasks and manages the swarm
     """
 
+    # Most unroutable tasks kept waiting for an agent; beyond this the oldest are dropped
+    TASK_QUEUE_LIMIT = 4096
+
+    # Retry policy for batched assignment publishes
+    PUBLISH_ATTEMPTS = 3
+    PUBLISH_BACKOFF_START = 0.1  # seconds
+
     def __init__(self, agent_id: str = "coordinator-1"):
         super().__init__(agent_id=agent_id, role="coordinator")
 
         # Workflow registry for task routing
         self.workflow_registry: Dict = {}
 
-        # Task queue for pending tasks
-        self.task_queue: List[Dict] = []
+        # Task queue for pending tasks. Producers (routing from message handler
+        # threads) serialize on a lock; process_queued_tasks is the only consumer
+        self.task_queue: deque = deque(maxlen=self.TASK_QUEUE_LIMIT)
+        self._queue_lock = threading.Lock()
 
     def startup(self) -> bool:
         """Start coordinator with additional workflow registry loading"""
@@ -43,18 +75,15 @@ class CoordinatorAgent(BaseAgent):
         # Load workflow registry
         self._load_workflow_registry()
 
-        print(f"[{self.agent_id}] Coordinator ready to route tasks")
+        self.log.info("Coordinator ready to route tasks")
         return True
 
     def _load_workflow_registry(self):
         """Load workflow registry from config"""
-        import yaml
-
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_agent_config(self.config_path)
 
         self.workflow_registry = config.get('workflow_registry', {})
-        print(f"[{self.agent_id}] Loaded {len(self.workflow_registry)} workflow mappings")
+        self.log.info("Loaded %s workflow mappings", len(self.workflow_registry))
 
     def execute_task(self, task: Task):
         """
@@ -64,7 +93,7 @@ class CoordinatorAgent(BaseAgent):
             task: Task to execute
         """
         try:
-            print(f"[{self.agent_id}] Executing task: {task.description}")
+            self.log.info("Executing task: %s", task.description)
 
             # Coordinator tasks are typically routing or monitoring
             if "route" in task.description.lower():
@@ -81,7 +110,7 @@ class CoordinatorAgent(BaseAgent):
 
         except Exception as e:
             error_msg = f"Coordinator task failed: {str(e)}"
-            print(f"[{self.agent_id}] {error_msg}")
+            self.log.error(error_msg)
             self.fail_task(task.task_id, error_msg)
 
     def route_incoming_task(self, task_description: str, priority: str = "normal") -> bool:
@@ -96,77 +125,231 @@ class CoordinatorAgent(BaseAgent):
             True if task was routed successfully
         """
         try:
-            print(f"\n[{self.agent_id}] === Routing New Task ===")
-            print(f"Description: {task_description}")
-            print(f"Priority: {priority}")
-
-            # 1. Analyze task to determine type
-            task_type = self._analyze_task_type(task_description)
-            print(f"Task type: {task_type}")
-
-            # 2. Find appropriate workflow
-            workflow_info = self._find_workflow(task_type)
-            if not workflow_info:
-                print(f"[{self.agent_id}] No workflow found for task type: {task_type}")
+            self.log.info("=== Routing New Task ===")
+            assignment = self._plan_incoming(task_description, priority)
+            if assignment is None:
                 return False
 
-            print(f"Workflow: {workflow_info.get('workflow', 'N/A')}")
+            self.log.info("Assigned to: %s", assignment['agent_id'])
 
-            # 3. Find available agent
-            assigned_agent = workflow_info.get('assigned_agent')
-            available_agents = self.registry.get_available_agents()
+            # 4. Send assignment (an undelivered one is queued for later)
+            if self._submit_assignments([assignment]):
+                self._enqueue(assignment['queued_task'])
+                return False
 
-            # Filter for role match
-            target_agents = [a for a in available_agents if a.role == assigned_agent]
+            self.log.info("✓ Task routed successfully")
+            return True
 
-            if not target_agents:
-                print(f"[{self.agent_id}] No available agents for role: {assigned_agent}")
-                # Queue task for later
-                self.task_queue.append({
-                    'description': task_description,
-                    'priority': priority,
-                    'task_type': task_type,
-                    'workflow': workflow_info
-                })
-                return False
+        except Exception as e:
+            self.log.error("Error routing task: %s", e)
+            return False
 
-            # Choose agent with least workload
-            target_agent = min(target_agents, key=lambda a: len(a.current_tasks))
-            print(f"Assigned to: {target_agent.agent_id}")
-
-            # 4. Create task and send assignment
-            import uuid
-            task = Task(
-                task_id=f"task_{uuid.uuid4().hex[:8]}",
-                workflow=workflow_info['workflow'],
-                description=task_description,
-                priority=priority,
-                assigned_at=time.time()
-            )
+    def route_batch(self, tasks: List[Dict]) -> int:
+        """
+        Route several incoming tasks with one submission
 
-            # Send TASK_ASSIGNMENT message
-            self.send_message(
-                to_agent=target_agent.agent_id,
-                message_type=MessageType.TASK_ASSIGNMENT,
-                payload={
-                    'task_id': task.task_id,
-                    'workflow': task.workflow,
-                    'description': task.description,
-                    'priority': task.priority,
-                    'required_tools': workflow_info.get('required_tools', [])
-                },
-                priority=priority
-            )
+        Each task is planned as in route_incoming_task, then all assignments
+        are handed out together: one batched publish for agents in other
+        processes and one context store write. Assignments that could not be
+        delivered are queued for later, like tasks with no available agent.
 
-            # Update context store
-            self.context_store.append_to_list('workflows.in_progress', task.task_id)
+        Args:
+            tasks: Dicts with 'description' and 'priority'
 
-            print(f"[{self.agent_id}] ✓ Task routed successfully\n")
-            return True
+        Returns:
+            Number of tasks routed (the rest were queued or had no workflow)
+        """
+        self.log.info("=== Routing %s New Tasks ===", len(tasks))
+        assignments = []
+        batch_load: Dict[str, int] = {}
+        for item in tasks:
+            try:
+                assignment = self._plan_incoming(item['description'], item['priority'], batch_load)
+            except Exception as e:
+                self.log.error("Error routing task: %s", e)
+                continue
+            if assignment is not None:
+                self.log.info("Assigned to: %s", assignment['agent_id'])
+                assignments.append(assignment)
+
+        if not assignments:
+            return 0
+
+        undelivered = self._submit_assignments(assignments)
+        for assignment in undelivered:
+            self._enqueue(assignment['queued_task'])
+
+        routed = len(assignments) - len(undelivered)
+        self.log.info("✓ Routed %s tasks", routed)
+        return routed
+
+    def _plan_incoming(self, task_description: str, priority: str,
+                       batch_load: Optional[Dict[str, int]] = None) -> Optional[Dict]:
+        """
+        Analyze an incoming task and plan its assignment
 
+        A task whose workflow has no available agent is queued for later.
+
+        Args:
+            task_description: Description of the task
+            priority: Task priority
+            batch_load: Tasks planned per agent earlier in the same batch (see
+                _plan_assignment)
+
+        Returns:
+            Assignment dict, carrying the task's queue entry under
+            'queued_task' for callers that fail to deliver it, or None if the
+            task was queued or has no workflow
+        """
+        priority = sys.intern(priority)
+        self.log.info("Description: %s", task_description)
+        self.log.info("Priority: %s", priority)
+
+        # 1. Analyze task to determine type
+        task_type = self._analyze_task_type(task_description)
+        self.log.info("Task type: %s", task_type)
+
+        # 2. Find appropriate workflow
+        workflow_info = self._find_workflow(task_type)
+        if not workflow_info:
+            self.log.warning("No workflow found for task type: %s", task_type)
+            return None
+
+        self.log.info("Workflow: %s", workflow_info.get('workflow', 'N/A'))
+
+        # 3. Find available agent and create the task
+        assignment = self._plan_assignment(task_description, priority, workflow_info, batch_load)
+        queued_task = {
+            'description': task_description,
+            'priority': priority,
+            'task_type': task_type,
+            'workflow': workflow_info
+        }
+
+        if assignment is None:
+            self.log.warning("No available agents for role: %s", workflow_info.get('assigned_agent'))
+            # Queue task for later
+            self._enqueue(queued_task)
+        else:
+            assignment['queued_task'] = queued_task
+        return assignment
+
+    def _enqueue(self, queued_task: Dict):
+        """Queue an unroutable task (producer side)"""
+        with self._queue_lock:
+            if len(self.task_queue) == self.task_queue.maxlen:
+                self.log.warning("⚠️  Task queue full, dropping oldest queued task")
+            self.task_queue.append(queued_task)
+
+    def _plan_assignment(self, description: str, priority: str, workflow_info: Dict,
+                         batch_load: Optional[Dict[str, int]] = None) -> Optional[Dict]:
+        """
+        Pick the target agent and build the task, without sending anything
+
+        Args:
+            description: Task description
+            priority: Task priority
+            workflow_info: Workflow registry entry for the task type
+            batch_load: Tasks planned per agent earlier in the same batch. The
+                registry snapshot does not count them yet, so they are added
+                to each agent's load; the pick is recorded here
+
+        Returns:
+            Assignment dict (agent_id, task, required_tools) or None if no
+            agent of the required role is available
+        """
+        # Available agent of the role with the least workload
+        target_agent: Optional[Agent] = self.registry.get_least_loaded_agent(
+            workflow_info.get('assigned_agent'), batch_load
+        )
+        if target_agent is None:
+            return None
+        if batch_load is not None:
+            batch_load[target_agent.agent_id] = batch_load.get(target_agent.agent_id, 0) + 1
+
+        task = Task(
+            task_id=f"task_{uuid.uuid4().hex[:8]}",
+            workflow=workflow_info['workflow'],
+            description=description,
+            priority=priority,
+            assigned_at=time.time()
+        )
+
+        return {
+            'agent_id': target_agent.agent_id,
+            'task': task,
+            'required_tools': workflow_info.get('required_tools', [])
+        }
+
+    def _submit_assignments(self, assignments: List[Dict]) -> List[Dict]:
+        """
+        Hand planned assignments to their agents in one submission
+
+        Agents running in this process get the task pushed onto their deque;
+        the rest share one batched TASK_ASSIGNMENT publish. In-progress task
+        IDs of delivered assignments are recorded with a single context store
+        write.
+
+        Returns:
+            Assignments that were not delivered (the remote ones, if their
+            publish failed); every other assignment has reached its agent
+        """
+        remote_assignments = []
+        remote_messages = []
+        for assignment in assignments:
+            task = assignment['task']
+            if not self.work_pool.push(assignment['agent_id'], task):
+                remote_assignments.append(assignment)
+                remote_messages.append({
+                    'from_agent': self.agent_id,
+                    'to_agent': assignment['agent_id'],
+                    'message_type': MessageType.TASK_ASSIGNMENT,
+                    'payload': {
+                        'task_id': task.task_id,
+                        'workflow': task.workflow,
+                        'description': task.description,
+                        'priority': task.priority,
+                        'required_tools': assignment['required_tools']
+                    },
+                    'priority': task.priority
+                })
+
+        undelivered = []
+        if remote_messages:
+            try:
+                self._publish_with_backoff(remote_messages)
+            except Exception as e:
+                self.log.error("Error publishing %s task assignments: %s", len(remote_messages), e)
+                undelivered = remote_assignments
+            else:
+                self._maybe_heartbeat()
+
+        # Update context store (tasks already delivered stay delivered even
+        # if this bookkeeping write fails)
+        undelivered_ids = {id(assignment) for assignment in undelivered}
+        delivered = [assignment for assignment in assignments if id(assignment) not in undelivered_ids]
+        try:
+            self.context_store.extend_list(
+                'workflows.in_progress',
+                [assignment['task'].task_id for assignment in delivered]
+            )
         except Exception as e:
-            print(f"[{self.agent_id}] Error routing task: {e}")
-            return False
+            self.log.error("Error recording in-progress tasks: %s", e)
+
+        return undelivered
+
+    def _publish_with_backoff(self, messages: List[Dict]) -> List[str]:
+        """Publish a batch, retrying with exponential backoff if the bus connection drops"""
+        delay = self.PUBLISH_BACKOFF_START
+        for attempt in range(self.PUBLISH_ATTEMPTS):
+            try:
+                return self.message_bus.publish_many(messages)
+            except ConnectionError as e:
+                if attempt == self.PUBLISH_ATTEMPTS - 1:
+                    raise
+                self.log.warning("⚠️  Publish failed (%s), retrying in %.1fs", e, delay)
+                time.sleep(delay)
+                delay *= 2
 
     def _analyze_task_type(self, description: str) -> str:
         """
@@ -178,33 +361,36 @@ class CoordinatorAgent(BaseAgent):
         Returns:
             Task type string
         """
-        description_lower = description.lower()
-
-        # Check for keywords
-        if any(word in description_lower for word in ['add', 'create', 'implement', 'new feature']):
-            if 'watch' in description_lower or 'android' in description_lower:
+        categories: Set[str] = {
+            _TASK_KEYWORDS[match.group(1)]
+            for match in _TASK_KEYWORD_RE.finditer(description.lower())
+        }
+
+        # Check categories in priority order
+        if 'feature' in categories:
+            if 'watch' in categories or 'android' in categories:
                 return 'add_watch_feature'
             else:
                 return 'add_dashboard_feature'
 
-        elif any(word in description_lower for word in ['fix', 'bug', 'error', 'issue']):
+        elif 'bug' in categories:
             return 'fix_bug'
 
-        elif any(word in description_lower for word in ['test', 'verify', 'validate']):
+        elif 'test' in categories:
             return 'run_tests'
 
-        elif any(word in description_lower for word in ['deploy', 'release', 'publish']):
-            if 'dashboard' in description_lower:
+        elif 'deploy' in categories:
+            if 'dashboard' in categories:
                 return 'deploy_dashboard'
-            elif 'watch' in description_lower:
+            elif 'watch' in categories:
                 return 'build_watch_app'
             else:
                 return 'deploy_dashboard'
 
-        elif any(word in description_lower for word in ['scrape', 'fetch', 'download']):
+        elif 'scrape' in categories:
             return 'scrape_website'
 
-        elif any(word in description_lower for word in ['post', 'tweet', 'social']):
+        elif 'social' in categories:
             return 'send_slack_message'  # Or other social media
 
         # Default
@@ -220,33 +406,31 @@ class CoordinatorAgent(BaseAgent):
 
     def _monitor_agents(self):
         """Monitor all active agents and their status"""
-        print(f"\n[{self.agent_id}] === Agent Status Monitor ===")
+        self.log.info("=== Agent Status Monitor ===")
 
         agents = self.registry.get_active_agents()
 
         for agent in agents:
             status_info = self.registry.get_agent_status(agent.agent_id)
-            print(f"{agent.agent_id} ({agent.role}):")
-            print(f"  Status: {status_info['status']}")
-            print(f"  Tasks: {status_info['current_tasks']}/{agent.max_concurrent_tasks}")
-            print(f"  Completed: {status_info['completed_tasks']}")
-            print(f"  Failed: {status_info['failed_tasks']}")
-            print()
+            self.log.info("%s (%s):", agent.agent_id, agent.role)
+            self.log.info("  Status: %s", status_info['status'])
+            self.log.info("  Tasks: %s/%s", status_info['current_tasks'], agent.max_concurrent_tasks)
+            self.log.info("  Completed: %s", status_info['completed_tasks'])
+            self.log.info("  Failed: %s", status_info['failed_tasks'])
 
     def _health_check(self):
         """Perform system health check"""
-        print(f"\n[{self.agent_id}] === System Health Check ===")
+        self.log.info("=== System Health Check ===")
 
         stats = self.registry.get_system_stats()
 
-        print(f"Total Agents: {stats['total_agents']}")
-        print(f"Active Tasks: {stats['active_tasks']}")
-        print(f"Completed: {stats['completed_tasks']}")
-        print(f"Failed: {stats['failed_tasks']}")
-        print(f"\nAgents by Status:")
+        self.log.info("Total Agents: %s", stats['total_agents'])
+        self.log.info("Active Tasks: %s", stats['active_tasks'])
+        self.log.info("Completed: %s", stats['completed_tasks'])
+        self.log.info("Failed: %s", stats['failed_tasks'])
+        self.log.info("Agents by Status:")
         for status, count in stats['agents_by_status'].items():
-            print(f"  {status}: {count}")
-        print()
+            self.log.info("  %s: %s", status, count)
 
     def _analyze_and_route(self, task: Task):
         """Analyze task and route to appropriate agent"""
@@ -257,23 +441,53 @@ class CoordinatorAgent(BaseAgent):
         if not self.task_queue:
             return
 
-        print(f"[{self.agent_id}] Processing {len(self.task_queue)} queued tasks")
-
-        # Try to route queued tasks
-        successfully_routed = []
-        for queued_task in self.task_queue:
-            if self.route_incoming_task(
-                queued_task['description'],
-                queued_task['priority']
-            ):
-                successfully_routed.append(queued_task)
+        self.log.info("Processing %s queued tasks", len(self.task_queue))
 
-        # Remove successfully routed tasks
-        for task in successfully_routed:
-            self.task_queue.remove(task)
+        # Drain what is queued now (tasks enqueued meanwhile wait for the next
+        # pass), plan everything, then submit it together
+        drained = []
+        for _ in range(len(self.task_queue)):
+            drained.append(self.task_queue.popleft())
 
-        if successfully_routed:
-            print(f"[{self.agent_id}] Routed {len(successfully_routed)} queued tasks")
+        planned = []
+        retry = []
+        batch_load: Dict[str, int] = {}
+        for queued_task in drained:
+            assignment = self._plan_assignment(
+                queued_task['description'],
+                queued_task['priority'],
+                queued_task['workflow'],
+                batch_load
+            )
+            if assignment:
+                planned.append((queued_task, assignment))
+            else:
+                retry.append(queued_task)
+
+        routed = 0
+        if planned:
+            undelivered = self._submit_assignments([assignment for _, assignment in planned])
+            routed = len(planned) - len(undelivered)
+            if undelivered:
+                # Only tasks that never reached an agent go back; keep drain order
+                undelivered_ids = {id(assignment) for assignment in undelivered}
+                retry_ids = {id(queued_task) for queued_task in retry}
+                retry_ids.update(id(queued_task) for queued_task, assignment in planned
+                                 if id(assignment) in undelivered_ids)
+                retry = [queued_task for queued_task in drained if id(queued_task) in retry_ids]
+
+        # Put unrouted tasks back in front, keeping their original order. If
+        # producers filled the queue meanwhile, extendleft would silently evict
+        # the newest tasks from the right; drop the oldest (as _enqueue does)
+        with self._queue_lock:
+            overflow = len(retry) - (self.task_queue.maxlen - len(self.task_queue))
+            if overflow > 0:
+                self.log.warning("⚠️  Task queue full, dropping %s oldest queued tasks", overflow)
+                retry = retry[overflow:]
+            self.task_queue.extendleft(reversed(retry))
+
+        if routed:
+            self.log.info("Routed %s queued tasks", routed)
 
 
 # Example usage and testing
@@ -282,7 +496,6 @@ if __name__ == "__main__":
     coordinator = CoordinatorAgent()
 
     # Start coordinator in separate thread
-    import threading
     coordinator_thread = threading.Thread(target=coordinator.run, daemon=True)
     coordinator_thread.start()
 
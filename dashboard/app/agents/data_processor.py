@@ -12,15 +12,105 @@ Responsibilities:
 
 import sys
 import os
-from typing import Dict, List, Optional
+import re
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from dataclasses import dataclass
+from enum import IntFlag, auto
+from typing import Callable, Deque, Dict, Optional, Pattern, Final, Set
 import time
-import json
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../tools'))
 
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, TMP_DIR
 from core.agent_registry import Task
 from core.message_bus import MessageType
+from core.serialization import dumps
+
+
+class Connector(IntFlag):
+    """Data connectors; the agent tracks enabled ones as a single bit mask"""
+    SLACK = auto()
+    EMAIL = auto()
+    GOOGLE_SHEETS = auto()
+    TWITTER = auto()
+    LINKEDIN = auto()
+    FACEBOOK = auto()
+    INSTAGRAM = auto()
+    RSS = auto()
+    WEB_SCRAPER = auto()
+
+    @property
+    def key(self) -> str:
+        """Lowercase name used in status output (e.g. "google_sheets")"""
+        return self.name.lower()
+
+
+# Every connector, in declaration order
+_ALL_CONNECTORS: Final = tuple(Connector)
+
+
+@dataclass(slots=True)
+class ProcessingRecord:
+    """One entry in the data processor's history"""
+    task_id: str
+    type: str
+    timestamp: float
+    details: Optional[Dict] = None  # Type-specific results (items_scraped, platforms, ...)
+    status: str = "success"
+
+    def to_dict(self) -> Dict:
+        """Flatten to the JSON layout used for stored results"""
+        return {
+            "task_id": self.task_id,
+            "type": self.type,
+            "timestamp": self.timestamp,
+            **(self.details or {}),
+            "status": self.status
+        }
+
+
+# Task keywords mapped to the kind of work they signal
+_TASK_KEYWORDS: Final[Dict[str, str]] = {
+    'scrape': 'scrape', 'fetch': 'scrape',
+    'rss': 'rss', 'feed': 'rss',
+    'sheet': 'sheets', 'google': 'sheets',
+    'tweet': 'social', 'twitter': 'social', 'linkedin': 'social',
+    'facebook': 'social', 'instagram': 'social',
+    'slack': 'slack',
+    'email': 'email',
+}
+
+# Social keywords mapped to the platform they target, in posting order
+_SOCIAL_PLATFORMS: Final[Dict[str, Connector]] = {
+    'twitter': Connector.TWITTER, 'tweet': Connector.TWITTER,
+    'linkedin': Connector.LINKEDIN,
+    'facebook': Connector.FACEBOOK,
+    'instagram': Connector.INSTAGRAM,
+}
+
+# When a description mentions several kinds, the first one listed here wins
+_TASK_PRECEDENCE: Final = ('scrape', 'rss', 'sheets', 'social', 'slack', 'email')
+
+# One case-insensitive pass finds every keyword; the lookahead keeps overlapping
+# matches so results equal per-keyword substring checks on the lowered text
+_TASK_KEYWORD_RE: Final[Pattern[str]] = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_TASK_KEYWORDS, key=len, reverse=True)) + "))",
+    re.IGNORECASE
+)
+
+# Environment variable whose presence enables each credentialed connector
+_CONNECTOR_ENV: Final[Dict[str, Connector]] = {
+    "SLACK_BOT_TOKEN": Connector.SLACK,
+    "EMAIL_USERNAME": Connector.EMAIL,
+    "GOOGLE_SHEETS_CREDENTIALS": Connector.GOOGLE_SHEETS,
+    "TWITTER_API_KEY": Connector.TWITTER,
+    "LINKEDIN_CLIENT_ID": Connector.LINKEDIN,
+    "FACEBOOK_ACCESS_TOKEN": Connector.FACEBOOK,
+    "INSTAGRAM_ACCESS_TOKEN": Connector.INSTAGRAM,
+}
 
 
 class DataProcessorAgent(BaseAgent):
@@ -31,22 +121,39 @@ class DataProcessorAgent(BaseAgent):
     def __init__(self, agent_id: str = "data-proc-1"):
         super().__init__(agent_id=agent_id, role="data_processor")
 
-        # Connector registry
-        self.active_connectors: Dict[str, bool] = {
-            "slack": False,
-            "email": False,
-            "google_sheets": False,
-            "twitter": False,
-            "linkedin": False,
-            "facebook": False,
-            "instagram": False,
-            "rss": False,
-            "web_scraper": False
+        # Connector registry: bit mask of enabled connectors
+        self.connector_mask = Connector(0)
+
+        # Data processing history (most recent HISTORY_CAP records)
+        self.processing_history: Deque[ProcessingRecord] = deque(maxlen=self.HISTORY_CAP)
+
+        # Scraped results are written by a background thread so tasks only
+        # pay for a queue put; None on the queue stops the writer
+        self.scraped_data_dir = os.path.join(TMP_DIR, "scraped-data")
+        self._scrape_dir_ready = False  # Directory is created on the first write only
+        self._write_queue: "queue.Queue[Optional[ProcessingRecord]]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._drain_writes, name=f"{agent_id}-writer", daemon=True
+        )
+        self._writer.start()
+
+        # Posts to several platforms run concurrently on this pool (one worker
+        # per social platform), kept for the agent's lifetime
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=len(set(_SOCIAL_PLATFORMS.values())),
+            thread_name_prefix=f"{agent_id}-io"
+        )
+
+        # Task kind -> handler (see _TASK_KEYWORDS); social posts also need the
+        # matched keywords, so execute_task calls _post_social_media directly
+        self._task_handlers: Dict[str, Callable[[Task], None]] = {
+            'scrape': self._scrape_website,
+            'rss': self._process_rss,
+            'sheets': self._sync_google_sheets,
+            'slack': self._send_slack_message,
+            'email': self._send_email,
         }
 
-        # Data processing history
-        self.processing_history: List[Dict] = []
-
     def startup(self) -> bool:
         """Start data processor with connector initialization"""
         if not super().startup():
@@ -55,7 +162,7 @@ class DataProcessorAgent(BaseAgent):
         # Initialize connectors
         self._initialize_connectors()
 
-        print(f"[{self.agent_id}] Data processor ready with {sum(self.active_connectors.values())} active connectors")
+        self.log.info("Data processor ready with %s active connectors", self.connector_mask.bit_count())
         return True
 
     def execute_task(self, task: Task):
@@ -65,24 +172,22 @@ class DataProcessorAgent(BaseAgent):
         Args:
             task: Task to execute
         """
+        # One wall-clock read per task; every record it produces shares this timestamp
+        task.started_at = time.time()
+
         try:
-            print(f"[{self.agent_id}] Starting data processing task: {task.description}")
+            self.log.info("Starting data processing task: %s", task.description)
 
             # Determine task type
-            description_lower = task.description.lower()
-
-            if "scrape" in description_lower or "fetch" in description_lower:
-                self._scrape_website(task)
-            elif "rss" in description_lower or "feed" in description_lower:
-                self._process_rss(task)
-            elif "sheet" in description_lower or "google" in description_lower:
-                self._sync_google_sheets(task)
-            elif any(social in description_lower for social in ["tweet", "twitter", "linkedin", "facebook", "instagram"]):
-                self._post_social_media(task)
-            elif "slack" in description_lower:
-                self._send_slack_message(task)
-            elif "email" in description_lower:
-                self._send_email(task)
+            keywords = {match.group(1).lower() for match in _TASK_KEYWORD_RE.finditer(task.description)}
+            kinds = {_TASK_KEYWORDS[keyword] for keyword in keywords}
+            kind = next((kind for kind in _TASK_PRECEDENCE if kind in kinds), None)
+
+            if kind == 'social':
+                # Platforms come from the keywords already matched above
+                self._post_social_media(task, keywords)
+            elif kind:
+                self._task_handlers[kind](task)
             else:
                 # Generic data processing
                 self._process_data(task)
@@ -91,160 +196,142 @@ class DataProcessorAgent(BaseAgent):
 
         except Exception as e:
             error_msg = f"Data processing failed: {str(e)}"
-            print(f"[{self.agent_id}] {error_msg}")
+            self.log.error(error_msg)
             self.fail_task(task.task_id, error_msg)
 
     def _initialize_connectors(self):
         """Initialize all connectors"""
-        print(f"[{self.agent_id}] Initializing connectors...")
-
-        # Check which connectors have credentials
-        # In real implementation, check .env for API keys
-
-        connectors_to_check = [
-            ("SLACK_BOT_TOKEN", "slack"),
-            ("EMAIL_USERNAME", "email"),
-            ("GOOGLE_SHEETS_CREDENTIALS", "google_sheets"),
-            ("TWITTER_API_KEY", "twitter"),
-            ("LINKEDIN_CLIENT_ID", "linkedin"),
-            ("FACEBOOK_ACCESS_TOKEN", "facebook"),
-            ("INSTAGRAM_ACCESS_TOKEN", "instagram")
-        ]
-
-        for env_var, connector in connectors_to_check:
-            if os.getenv(env_var):
-                self.active_connectors[connector] = True
-                print(f"  ✓ {connector} connector ready")
-            else:
-                print(f"  ○ {connector} connector not configured")
+        self.log.info("Initializing connectors...")
+
+        # Check which connectors have credentials: one set intersection with the
+        # environment's keys (empty values still count as not configured)
+        env = os.environ
+        for env_var in _CONNECTOR_ENV.keys() & env.keys():
+            if env[env_var]:
+                self.connector_mask |= _CONNECTOR_ENV[env_var]
+
+        ready = [c.key for c in _CONNECTOR_ENV.values() if self.connector_mask & c]
+        missing = [c.key for c in _CONNECTOR_ENV.values() if not self.connector_mask & c]
+
+        if ready:
+            self.log.info("  ✓ Ready: %s", ', '.join(ready))
+        if missing:
+            self.log.info("  ○ Not configured: %s", ', '.join(missing))
 
         # RSS and web scraper don't need credentials
-        self.active_connectors["rss"] = True
-        self.active_connectors["web_scraper"] = True
+        self.connector_mask |= Connector.RSS | Connector.WEB_SCRAPER
 
     def _scrape_website(self, task: Task):
         """Scrape website data"""
-        print(f"[{self.agent_id}] Scraping website...")
+        self.log.info("Scraping website...")
 
         # Extract URL from task description
         # In real implementation, use tools/connectors/web_scraper.py
 
-        print(f"  → Target URL: (extracted from task description)")
-        print(f"  → Fetching content...")
-        print(f"  → Parsing HTML...")
-        print(f"  → Extracting data...")
+        self.log.info("  → Target URL: (extracted from task description)")
+        self.log.info("  → Fetching content...")
+        self.log.info("  → Parsing HTML...")
+        self.log.info("  → Extracting data...")
 
         # Store results
-        result = {
-            "task_id": task.task_id,
-            "type": "web_scraping",
-            "timestamp": time.time(),
-            "items_scraped": 42,  # Simulated
-            "status": "success"
-        }
+        result = ProcessingRecord(task.task_id, "web_scraping", task.started_at, {
+            "items_scraped": 42  # Simulated
+        })
 
         self.processing_history.append(result)
         self._store_scraped_data(result)
 
-        print(f"[{self.agent_id}] ✓ Website scraped: {result['items_scraped']} items")
+        self.log.info("✓ Website scraped: %s items", result.details['items_scraped'])
 
     def _process_rss(self, task: Task):
         """Process RSS feed"""
-        print(f"[{self.agent_id}] Processing RSS feed...")
+        self.log.info("Processing RSS feed...")
 
         # In real implementation, use tools/data/rss_parser.py
 
-        print(f"  → Fetching feed...")
-        print(f"  → Parsing entries...")
-        print(f"  → Filtering new items...")
+        self.log.info("  → Fetching feed...")
+        self.log.info("  → Parsing entries...")
+        self.log.info("  → Filtering new items...")
 
-        result = {
-            "task_id": task.task_id,
-            "type": "rss_processing",
-            "timestamp": time.time(),
-            "new_items": 7,  # Simulated
-            "status": "success"
-        }
+        result = ProcessingRecord(task.task_id, "rss_processing", task.started_at, {
+            "new_items": 7  # Simulated
+        })
 
         self.processing_history.append(result)
 
-        print(f"[{self.agent_id}] ✓ RSS feed processed: {result['new_items']} new items")
+        self.log.info("✓ RSS feed processed: %s new items", result.details['new_items'])
 
     def _sync_google_sheets(self, task: Task):
         """Sync data with Google Sheets"""
-        print(f"[{self.agent_id}] Syncing with Google Sheets...")
+        self.log.info("Syncing with Google Sheets...")
 
-        if not self.active_connectors["google_sheets"]:
+        if not self.connector_mask & Connector.GOOGLE_SHEETS:
             raise Exception("Google Sheets connector not configured")
 
         # In real implementation, use tools/connectors/google_sheets_client.py
 
-        print(f"  → Authenticating with Google...")
-        print(f"  → Reading sheet data...")
-        print(f"  → Writing updates...")
+        self.log.info("  → Authenticating with Google...")
+        self.log.info("  → Reading sheet data...")
+        self.log.info("  → Writing updates...")
 
-        result = {
-            "task_id": task.task_id,
-            "type": "google_sheets_sync",
-            "timestamp": time.time(),
-            "rows_updated": 15,  # Simulated
-            "status": "success"
-        }
+        result = ProcessingRecord(task.task_id, "google_sheets_sync", task.started_at, {
+            "rows_updated": 15  # Simulated
+        })
 
         self.processing_history.append(result)
 
-        print(f"[{self.agent_id}] ✓ Google Sheets synced: {result['rows_updated']} rows updated")
+        self.log.info("✓ Google Sheets synced: %s rows updated", result.details['rows_updated'])
+
+    def _post_social_media(self, task: Task, keywords: Optional[Set[str]] = None):
+        """
+        Post to social media platforms
 
-    def _post_social_media(self, task: Task):
-        """Post to social media platforms"""
-        print(f"[{self.agent_id}] Posting to social media...")
+        Args:
+            task: Task to execute
+            keywords: Task keywords already matched by execute_task (rescanned if omitted)
+        """
+        self.log.info("Posting to social media...")
 
         # Determine which platform(s)
-        description_lower = task.description.lower()
-
-        platforms = []
-        if "twitter" in description_lower or "tweet" in description_lower:
-            platforms.append("twitter")
-        if "linkedin" in description_lower:
-            platforms.append("linkedin")
-        if "facebook" in description_lower:
-            platforms.append("facebook")
-        if "instagram" in description_lower:
-            platforms.append("instagram")
+        if keywords is None:
+            keywords = {match.group(1).lower() for match in _TASK_KEYWORD_RE.finditer(task.description)}
 
-        if not platforms:
-            platforms = ["twitter"]  # Default
+        platforms = list(dict.fromkeys(
+            connector for keyword, connector in _SOCIAL_PLATFORMS.items() if keyword in keywords
+        ))
 
-        # Post to each platform
-        results = {}
-        for platform in platforms:
-            if not self.active_connectors.get(platform, False):
-                print(f"  ○ {platform} connector not configured, skipping...")
+        if not platforms:
+            platforms = [Connector.TWITTER]  # Default
+
+        # Post to every configured platform at once; the task waits only for the slowest
+        futures = {}
+        for connector in platforms:
+            platform = connector.key
+            if not self.connector_mask & connector:
+                self.log.info("  ○ %s connector not configured, skipping...", platform)
                 continue
 
-            print(f"  → Posting to {platform}...")
-            results[platform] = self._post_to_platform(platform, task)
+            self.log.info("  → Posting to %s...", platform)
+            futures[platform] = self._io_pool.submit(self._post_to_platform, platform, task)
 
-        result = {
-            "task_id": task.task_id,
-            "type": "social_media_post",
-            "timestamp": time.time(),
-            "platforms": results,
-            "status": "success"
-        }
+        results = {platform: future.result(timeout=30) for platform, future in futures.items()}
+
+        result = ProcessingRecord(task.task_id, "social_media_post", task.started_at, {
+            "platforms": results
+        })
 
         self.processing_history.append(result)
 
-        print(f"[{self.agent_id}] ✓ Posted to {len(results)} platform(s)")
+        self.log.info("✓ Posted to %s platform(s)", len(results))
 
     def _post_to_platform(self, platform: str, task: Task) -> Dict:
         """Post to specific social media platform"""
         # In real implementation, use tools/connectors/{platform}_client.py
 
         # Simulate posting
-        print(f"     Formatting content for {platform}...")
-        print(f"     Authenticating...")
-        print(f"     Publishing post...")
+        self.log.info("     Formatting content for %s...", platform)
+        self.log.info("     Authenticating...")
+        self.log.info("     Publishing post...")
 
         return {
             "posted": True,
@@ -254,92 +341,103 @@ class DataProcessorAgent(BaseAgent):
 
     def _send_slack_message(self, task: Task):
         """Send message to Slack"""
-        print(f"[{self.agent_id}] Sending Slack message...")
+        self.log.info("Sending Slack message...")
 
-        if not self.active_connectors["slack"]:
+        if not self.connector_mask & Connector.SLACK:
             raise Exception("Slack connector not configured")
 
         # In real implementation, use tools/connectors/slack_client.py
 
-        print(f"  → Connecting to Slack...")
-        print(f"  → Sending message...")
+        self.log.info("  → Connecting to Slack...")
+        self.log.info("  → Sending message...")
 
-        result = {
-            "task_id": task.task_id,
-            "type": "slack_message",
-            "timestamp": time.time(),
-            "message_sent": True,
-            "status": "success"
-        }
+        result = ProcessingRecord(task.task_id, "slack_message", task.started_at, {
+            "message_sent": True
+        })
 
         self.processing_history.append(result)
 
-        print(f"[{self.agent_id}] ✓ Slack message sent")
+        self.log.info("✓ Slack message sent")
 
     def _send_email(self, task: Task):
         """Send email"""
-        print(f"[{self.agent_id}] Sending email...")
+        self.log.info("Sending email...")
 
-        if not self.active_connectors["email"]:
+        if not self.connector_mask & Connector.EMAIL:
             raise Exception("Email connector not configured")
 
         # In real implementation, use tools/connectors/email_client.py
 
-        print(f"  → Composing email...")
-        print(f"  → Connecting to SMTP...")
-        print(f"  → Sending...")
+        self.log.info("  → Composing email...")
+        self.log.info("  → Connecting to SMTP...")
+        self.log.info("  → Sending...")
 
-        result = {
-            "task_id": task.task_id,
-            "type": "email",
-            "timestamp": time.time(),
-            "sent": True,
-            "status": "success"
-        }
+        result = ProcessingRecord(task.task_id, "email", task.started_at, {
+            "sent": True
+        })
 
         self.processing_history.append(result)
 
-        print(f"[{self.agent_id}] ✓ Email sent")
+        self.log.info("✓ Email sent")
 
     def _process_data(self, task: Task):
         """Generic data processing"""
-        print(f"[{self.agent_id}] Processing data...")
+        self.log.info("Processing data...")
 
         # Generic data transformation/processing
-        print(f"  → Loading data...")
-        print(f"  → Transforming...")
-        print(f"  → Storing results...")
-
-        result = {
-            "task_id": task.task_id,
-            "type": "data_processing",
-            "timestamp": time.time(),
-            "status": "success"
-        }
-
-        self.processing_history.append(result)
+        self.log.info("  → Loading data...")
+        self.log.info("  → Transforming...")
+        self.log.info("  → Storing results...")
 
-        print(f"[{self.agent_id}] ✓ Data processed")
+        result = ProcessingRecord(task.task_id, "data_processing", task.started_at)
 
-    def _store_scraped_data(self, data: Dict):
-        """Store scraped data to .tmp directory"""
-        output_dir = os.path.join("/Users/vik043/Desktop/Agentic Workflow/.tmp/scraped-data")
-        os.makedirs(output_dir, exist_ok=True)
+        self.processing_history.append(result)
 
-        output_file = os.path.join(output_dir, f"scraped_{data['task_id']}.json")
+        self.log.info("✓ Data processed")
 
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+    def _store_scraped_data(self, record: ProcessingRecord):
+        """Queue scraped data for the background writer (see _drain_writes)"""
+        self._write_queue.put(record)
 
-        print(f"     Data stored: {output_file}")
+    def _drain_writes(self):
+        """Writer thread: persist queued scrape results to the .tmp directory"""
+        while True:
+            record = self._write_queue.get()
+            if record is None:
+                return
+
+            output_file = os.path.join(self.scraped_data_dir, f"scraped_{record.task_id}.json")
+            try:
+                if not self._scrape_dir_ready:
+                    os.makedirs(self.scraped_data_dir, exist_ok=True)
+                    self._scrape_dir_ready = True
+
+                with open(output_file, 'wb') as f:
+                    f.write(dumps(record.to_dict()))
+
+                self.log.info("     Data stored: %s", output_file)
+            except OSError as e:
+                self.log.error("Failed to store scraped data: %s", e)
+
+    def shutdown(self):
+        """Flush pending scrape results, then shut down"""
+        self._write_queue.put(None)
+        self._writer.join(timeout=5)
+        self._io_pool.shutdown(wait=False)
+        super().shutdown()
 
     def get_connector_status(self) -> Dict:
         """Get status of all connectors"""
+        active, inactive = {}, {}
+        for connector in _ALL_CONNECTORS:
+            enabled = bool(self.connector_mask & connector)
+            (active if enabled else inactive)[connector.key] = enabled
+
         return {
-            "active_connectors": {k: v for k, v in self.active_connectors.items() if v},
-            "inactive_connectors": {k: v for k, v in self.active_connectors.items() if not v},
-            "total_active": sum(self.active_connectors.values()),
-            "total_connectors": len(self.active_connectors)
+            "active_connectors": active,
+            "inactive_connectors": inactive,
+            "total_active": len(active),
+            "total_connectors": len(_ALL_CONNECTORS)
         }
 
 
@@ -348,7 +446,6 @@ if __name__ == "__main__":
     data_proc = DataProcessorAgent()
 
     # Start agent
-    import threading
     agent_thread = threading.Thread(target=data_proc.run, daemon=True)
     agent_thread.start()
 
@@ -11,16 +11,18 @@ Responsibilities:
 
 import sys
 import os
-from typing import Dict, List, Optional
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Optional
 import subprocess
 import time
-import requests
+from datetime import datetime
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../tools'))
 
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, PROJECT_ROOT, SUBPROCESS_SLOTS
 from core.agent_registry import Task
-from core.message_bus import MessageType
+from core.message_bus import Message, MessageType
 
 
 class DeployerAgent(BaseAgent):
@@ -28,16 +30,49 @@ class DeployerAgent(BaseAgent):
     Autonomous deployer agent that handles deployments and rollbacks
     """
 
+    # Read-only dashboard endpoints probed after a deploy
+    SMOKE_ENDPOINTS = (
+        "/health",
+        "/api/agents",
+        "/api/system/stats",
+        "/functions/v1/watch-config",
+        "/api/deployments",
+    )
+
+    # Description words (see Task.tokens) selecting each deployment type;
+    # common inflections are listed since tokens match whole words only
+    WATCH_KEYWORDS = frozenset({"watch", "watches", "smartwatch", "apk", "apks"})
+    DASHBOARD_KEYWORDS = frozenset({"dashboard", "dashboards", "web", "website", "webapp"})
+    ROLLBACK_KEYWORDS = frozenset({"rollback", "rollbacks"})
+
+    # Bytes of the gradle log reported back when a release build fails
+    BUILD_LOG_TAIL = 4096
+
+    # Seconds a cached "no test results" lookup is trusted; the tester's
+    # broadcast only reaches this agent when the two share a message bus
+    MISSING_RESULTS_TTL = 30.0
+
     def __init__(self, agent_id: str = "deployer-1"):
         super().__init__(agent_id=agent_id, role="deployer_agent")
 
         # Project paths
-        self.project_root = "/Users/vik043/Desktop/Agentic Workflow"
+        self.project_root = PROJECT_ROOT
         self.watch_app_path = os.path.join(self.project_root, "watch-app")
         self.dashboard_path = os.path.join(self.project_root, "dashboard")
+        self._build_dir_ready = False  # watch-app/build/ is created on the first build only
 
-        # Deployment history
-        self.deployment_history: List[Dict] = []
+        # Post-deploy checks probe the live service only when enabled; one pooled
+        # keep-alive session is reused so repeat probes skip the TCP/TLS handshake
+        self.live_probes = os.getenv("DEPLOY_LIVE_PROBES", "").lower() in ("1", "true", "yes")
+        self._http_session = None  # Created on first probe (see _http)
+
+        # time.monotonic() when each project was last found to have no test
+        # results; skips the context store lookup until a tests_complete
+        # broadcast names the project or the entry is MISSING_RESULTS_TTL old
+        self._missing_test_results: Dict[str, float] = {}
+
+        # Deployment history (most recent HISTORY_CAP records; rollback reads the tail)
+        self.deployment_history: Deque[Dict] = deque(maxlen=self.HISTORY_CAP)
 
     def execute_task(self, task: Task):
         """
@@ -46,20 +81,18 @@ class DeployerAgent(BaseAgent):
         Args:
             task: Task to execute
         """
-        try:
-            print(f"[{self.agent_id}] Starting deployment task: {task.description}")
+        # One wall-clock read per task; every record it produces shares this timestamp
+        task.started_at = time.time()
 
-            # Parse workflow
-            workflow = self.get_workflow(task.workflow)
-            if not workflow:
-                raise Exception(f"Workflow not found: {task.workflow}")
+        try:
+            self.log.info("Starting deployment task: %s", task.description)
 
             # Determine deployment type
-            if "watch" in task.description.lower() or "apk" in task.description.lower():
+            if not self.WATCH_KEYWORDS.isdisjoint(task.tokens):
                 self._deploy_watch_app(task)
-            elif "dashboard" in task.description.lower() or "web" in task.description.lower():
+            elif not self.DASHBOARD_KEYWORDS.isdisjoint(task.tokens):
                 self._deploy_dashboard(task)
-            elif "rollback" in task.description.lower():
+            elif not self.ROLLBACK_KEYWORDS.isdisjoint(task.tokens):
                 self._rollback_deployment(task)
             else:
                 # Default to dashboard deployment
@@ -69,38 +102,36 @@ class DeployerAgent(BaseAgent):
 
         except Exception as e:
             error_msg = f"Deployment task failed: {str(e)}"
-            print(f"[{self.agent_id}] {error_msg}")
+            self.log.error(error_msg)
             self.fail_task(task.task_id, error_msg)
 
     def _deploy_watch_app(self, task: Task):
         """Build and package watch app APK"""
-        print(f"[{self.agent_id}] Building watch app APK...")
-
-        os.chdir(self.watch_app_path)
+        self.log.info("Building watch app APK...")
 
         # 1. Pre-deployment checks
-        print(f"  → Running pre-deployment checks...")
+        self.log.info("  → Running pre-deployment checks...")
         if not self._pre_deployment_checks("watch-app"):
             raise Exception("Pre-deployment checks failed")
 
         # 2. Build release APK
-        print(f"  → Building release APK...")
+        self.log.info("  → Building release APK...")
         build_result = self._build_release_apk()
         if not build_result["success"]:
             raise Exception(f"APK build failed: {build_result['error']}")
 
         apk_path = build_result["apk_path"]
-        print(f"  → APK built: {apk_path}")
+        self.log.info("  → APK built: %s", apk_path)
 
         # 3. Sign APK (if keystore available)
-        print(f"  → Signing APK...")
+        self.log.info("  → Signing APK...")
         signed_apk = self._sign_apk(apk_path)
 
         # 4. Store deployment record
         deployment_record = {
             "project": "watch-app",
             "type": "apk",
-            "timestamp": time.time(),
+            "timestamp": datetime.fromtimestamp(task.started_at).isoformat(),
             "apk_path": signed_apk or apk_path,
             "task_id": task.task_id,
             "status": "success"
@@ -113,46 +144,44 @@ class DeployerAgent(BaseAgent):
             deployment_record
         )
 
-        print(f"[{self.agent_id}] ✓ Watch app APK ready for distribution")
+        self.log.info("✓ Watch app APK ready for distribution")
 
     def _deploy_dashboard(self, task: Task):
         """Deploy dashboard to cloud"""
-        print(f"[{self.agent_id}] Deploying dashboard to cloud...")
-
-        os.chdir(self.dashboard_path)
+        self.log.info("Deploying dashboard to cloud...")
 
         # 1. Pre-deployment checks
-        print(f"  → Running pre-deployment checks...")
+        self.log.info("  → Running pre-deployment checks...")
         if not self._pre_deployment_checks("dashboard"):
             raise Exception("Pre-deployment checks failed")
 
         # 2. Determine deployment target
         target = self._get_deployment_target()
-        print(f"  → Deployment target: {target}")
+        self.log.info("  → Deployment target: %s", target)
 
         # 3. Build application
-        print(f"  → Building application...")
+        self.log.info("  → Building application...")
         self._build_dashboard()
 
         # 4. Deploy to target
-        print(f"  → Deploying to {target}...")
+        self.log.info("  → Deploying to %s...", target)
         deployment_url = self._deploy_to_cloud(target)
 
         # 5. Health check
-        print(f"  → Running health checks...")
+        self.log.info("  → Running health checks...")
         health_result = self._health_check(deployment_url)
 
         if not health_result["healthy"]:
-            print(f"  → Health check failed, rolling back...")
+            self.log.warning("  → Health check failed, rolling back...")
             self._rollback_deployment(task)
             raise Exception("Health check failed after deployment")
 
         # 6. Smoke tests
-        print(f"  → Running smoke tests...")
+        self.log.info("  → Running smoke tests...")
         smoke_result = self._smoke_tests(deployment_url)
 
         if not smoke_result["passed"]:
-            print(f"  → Smoke tests failed, rolling back...")
+            self.log.warning("  → Smoke tests failed, rolling back...")
             self._rollback_deployment(task)
             raise Exception("Smoke tests failed after deployment")
 
@@ -160,7 +189,7 @@ class DeployerAgent(BaseAgent):
         deployment_record = {
             "project": "dashboard",
             "type": "web",
-            "timestamp": time.time(),
+            "timestamp": datetime.fromtimestamp(task.started_at).isoformat(),
             "url": deployment_url,
             "target": target,
             "task_id": task.task_id,
@@ -177,60 +206,99 @@ class DeployerAgent(BaseAgent):
             }
         )
 
-        print(f"[{self.agent_id}] ✓ Dashboard deployed successfully to {deployment_url}")
+        self.log.info("✓ Dashboard deployed successfully to %s", deployment_url)
 
     def _rollback_deployment(self, task: Task):
         """Rollback to previous deployment"""
-        print(f"[{self.agent_id}] Rolling back deployment...")
+        self.log.info("Rolling back deployment...")
 
         # Find last successful deployment
         if len(self.deployment_history) < 2:
-            print(f"  → No previous deployment to rollback to")
+            self.log.info("  → No previous deployment to rollback to")
             return
 
         previous_deployment = self.deployment_history[-2]
-        print(f"  → Rolling back to: {previous_deployment['timestamp']}")
+        self.log.info("  → Rolling back to: %s", previous_deployment['timestamp'])
 
         # Perform rollback based on project type
         if previous_deployment["project"] == "dashboard":
             self._rollback_dashboard(previous_deployment)
         elif previous_deployment["project"] == "watch-app":
-            print(f"  → Watch app rollback not applicable (APK already distributed)")
+            self.log.info("  → Watch app rollback not applicable (APK already distributed)")
+
+        self.log.info("✓ Rollback complete")
 
-        print(f"[{self.agent_id}] ✓ Rollback complete")
+    def _handle_broadcast(self, message: Message):
+        """Forget cached test-result misses when the tester publishes new results"""
+        payload = message.payload
+        if payload.get("status") == "tests_complete":
+            self._missing_test_results.pop(payload.get("project"), None)
 
     def _pre_deployment_checks(self, project: str) -> bool:
         """Run pre-deployment checks"""
         checks_passed = True
 
         # Check if tests passed
-        print(f"     Checking test status...")
-        # In real implementation, query tester agent for results
-        test_results = self.context_store.get_context(f"test_results.latest.{project}")
+        self.log.info("     Checking test status...")
+        # The tester agent publishes each project's latest results
+        missed_at = self._missing_test_results.get(project)
+        if missed_at is not None and time.monotonic() - missed_at < self.MISSING_RESULTS_TTL:
+            test_results = None
+        else:
+            test_results = self.context_store.get_context(f"test_results.latest.{project}")
+            if test_results is None:
+                self._missing_test_results[project] = time.monotonic()
+            else:
+                self._missing_test_results.pop(project, None)
+
         if test_results and not test_results.get("passed", True):
-            print(f"     ✗ Tests failed")
+            self.log.warning("     ✗ Tests failed")
             checks_passed = False
         else:
-            print(f"     ✓ Tests passed")
+            self.log.info("     ✓ Tests passed")
 
         # Check for conflicts
-        print(f"     Checking for conflicts...")
+        self.log.info("     Checking for conflicts...")
         # Check if any other deployment in progress
-        print(f"     ✓ No conflicts")
+        self.log.info("     ✓ No conflicts")
 
         return checks_passed
 
     def _build_release_apk(self) -> Dict:
         """Build release APK for watch app"""
+        with SUBPROCESS_SLOTS:
+            return self.run_async(self._build_release_apk_async())
+
+    async def _build_release_apk_async(self) -> Dict:
+        """Run the gradle release build without piping its output through Python"""
         try:
-            result = subprocess.run(
-                ["./gradlew", "assembleRelease"],
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout
-            )
-
-            if result.returncode == 0:
+            # Gradle's log runs to tens of MB; it goes straight to a file and
+            # only its tail is read back if the build fails
+            build_dir = os.path.join(self.watch_app_path, "build")
+            if not self._build_dir_ready:
+                os.makedirs(build_dir, exist_ok=True)
+                self._build_dir_ready = True
+            log_path = os.path.join(build_dir, "release-build.log")
+
+            with open(log_path, "wb") as log_file:
+                proc = await asyncio.create_subprocess_exec(
+                    "./gradlew", "assembleRelease",
+                    cwd=self.watch_app_path,
+                    stdout=log_file,
+                    stderr=asyncio.subprocess.STDOUT
+                )
+                try:
+                    await asyncio.wait_for(proc.wait(), timeout=600)  # 10 minute timeout
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    return {
+                        "success": False,
+                        "error": f"Gradle release build timed out after 600s\n{self._read_log_tail(log_path)}",
+                        "log_path": log_path
+                    }
+
+            if proc.returncode == 0:
                 # Find APK path
                 apk_path = os.path.join(
                     self.watch_app_path,
@@ -244,17 +312,25 @@ class DeployerAgent(BaseAgent):
             else:
                 return {
                     "success": False,
-                    "error": result.stderr
+                    "error": self._read_log_tail(log_path),
+                    "log_path": log_path
                 }
 
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _read_log_tail(self, log_path: str) -> str:
+        """Read the last BUILD_LOG_TAIL bytes of a build log"""
+        with open(log_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(f.tell() - self.BUILD_LOG_TAIL, 0))
+            return f.read().decode(errors="replace")
+
     def _sign_apk(self, apk_path: str) -> Optional[str]:
         """Sign APK (if keystore available)"""
         # In real implementation, use jarsigner with keystore
         # For now, return unsigned APK
-        print(f"     APK signing skipped (keystore not configured)")
+        self.log.info("     APK signing skipped (keystore not configured)")
         return None
 
     def _get_deployment_target(self) -> str:
@@ -265,9 +341,17 @@ class DeployerAgent(BaseAgent):
 
     def _build_dashboard(self):
         """Build dashboard application"""
-        print(f"     Installing dependencies...")
-        subprocess.run(["pip", "install", "-r", "requirements.txt"], check=True)
-        print(f"     Dashboard built successfully")
+        self.log.info("     Installing dependencies...")
+        command = ["pip", "install", "-r", "requirements.txt"]
+        result = self.run_async(self.stream_subprocess_async(
+            command,
+            cwd=self.dashboard_path,
+            timeout=600,  # 10 minute timeout
+            on_line=lambda line: self.log.info("       %s", line)
+        ))
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, command, output=result.stdout)
+        self.log.info("     Dashboard built successfully")
 
     def _deploy_to_cloud(self, target: str) -> str:
         """
@@ -290,17 +374,42 @@ class DeployerAgent(BaseAgent):
     def _deploy_to_cloud_run(self) -> str:
         """Deploy to Google Cloud Run"""
         # In real implementation, use gcloud CLI
-        print(f"     Deploying to Cloud Run...")
-        print(f"     (Simulated deployment)")
+        self.log.info("     Deploying to Cloud Run...")
+        self.log.info("     (Simulated deployment)")
         return "https://dashboard-xyz.run.app"
 
     def _deploy_to_vercel(self) -> str:
         """Deploy to Vercel"""
         # In real implementation, use vercel CLI
-        print(f"     Deploying to Vercel...")
-        print(f"     (Simulated deployment)")
+        self.log.info("     Deploying to Vercel...")
+        self.log.info("     (Simulated deployment)")
         return "https://dashboard-xyz.vercel.app"
 
+    @property
+    def _http(self):
+        """Pooled HTTP session for health and smoke checks, created on first use"""
+        if self._http_session is None:
+            self._http_session = self._create_http_session()
+        return self._http_session
+
+    def _create_http_session(self):
+        """Create the pooled HTTP session used for health and smoke checks"""
+        # requests (and urllib3/ssl behind it) is imported here rather than at
+        # module load; most deployer processes never probe a live service
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def _health_check(self, url: str) -> Dict:
         """
         Perform health check on deployed service
@@ -312,13 +421,13 @@ class DeployerAgent(BaseAgent):
             Health check result
         """
         try:
-            print(f"     Checking {url}/health...")
+            self.log.info("     Checking %s/health...", url)
 
-            # Simulated health check
-            # In real implementation:
-            # response = requests.get(f"{url}/health", timeout=10)
-            # return {"healthy": response.status_code == 200}
+            if self.live_probes:
+                response = self._http.get(f"{url}/health", timeout=(2, 5))
+                return {"healthy": response.status_code == 200, "status": response.status_code}
 
+            # Simulated health check
             return {"healthy": True, "status": "ok"}
 
         except Exception as e:
@@ -334,26 +443,51 @@ class DeployerAgent(BaseAgent):
         Returns:
             Smoke test results
         """
-        print(f"     Running smoke tests on {url}...")
+        self.log.info("     Running smoke tests on %s...", url)
+
+        if self.live_probes:
+            return self.run_async(self._smoke_tests_async(url))
 
         # Simulated smoke tests
-        # In real implementation:
-        # - Test critical endpoints
-        # - Verify database connectivity
-        # - Check connector availability
+        return {"passed": True, "tests_run": len(self.SMOKE_ENDPOINTS)}
+
+    async def _smoke_tests_async(self, url: str) -> Dict:
+        """Probe every smoke endpoint concurrently over the pooled session"""
+        session = self._http
+        responses = await asyncio.gather(
+            *(
+                asyncio.to_thread(session.get, f"{url}{endpoint}", timeout=(2, 5))
+                for endpoint in self.SMOKE_ENDPOINTS
+            ),
+            return_exceptions=True
+        )
 
-        return {"passed": True, "tests_run": 5}
+        failures = {}
+        for endpoint, response in zip(self.SMOKE_ENDPOINTS, responses):
+            if isinstance(response, Exception):
+                failures[endpoint] = str(response)
+            elif response.status_code != 200:
+                failures[endpoint] = f"HTTP {response.status_code}"
+
+        for endpoint, reason in failures.items():
+            self.log.warning("     ✗ %s: %s", endpoint, reason)
+
+        return {
+            "passed": not failures,
+            "tests_run": len(self.SMOKE_ENDPOINTS),
+            "failures": failures
+        }
 
     def _rollback_dashboard(self, previous_deployment: Dict):
         """Rollback dashboard to previous deployment"""
-        print(f"     Rolling back dashboard to {previous_deployment['url']}...")
+        self.log.info("     Rolling back dashboard to %s...", previous_deployment['url'])
 
         # In real implementation:
         # - Redeploy previous version
         # - Update routing to previous deployment
         # - Verify rollback successful
 
-        print(f"     Rollback successful")
+        self.log.info("     Rollback successful")
 
 
 # Example usage
@@ -11,31 +11,66 @@ Responsibilities:
 
 import sys
 import os
+import re
 from typing import Dict, List, Optional
-import subprocess
+import shutil
 import time
+from git import Repo, GitCommandError
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../tools'))
 
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, PROJECT_ROOT, SUBPROCESS_SLOTS, TMP_DIR
 from core.agent_registry import Task
 from core.message_bus import MessageType
 
 
+# Task kinds by description keyword, found in one case-insensitive pass. The
+# lookahead reports overlapping matches, so this equals substring checks on the
+# lowered description; execute_task applies the watch > lovable precedence.
+_TASK_RE = re.compile(r"(?=(?P<watch>watch|android)|(?P<lovable>lovable|react))", re.IGNORECASE)
+
+# Source files counted as React components by _analyze_react_components
+_REACT_COMPONENT_EXTENSIONS = (".tsx", ".jsx")
+
+# Read buffer for source files (1 MiB)
+_SOURCE_READ_BUFFER = 1 << 20
+
+
 class DeveloperAgent(BaseAgent):
     """
     Autonomous developer agent that writes code for watch app and dashboard
     """
 
+    # Parallel project execution, build cache and a reused daemon; the matching
+    # defaults also live in watch-app/gradle.properties
+    GRADLE_FLAGS = (
+        "--parallel",
+        "--configure-on-demand",
+        "--build-cache",
+        "--daemon",
+        f"-Dorg.gradle.workers.max={os.cpu_count() or 1}",
+    )
+
     def __init__(self, agent_id: str = "dev-1"):
         super().__init__(agent_id=agent_id, role="developer_agent")
 
         # Project paths
-        self.project_root = "/Users/vik043/Desktop/Agentic Workflow"
+        self.project_root = PROJECT_ROOT
         self.watch_app_path = os.path.join(self.project_root, "watch-app")
         self.dashboard_path = os.path.join(self.project_root, "dashboard")
         self.lovable_repo_path = None  # Set when Lovable project is cloned
 
+        # GitPython handles, one per working directory, kept for the agent's
+        # lifetime so repeated operations reuse the parsed repo and object DB
+        self._repos: Dict[str, Repo] = {}
+
+        # Source file summaries: path -> (st_mtime_ns, st_size, summary); a file
+        # is only re-read once its mtime or size changes
+        self._analysis_cache: Dict[str, tuple] = {}
+
+        # Environment for gradle builds (None inherits ours unchanged)
+        self._gradle_env = self._create_gradle_env()
+
     def execute_task(self, task: Task):
         """
         Execute development task
@@ -44,7 +79,7 @@ class DeveloperAgent(BaseAgent):
             task: Task to execute
         """
         try:
-            print(f"[{self.agent_id}] Starting development task: {task.description}")
+            self.log.info("Starting development task: %s", task.description)
 
             # Parse workflow
             workflow = self.get_workflow(task.workflow)
@@ -52,9 +87,10 @@ class DeveloperAgent(BaseAgent):
                 raise Exception(f"Workflow not found: {task.workflow}")
 
             # Determine task type
-            if "watch" in task.description.lower() or "android" in task.description.lower():
+            kinds = {match.lastgroup for match in _TASK_RE.finditer(task.description)}
+            if "watch" in kinds:
                 self._develop_watch_app(task, workflow)
-            elif "lovable" in task.description.lower() or "react" in task.description.lower():
+            elif "lovable" in kinds:
                 self._develop_lovable_dashboard(task, workflow)
             else:
                 self._develop_dashboard(task, workflow)
@@ -63,101 +99,85 @@ class DeveloperAgent(BaseAgent):
 
         except Exception as e:
             error_msg = f"Development task failed: {str(e)}"
-            print(f"[{self.agent_id}] {error_msg}")
+            self.log.error(error_msg)
             self.fail_task(task.task_id, error_msg)
 
     def _develop_watch_app(self, task: Task, workflow):
         """Develop Android watch app feature"""
-        print(f"[{self.agent_id}] Developing watch app feature...")
+        self.log.info("Developing watch app feature...")
 
         # 1. Understand current codebase
-        print(f"  → Reading existing codebase...")
+        self.log.info("  → Reading existing codebase...")
         self._read_kotlin_files()
 
-        # 2. Create feature branch
-        print(f"  → Creating feature branch...")
-        branch_name = f"feature/{task.task_id}"
-        self._create_git_branch(self.watch_app_path, branch_name)
-
-        # 3. Implement changes
-        print(f"  → Implementing changes...")
+        # 2. Implement changes
+        self.log.info("  → Implementing changes...")
         # This is where the actual code generation would happen
         # For now, we'll simulate it
-        print(f"     (AI would generate Kotlin code here based on task description)")
+        self.log.info("     (AI would generate Kotlin code here based on task description)")
 
-        # 4. Build and test
-        print(f"  → Building watch app...")
+        # 3. Build and test
+        self.log.info("  → Building watch app...")
         build_result = self._build_watch_app()
         if not build_result:
             raise Exception("Watch app build failed")
 
-        # 5. Commit changes
-        print(f"  → Committing changes...")
-        self._commit_changes(self.watch_app_path, f"feat: {task.description}")
+        # 4. Commit changes to a feature branch
+        self.log.info("  → Committing changes to feature branch...")
+        self._publish_changes(self.watch_app_path, f"feature/{task.task_id}", f"feat: {task.description}")
 
-        # 6. Notify tester
-        print(f"  → Notifying tester agent...")
+        # 5. Notify tester
+        self.log.info("  → Notifying tester agent...")
         self._notify_tester(task.task_id, "watch-app")
 
-        print(f"[{self.agent_id}] ✓ Watch app development complete")
+        self.log.info("✓ Watch app development complete")
 
     def _develop_lovable_dashboard(self, task: Task, workflow):
         """Develop Lovable dashboard feature"""
-        print(f"[{self.agent_id}] Developing Lovable dashboard feature...")
+        self.log.info("Developing Lovable dashboard feature...")
 
         # 1. Sync Lovable project if needed
         if not self.lovable_repo_path:
-            print(f"  → Syncing Lovable project from GitHub...")
+            self.log.info("  → Syncing Lovable project from GitHub...")
             self._sync_lovable_project()
 
         # 2. Analyze existing React components
-        print(f"  → Analyzing React component structure...")
+        self.log.info("  → Analyzing React component structure...")
         self._analyze_react_components()
 
-        # 3. Create feature branch
-        print(f"  → Creating feature branch...")
-        branch_name = f"feature/{task.task_id}"
-        self._create_git_branch(self.lovable_repo_path, branch_name)
-
-        # 4. Implement changes following Lovable patterns
-        print(f"  → Implementing React component...")
+        # 3. Implement changes following Lovable patterns
+        self.log.info("  → Implementing React component...")
         # This is where React/TypeScript code generation would happen
-        print(f"     (AI would generate React/TypeScript code here)")
+        self.log.info("     (AI would generate React/TypeScript code here)")
 
-        # 5. Run tests
-        print(f"  → Running tests...")
+        # 4. Run tests
+        self.log.info("  → Running tests...")
         # Test execution would happen here
 
-        # 6. Commit changes
-        print(f"  → Committing changes...")
-        self._commit_changes(self.lovable_repo_path, f"feat: {task.description}")
-
-        # 7. Push to GitHub
-        print(f"  → Pushing to GitHub...")
-        self._push_to_github(self.lovable_repo_path, branch_name)
+        # 5. Commit to a feature branch and push to GitHub
+        self.log.info("  → Committing and pushing feature branch...")
+        self._publish_changes(
+            self.lovable_repo_path, f"feature/{task.task_id}", f"feat: {task.description}", push=True
+        )
 
-        print(f"[{self.agent_id}] ✓ Lovable dashboard development complete")
+        self.log.info("✓ Lovable dashboard development complete")
 
     def _develop_dashboard(self, task: Task, workflow):
         """Develop FastAPI dashboard feature"""
-        print(f"[{self.agent_id}] Developing dashboard feature...")
+        self.log.info("Developing dashboard feature...")
 
-        # 1. Create feature branch
-        branch_name = f"feature/{task.task_id}"
-        self._create_git_branch(self.dashboard_path, branch_name)
-
-        # 2. Implement Python code
-        print(f"  → Implementing Python code...")
+        # 1. Implement Python code
+        self.log.info("  → Implementing Python code...")
         # Code generation would happen here
 
-        # 3. Run tests
-        print(f"  → Running tests...")
+        # 2. Run tests
+        self.log.info("  → Running tests...")
         # Test execution
 
-        # 4. Commit
-        self._commit_changes(self.dashboard_path, f"feat: {task.description}")
+        # 3. Commit to a feature branch
+        self._publish_changes(self.dashboard_path, f"feature/{task.task_id}", f"feat: {task.description}")
 
-        print(f"[{self.agent_id}] ✓ Dashboard development complete")
+        self.log.info("✓ Dashboard development complete")
 
     def _read_kotlin_files(self):
         """Read and understand Kotlin codebase"""
@@ -166,66 +186,168 @@ class DeveloperAgent(BaseAgent):
             "app/src/main/java/com/example/kin/presentation/MainActivity.kt"
         )
 
-        if os.path.exists(main_activity):
-            with open(main_activity, 'r') as f:
-                content = f.read()
-                # Analyze code structure, patterns, etc.
-                print(f"     Read {len(content)} characters from MainActivity.kt")
+        summary = self._summarize_source(main_activity)
+        if summary:
+            # Analyze code structure, patterns, etc.
+            self.log.info("     Read %s lines (%s bytes) from MainActivity.kt",
+                          summary["lines"], summary["bytes"])
 
     def _analyze_react_components(self):
         """Analyze React component structure from Lovable"""
         if not self.lovable_repo_path or not os.path.exists(self.lovable_repo_path):
-            print(f"     Lovable repo not found, skipping analysis")
+            self.log.info("     Lovable repo not found, skipping analysis")
             return
 
         # Find React components
         src_path = os.path.join(self.lovable_repo_path, "src")
         if os.path.exists(src_path):
-            print(f"     Analyzing React components in {src_path}")
+            self.log.info("     Analyzing React components in %s", src_path)
             # Component analysis would happen here
+            components = {}
+            for dirpath, dirnames, filenames in os.walk(src_path):
+                for filename in filenames:
+                    if filename.endswith(_REACT_COMPONENT_EXTENSIONS):
+                        path = os.path.join(dirpath, filename)
+                        summary = self._summarize_source(path)
+                        if summary:
+                            components[os.path.relpath(path, src_path)] = summary
+            self.log.info("     Found %s component files", len(components))
+
+    def _summarize_source(self, path: str) -> Optional[Dict]:
+        """
+        Summarize a source file, reusing the last summary while it is unchanged
+
+        Args:
+            path: Source file
+
+        Returns:
+            Summary dict, or None if the file does not exist
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._analysis_cache.pop(path, None)
+            return None
+
+        cached = self._analysis_cache.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        # Binary read with a large buffer: nothing here needs decoded text, and
+        # big sources come in with few read() calls
+        with open(path, 'rb', buffering=_SOURCE_READ_BUFFER) as f:
+            content = f.read()
+        summary = {"bytes": len(content), "lines": content.count(b"\n")}
+        self._analysis_cache[path] = (st.st_mtime_ns, st.st_size, summary)
+        return summary
+
+    def _get_repo(self, repo_path: str) -> Repo:
+        """
+        Get the cached repository handle for a working directory
+
+        Args:
+            repo_path: Project directory (may be a subdirectory of the repository)
+
+        Returns:
+            GitPython Repo
+        """
+        repo = self._repos.get(repo_path)
+        if repo is None:
+            repo = Repo(repo_path, search_parent_directories=True)
+            self._repos[repo_path] = repo
+        return repo
+
+    def _publish_changes(self, repo_path: str, branch_name: str, commit_message: str,
+                         push: bool = False):
+        """
+        Apply a task's git work in one batch once its changes are in place
+
+        Uncommitted changes carry over when the feature branch is checked out,
+        so branching at the end is equivalent to branching up front; it keeps
+        all git work on one repository handle and leaves no empty branch behind
+        when the task fails before committing.
+
+        Args:
+            repo_path: Project directory
+            branch_name: Feature branch to create (or reuse)
+            commit_message: Commit message
+            push: Also push the branch to origin
+        """
+        with SUBPROCESS_SLOTS:
+            self._create_git_branch(repo_path, branch_name)
+            self._commit_changes(repo_path, commit_message)
+            if push:
+                self._push_to_github(repo_path, branch_name)
 
     def _create_git_branch(self, repo_path: str, branch_name: str):
         """Create new git branch"""
-        try:
-            os.chdir(repo_path)
-            subprocess.run(["git", "checkout", "-b", branch_name], check=True)
-            print(f"     Created branch: {branch_name}")
-        except subprocess.CalledProcessError as e:
+        repo = self._get_repo(repo_path)
+
+        # The ref is written in-process; only the checkout runs git
+        if branch_name in repo.heads:
             # Branch might already exist, checkout instead
-            subprocess.run(["git", "checkout", branch_name], check=True)
+            repo.heads[branch_name].checkout()
+        else:
+            repo.create_head(branch_name).checkout()
+            self.log.info("     Created branch: %s", branch_name)
+
+    def _create_gradle_env(self) -> Optional[Dict[str, str]]:
+        """
+        Route native (NDK) compiles through ccache when it is installed
+
+        CCACHE_DIR defaults to a directory under TMP_DIR, so every agent on the
+        machine shares one cache and reuses each other's object files.
+        """
+        if not shutil.which("ccache"):
+            return None
+
+        return {
+            **os.environ,
+            "CC": "ccache clang",
+            "CXX": "ccache clang++",
+            "NDK_CCACHE": "ccache",
+            "CCACHE_DIR": os.environ.get("CCACHE_DIR") or os.path.join(TMP_DIR, "ccache"),
+        }
 
     def _build_watch_app(self) -> bool:
         """Build Android watch app"""
         try:
-            os.chdir(self.watch_app_path)
-            result = subprocess.run(
-                ["./gradlew", "assembleDebug"],
+            result = self.run_subprocess(
+                ["./gradlew", *self.GRADLE_FLAGS, "assembleDebug"],
+                cwd=self.watch_app_path,
+                env=self._gradle_env,
                 capture_output=True,
                 text=True
             )
             return result.returncode == 0
         except Exception as e:
-            print(f"     Build error: {e}")
+            self.log.error("     Build error: %s", e)
             return False
 
     def _commit_changes(self, repo_path: str, commit_message: str):
         """Commit changes to git"""
+        repo = self._get_repo(repo_path)
         try:
-            os.chdir(repo_path)
-            subprocess.run(["git", "add", "."], check=True)
-            subprocess.run(["git", "commit", "-m", commit_message], check=True)
-            print(f"     Committed: {commit_message}")
-        except subprocess.CalledProcessError:
-            print(f"     No changes to commit")
+            # Stage everything under repo_path, like `git add .` run from there
+            repo.git.add("--all", "--", os.path.relpath(repo_path, repo.working_tree_dir))
+            if not repo.is_dirty(index=True, working_tree=False, untracked_files=False):
+                self.log.info("     No changes to commit")
+                return
+
+            # Tree and commit objects are written in-process
+            repo.index.commit(commit_message)
+            self.log.info("     Committed: %s", commit_message)
+        except GitCommandError:
+            self.log.info("     No changes to commit")
 
     def _push_to_github(self, repo_path: str, branch_name: str):
         """Push branch to GitHub"""
         try:
-            os.chdir(repo_path)
-            subprocess.run(["git", "push", "-u", "origin", branch_name], check=True)
-            print(f"     Pushed branch: {branch_name}")
-        except subprocess.CalledProcessError as e:
-            print(f"     Push error: {e}")
+            repo = self._get_repo(repo_path)
+            repo.remote("origin").push(f"{branch_name}:{branch_name}", set_upstream=True).raise_if_error()
+            self.log.info("     Pushed branch: %s", branch_name)
+        except (GitCommandError, ValueError) as e:
+            self.log.error("     Push error: %s", e)
 
     def _sync_lovable_project(self):
         """Sync Lovable project from GitHub"""
@@ -234,7 +356,7 @@ class DeveloperAgent(BaseAgent):
 
         sync = LovableSync()
         self.lovable_repo_path = sync.clone_or_sync()
-        print(f"     Lovable project synced to: {self.lovable_repo_path}")
+        self.log.info("     Lovable project synced to: %s", self.lovable_repo_path)
 
     def _notify_tester(self, task_id: str, project: str):
         """Notify tester agent that code is ready for testing"""
@@ -9,14 +9,75 @@ Uses Google's Gemini AI for autonomous code deployment:
 """
 
 import os
+import re
 import json
 import asyncio
-from typing import Dict, List, Optional, Any
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import google.generativeai as genai
 
-from .base_agent import BaseAgent
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+from .base_agent import BaseAgent, PROJECT_ROOT
 from core.agent_registry import Task, AgentStatus
+from core.serialization import dumps, loads, strip_code_fence
+
+
+# Task kinds by description keyword, found in one case-insensitive pass. The
+# lookahead reports overlapping matches, so this equals substring checks on the
+# lowered description; execute_task applies deploy > analyze > modify.
+_TASK_RE = re.compile(
+    r"(?=(?P<deploy>deploy)|(?P<analyze>analyze)|(?P<modify>modify|change))",
+    re.IGNORECASE
+)
+
+# Directories included in the codebase context, keyed by their name in "structure"
+_SCAN_ROOTS = {
+    "dashboard": "dashboard",
+    "watch_app": "watch-app",
+    "tools": "tools",
+    "workflows": "workflows",
+}
+
+# Depth of the structure scan (the root listing plus one level of subdirectories)
+_SCAN_DEPTH = 2
+
+# Words in a task description or file name; descriptions only contribute words
+# of three or more characters so "a", "to", "py" etc. match nothing
+_NAME_PART_RE = re.compile(r"[a-z0-9]+")
+
+
+class _ContextChangeHandler(FileSystemEventHandler):
+    """
+    Marks codebase-context directories dirty when entries appear or disappear
+
+    The structure only records names, so edits to existing files are ignored.
+    Each event marks its parent directory, provided that directory is one the
+    scan actually lists.
+    """
+
+    def __init__(self, agent: "GeminiAgent"):
+        super().__init__()
+        self.agent = agent
+
+    def on_created(self, event):
+        self.agent._mark_dirty(event.src_path)
+
+    def on_deleted(self, event):
+        self.agent._mark_dirty(event.src_path)
+
+    def on_moved(self, event):
+        self.agent._mark_dirty(event.src_path)
+        self.agent._mark_dirty(event.dest_path)
 
 
 class GeminiAgent(BaseAgent):
@@ -43,8 +104,24 @@ class GeminiAgent(BaseAgent):
 
         # Codebase context cache
         self.codebase_context: Optional[Dict] = None
+        self.codebase_context_json: Optional[str] = None  # Pretty-printed codebase_context
         self.codebase_cache_time: Optional[datetime] = None
-        self.cache_ttl_seconds = 300  # 5 minutes
+        self.cache_ttl_seconds = 300  # 5 minutes (codebase context without a file watcher, and Gemini responses)
+
+        # Deployment-plan file changes applied at once
+        self.file_concurrency = int(os.getenv("AGENT_FILE_CONCURRENCY", "8"))
+
+        # Scanned directories whose listing changed since the last rebuild,
+        # reported by a watchdog observer started with the first scan
+        self._observer = None
+        self._dirty_paths: set = set()
+        self._dirty_lock = threading.Lock()
+
+        # (time.monotonic(), parsed response) by sha256(prompt). Entries expire
+        # after cache_ttl_seconds and are cleared whenever the codebase context
+        # is rebuilt, so they live no longer than the context they embed
+        self._llm_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._llm_cache_lock = threading.Lock()
 
     def execute_task(self, task: Task):
         """
@@ -54,19 +131,20 @@ class GeminiAgent(BaseAgent):
             task: Task with deployment instructions
         """
         try:
-            print(f"[{self.agent_id}] Executing deployment task: {task.description}")
+            self.log.info("Executing deployment task: %s", task.description)
 
             # Update status
             self.status = AgentStatus.BUSY
             self.registry.update_agent_status(self.agent_id, AgentStatus.BUSY)
 
             # Parse task type
-            if "deploy" in task.description.lower():
-                result = asyncio.run(self._handle_deployment_task(task))
-            elif "analyze" in task.description.lower():
-                result = asyncio.run(self._handle_analysis_task(task))
-            elif "modify" in task.description.lower() or "change" in task.description.lower():
-                result = asyncio.run(self._handle_modification_task(task))
+            kinds = {match.lastgroup for match in _TASK_RE.finditer(task.description)}
+            if "deploy" in kinds:
+                result = self.run_async(self._handle_deployment_task(task))
+            elif "analyze" in kinds:
+                result = self.run_async(self._handle_analysis_task(task))
+            elif "modify" in kinds:
+                result = self.run_async(self._handle_modification_task(task))
             else:
                 result = {"success": False, "error": "Unknown task type"}
 
@@ -74,12 +152,12 @@ class GeminiAgent(BaseAgent):
                 self.complete_task(task.task_id)
 
                 # Store result in context
-                self.context_store.set(f"tasks.{task.task_id}.result", result)
+                self.context_store.set_context(f"tasks.{task.task_id}.result", result)
             else:
                 self.fail_task(task.task_id, result.get("error", "Unknown error"))
 
         except Exception as e:
-            print(f"[{self.agent_id}] Task execution failed: {e}")
+            self.log.error("Task execution failed: %s", e)
             self.fail_task(task.task_id, str(e))
 
     async def _handle_deployment_task(self, task: Task) -> Dict:
@@ -93,8 +171,8 @@ class GeminiAgent(BaseAgent):
         4. Execute deployment
         """
         try:
-            # Get codebase context
-            codebase = self._get_codebase_context()
+            # Get codebase context (only the parts the task mentions)
+            codebase_json = self._prompt_codebase_json(task.description)
 
             # Build prompt for Gemini
             prompt = f"""You are a deployment specialist. Analyze this task and provide a deployment plan.
@@ -102,7 +180,7 @@ class GeminiAgent(BaseAgent):
 Task: {task.description}
 
 Current Codebase Structure:
-{json.dumps(codebase, indent=2)}
+{codebase_json}
 
 Recent Deployments:
 {self._get_recent_deployments()}
@@ -135,17 +213,8 @@ Respond in JSON format:
   "estimated_time_minutes": 5
 }}"""
 
-            # Call Gemini
-            response = self.model.generate_content(prompt)
-            response_text = response.text
-
-            # Parse JSON response (handle markdown code blocks)
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
-
-            deployment_plan = json.loads(response_text)
+            # Call Gemini and parse its JSON response
+            deployment_plan = self._cached_generate_json(prompt)
 
             # Execute deployment plan
             execution_result = await self._execute_deployment_plan(deployment_plan)
@@ -162,12 +231,12 @@ Respond in JSON format:
     async def _handle_analysis_task(self, task: Task) -> Dict:
         """Analyze codebase or specific component"""
         try:
-            codebase = self._get_codebase_context()
+            codebase_json = self._prompt_codebase_json(task.description)
 
             prompt = f"""Analyze the following codebase for: {task.description}
 
 Codebase Structure:
-{json.dumps(codebase, indent=2)}
+{codebase_json}
 
 Provide:
 1. Current state analysis
@@ -185,11 +254,10 @@ Respond in JSON format:
   "next_steps": ["step1", "step2"]
 }}"""
 
-            response = self.model.generate_content(prompt)
-            analysis = self._parse_json_response(response.text)
+            analysis = self._cached_generate_json(prompt, strict=False)
 
             # Store analysis
-            self.context_store.set(f"analysis.{task.task_id}", analysis)
+            self.context_store.set_context(f"analysis.{task.task_id}", analysis)
 
             return {"success": True, "analysis": analysis}
 
@@ -199,12 +267,12 @@ Respond in JSON format:
     async def _handle_modification_task(self, task: Task) -> Dict:
         """Handle code modification requests"""
         try:
-            codebase = self._get_codebase_context()
+            codebase_json = self._prompt_codebase_json(task.description)
 
             prompt = f"""Generate code modifications for: {task.description}
 
 Codebase Context:
-{json.dumps(codebase, indent=2)}
+{codebase_json}
 
 Provide specific code changes in JSON format:
 {{
@@ -219,8 +287,7 @@ Provide specific code changes in JSON format:
   "risk_assessment": "low|medium|high"
 }}"""
 
-            response = self.model.generate_content(prompt)
-            modifications = self._parse_json_response(response.text)
+            modifications = self._cached_generate_json(prompt, strict=False)
 
             # Apply modifications (would integrate with git operations)
             result = await self._apply_code_modifications(modifications)
@@ -239,20 +306,32 @@ Provide specific code changes in JSON format:
         """
         # Check cache
         if self.codebase_context and self.codebase_cache_time:
+            if self._observer is not None:
+                return self._refresh_dirty_paths()
+
             age_seconds = (datetime.now() - self.codebase_cache_time).total_seconds()
             if age_seconds < self.cache_ttl_seconds:
                 return self.codebase_context
 
         # Rebuild cache
-        project_root = "/Users/vik043/Desktop/Agentic Workflow"
+        project_root = PROJECT_ROOT
+
+        # Watch before scanning so changes made during the scan are not lost
+        self._start_watching()
+        with self._dirty_lock:
+            self._dirty_paths.clear()
+
+        # The roots are independent, so their directory reads can overlap
+        with ThreadPoolExecutor(max_workers=len(_SCAN_ROOTS)) as executor:
+            scans = {
+                key: executor.submit(
+                    self._scan_directory, os.path.join(project_root, dirname), _SCAN_DEPTH
+                )
+                for key, dirname in _SCAN_ROOTS.items()
+            }
 
         codebase = {
-            "structure": {
-                "dashboard": self._scan_directory(f"{project_root}/dashboard"),
-                "watch_app": self._scan_directory(f"{project_root}/watch-app"),
-                "tools": self._scan_directory(f"{project_root}/tools"),
-                "workflows": self._scan_directory(f"{project_root}/workflows")
-            },
+            "structure": {key: scan.result() for key, scan in scans.items()},
             "key_files": [
                 f"{project_root}/dashboard/app/main.py",
                 f"{project_root}/dashboard/app/agents/coordinator.py",
@@ -269,10 +348,229 @@ Provide specific code changes in JSON format:
 
         # Cache it
         self.codebase_context = codebase
-        self.codebase_cache_time = datetime.now()
+        self._codebase_context_changed()
 
         return codebase
 
+    def _prompt_codebase_json(self, task_description: str) -> str:
+        """
+        Codebase context JSON for a prompt, narrowed to what the task mentions
+
+        Args:
+            task_description: Task text to match against directory and file names
+
+        Returns:
+            Pretty-printed JSON; the full cached context if nothing matched
+        """
+        codebase = self._get_codebase_context()
+        subtree = self._relevant_subtree(codebase, task_description)
+        if subtree is codebase:
+            return self.codebase_context_json
+        return dumps(subtree, indent=True).decode()
+
+    def _relevant_subtree(self, codebase: Dict, task_description: str) -> Dict:
+        """
+        Keep only the parts of the structure named in the task description
+
+        A directory whose name matches a description word is kept whole; a
+        matching file is kept along with its ancestor directories. Names match
+        on any of their parts, so "watch" selects "watch-app" and "main"
+        selects "main.py".
+
+        Args:
+            codebase: Full codebase context
+            task_description: Task text
+
+        Returns:
+            Copy of codebase with a pruned "structure", or codebase itself when
+            nothing matched
+        """
+        words = {word for word in _NAME_PART_RE.findall(task_description.lower()) if len(word) >= 3}
+        if not words:
+            return codebase
+
+        def matches(name: str) -> bool:
+            name = name.lower()
+            return name in words or not words.isdisjoint(_NAME_PART_RE.findall(name))
+
+        def prune(node: Dict) -> Optional[Dict]:
+            files = [name for name in node.get("files", []) if matches(name)]
+            directories = {}
+            for name, child in node.get("directories", {}).items():
+                if matches(name):
+                    directories[name] = child
+                else:
+                    kept = prune(child)
+                    if kept:
+                        directories[name] = kept
+            if not files and not directories:
+                return None
+            return {"files": files, "directories": directories}
+
+        structure = {}
+        for key, node in codebase["structure"].items():
+            if matches(key) or matches(_SCAN_ROOTS.get(key, key)):
+                structure[key] = node
+            else:
+                kept = prune(node)
+                if kept:
+                    structure[key] = kept
+
+        if not structure:
+            return codebase
+        return {**codebase, "structure": structure}
+
+    def _codebase_context_changed(self):
+        """Refresh everything derived from codebase_context after it changes"""
+        self.codebase_cache_time = datetime.now()
+
+        # Serialized once here; every prompt embeds this string as-is
+        self.codebase_context_json = dumps(self.codebase_context, indent=True).decode()
+
+        # Responses to prompts built from the old context are stale now
+        with self._llm_cache_lock:
+            self._llm_cache.clear()
+
+    def _start_watching(self):
+        """Start the watchdog observer on the scanned roots (once, if available)"""
+        if self._observer is not None or Observer is None:
+            return
+
+        try:
+            observer = Observer()
+            handler = _ContextChangeHandler(self)
+            for dirname in _SCAN_ROOTS.values():
+                path = os.path.join(PROJECT_ROOT, dirname)
+                if os.path.isdir(path):
+                    observer.schedule(handler, path, recursive=True)
+            observer.daemon = True
+            observer.start()
+            self._observer = observer
+        except Exception as e:
+            self.log.warning("File watcher unavailable, using %ss cache TTL: %s", self.cache_ttl_seconds, e)
+
+    def _mark_dirty(self, path: str):
+        """Record that the listing of path's parent directory changed"""
+        if isinstance(path, bytes):
+            path = os.fsdecode(path)
+        parent = os.path.dirname(path)
+
+        relpath = os.path.relpath(parent, PROJECT_ROOT)
+        parts = relpath.split(os.sep)
+        # Only the root listing and its direct subdirectories are scanned
+        if len(parts) > _SCAN_DEPTH:
+            return
+        if any(part.startswith('.') or part == '__pycache__' for part in parts[1:]):
+            return
+
+        with self._dirty_lock:
+            self._dirty_paths.add(parent)
+
+    def _refresh_dirty_paths(self) -> Dict:
+        """
+        Rescan only the directories the watcher marked dirty
+
+        Returns:
+            The (updated) cached codebase context
+        """
+        with self._dirty_lock:
+            dirty = self._dirty_paths
+            self._dirty_paths = set()
+        if not dirty:
+            return self.codebase_context
+
+        structure = self.codebase_context["structure"]
+        for key, dirname in _SCAN_ROOTS.items():
+            root = os.path.join(PROJECT_ROOT, dirname)
+            if root in dirty:
+                # The root listing changed; rescan the whole root
+                structure[key] = self._scan_directory(root, _SCAN_DEPTH)
+                continue
+
+            subdirs = structure[key].get("directories", {})
+            for path in dirty:
+                if os.path.dirname(path) != root:
+                    continue
+                name = os.path.basename(path)
+                if os.path.isdir(path):
+                    subdirs[name] = self._scan_directory(path, _SCAN_DEPTH, 1)
+                else:
+                    subdirs.pop(name, None)
+
+        self._codebase_context_changed()
+
+        return self.codebase_context
+
+    def _cached_generate_json(self, prompt: str, strict: bool = True) -> Dict:
+        """
+        Call Gemini for a JSON response, reusing the parsed response to an
+        identical earlier prompt
+
+        Only responses that parse are cached, and only for cache_ttl_seconds,
+        so retrying after a truncated or stale reply asks Gemini again.
+
+        Args:
+            prompt: Full prompt text
+            strict: Raise on a response that is not JSON, instead of returning
+                an {"error", "raw"} dict
+
+        Returns:
+            Parsed response
+
+        Raises:
+            ValueError: If strict and the response is not JSON
+        """
+        key = hashlib.sha256(prompt.encode()).hexdigest()
+        with self._llm_cache_lock:
+            cached = self._llm_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl_seconds:
+            return cached[1]
+
+        response_text = self._stream_generate(prompt)
+        try:
+            parsed = self._parse_json_response(response_text)
+        except ValueError as e:
+            if strict:
+                raise
+            self.log.error("Error parsing JSON: %s", e)
+            return {"error": "Failed to parse response", "raw": response_text}
+
+        with self._llm_cache_lock:
+            self._llm_cache[key] = (time.monotonic(), parsed)
+        return parsed
+
+    def _stream_generate(self, prompt: str) -> str:
+        """
+        Stream a Gemini response, stopping once the fenced JSON block is complete
+
+        Every prompt asks for JSON, which Gemini usually wraps in a markdown code
+        block. Any text after the closing fence is ignored by the parser anyway,
+        so we stop reading the stream there instead of waiting for the model to
+        finish its commentary.
+
+        Args:
+            prompt: Full prompt text
+
+        Returns:
+            Response text received so far
+        """
+        chunks: List[str] = []
+        fences = 0
+        tail = ""
+        for chunk in self.model.generate_content(prompt, stream=True):
+            text = chunk.text
+            chunks.append(text)
+
+            # Prepend the previous chunk's last two characters so a fence split
+            # across chunks is still seen (the tail is too short to hold one)
+            window = tail + text
+            fences += window.count("```")
+            tail = window[-2:]
+            if fences >= 2:
+                break
+
+        return "".join(chunks)
+
     def _scan_directory(self, path: str, max_depth: int = 2, current_depth: int = 0) -> Dict:
         """Scan directory and return structure"""
         if current_depth >= max_depth or not os.path.exists(path):
@@ -281,18 +579,19 @@ Provide specific code changes in JSON format:
         try:
             result = {"files": [], "directories": {}}
 
-            for item in os.listdir(path):
-                if item.startswith('.') or item == '__pycache__':
-                    continue
-
-                item_path = os.path.join(path, item)
+            # DirEntry type checks use the d_type from the directory read,
+            # so most entries need no extra stat call
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or entry.name == '__pycache__':
+                        continue
 
-                if os.path.isfile(item_path):
-                    result["files"].append(item)
-                elif os.path.isdir(item_path):
-                    result["directories"][item] = self._scan_directory(
-                        item_path, max_depth, current_depth + 1
-                    )
+                    if entry.is_file(follow_symlinks=False):
+                        result["files"].append(entry.name)
+                    elif entry.is_dir(follow_symlinks=False):
+                        result["directories"][entry.name] = self._scan_directory(
+                            entry.path, max_depth, current_depth + 1
+                        )
 
             return result
         except Exception as e:
@@ -300,14 +599,13 @@ Provide specific code changes in JSON format:
 
     def _get_recent_deployments(self) -> str:
         """Get recent deployment history"""
-        deployments = self.context_store.get("deployments", [])
+        # Only the last 3 records are decoded
+        recent = self.context_store.read_log("deployments", limit=3)
 
-        if not deployments:
+        if not recent:
             return "No recent deployments"
 
-        # Return last 3
-        recent = deployments[-3:]
-        return json.dumps(recent, indent=2)
+        return dumps(recent, indent=True).decode()
 
     async def _execute_deployment_plan(self, plan: Dict) -> Dict:
         """
@@ -320,20 +618,14 @@ Provide specific code changes in JSON format:
             Execution result
         """
         try:
-            results = []
-
-            # Step 1: Apply code changes
-            for file_path, change in plan.get("code_changes", {}).items():
-                action = change.get("action")
-
-                if action == "modify":
-                    # Would integrate with git operations here
-                    # For now, just log
-                    results.append(f"Modified: {file_path}")
-                elif action == "create":
-                    results.append(f"Created: {file_path}")
-                elif action == "delete":
-                    results.append(f"Deleted: {file_path}")
+            # Step 1: Apply code changes (independent per file, so run them
+            # concurrently; gather keeps the results in plan order)
+            semaphore = asyncio.Semaphore(self.file_concurrency)
+            applied = await asyncio.gather(*(
+                self._apply_single_change(file_path, change, semaphore)
+                for file_path, change in plan.get("code_changes", {}).items()
+            ))
+            results = [line for line in applied if line]
 
             # Step 2: Execute deployment steps
             for step in plan.get("deployment_steps", []):
@@ -347,15 +639,39 @@ Provide specific code changes in JSON format:
                 "status": "success"
             }
 
-            deployments = self.context_store.get("deployments", [])
-            deployments.append(deployment_record)
-            self.context_store.set("deployments", deployments)
+            self.context_store.append_log("deployments", deployment_record)
 
             return {"success": True, "results": results}
 
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    async def _apply_single_change(self, file_path: str, change: Dict,
+                                   semaphore: asyncio.Semaphore) -> Optional[str]:
+        """
+        Apply one file change from a deployment plan
+
+        Args:
+            file_path: File the change targets
+            change: Change entry with "action", "content" and "reason"
+            semaphore: Caps how many changes are applied at once
+
+        Returns:
+            Result line, or None for an unknown action
+        """
+        async with semaphore:
+            action = change.get("action")
+
+            if action == "modify":
+                # Would integrate with git operations here
+                # For now, just log
+                return f"Modified: {file_path}"
+            elif action == "create":
+                return f"Created: {file_path}"
+            elif action == "delete":
+                return f"Deleted: {file_path}"
+            return None
+
     async def _apply_code_modifications(self, modifications: Dict) -> Dict:
         """Apply code modifications from Gemini's analysis"""
         try:
@@ -371,28 +687,81 @@ Provide specific code changes in JSON format:
             return {"success": False, "error": str(e)}
 
     def _parse_json_response(self, response_text: str) -> Dict:
-        """Parse JSON from Gemini response (handles markdown code blocks)"""
-        try:
-            # Remove markdown code blocks
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
+        """
+        Parse JSON from Gemini response (handles markdown code blocks)
+
+        Raises:
+            ValueError: If the response is not JSON
+        """
+        # Remove markdown code blocks
+        response_text = strip_code_fence(response_text)
 
+        try:
+            return loads(response_text)
+        except ValueError:
+            # orjson rejects some input the json module accepts (NaN, Infinity)
             return json.loads(response_text)
+
+    def startup(self) -> bool:
+        """Start the agent, then warm up the Gemini connection in the background"""
+        if not super().startup():
+            return False
+
+        threading.Thread(target=self._prewarm_model, daemon=True).start()
+        return True
+
+    def _prewarm_model(self):
+        """
+        Send a one-token request so the first real task does not pay for
+        the TLS handshake and connection setup
+        """
+        try:
+            self.model.generate_content("ping", generation_config={"max_output_tokens": 1})
         except Exception as e:
-            print(f"[{self.agent_id}] Error parsing JSON: {e}")
-            return {"error": "Failed to parse response", "raw": response_text}
+            self.log.debug("Gemini prewarm failed: %s", e)
+
+    def shutdown(self):
+        """Stop the file watcher, then shut down"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        super().shutdown()
+
 
+# Started agents by (agent_id, config_path). Building one configures the Gemini
+# client, loads the agent config and registers with the swarm, so every caller
+# asking for the same agent gets the instance that is already running
+_agent_cache: Dict[Tuple[str, Optional[str]], GeminiAgent] = {}
+_agent_cache_lock = threading.Lock()
 
-# Singleton instance
-_gemini_agent = None
 
+def get_gemini_agent(agent_id: str = "gemini_deployer", config_path: str = None) -> GeminiAgent:
+    """
+    Get the running Gemini agent for a configuration, starting it on first use
+
+    Args:
+        agent_id: Agent ID
+        config_path: Agent config file (defaults to the standard config)
 
-def get_gemini_agent() -> GeminiAgent:
-    """Get or create Gemini agent singleton"""
-    global _gemini_agent
-    if _gemini_agent is None:
-        _gemini_agent = GeminiAgent()
-        _gemini_agent.startup()
-    return _gemini_agent
+    Returns:
+        Started GeminiAgent
+    """
+    key = (agent_id, config_path)
+    agent = _agent_cache.get(key)
+    if agent is None:
+        with _agent_cache_lock:
+            agent = _agent_cache.get(key)
+            if agent is None:
+                agent = GeminiAgent(agent_id, config_path)
+                agent.startup()
+                _agent_cache[key] = agent
+    return agent
+
+
+def clear_gemini_agents():
+    """Shut down and forget every cached Gemini agent"""
+    with _agent_cache_lock:
+        cached = list(_agent_cache.values())
+        _agent_cache.clear()
+    for agent in cached:
+        agent.shutdown()
@@ -11,15 +11,19 @@ Responsibilities:
 
 import sys
 import os
+import re
+import asyncio
+import hashlib
 from typing import Dict, List, Optional
 import subprocess
 import time
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../tools'))
 
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, PROJECT_ROOT, TMP_DIR
 from core.agent_registry import Task
 from core.message_bus import MessageType
+from core.serialization import dumps, loads
 
 
 class TesterAgent(BaseAgent):
@@ -27,17 +31,70 @@ class TesterAgent(BaseAgent):
     Autonomous tester agent that runs tests and validates code quality
     """
 
+    # pytest-xdist workers, leaving two cores for the agents and the server
+    PYTEST_WORKERS = max(1, (os.cpu_count() or 1) - 2)
+
+    # Keep one warm Gradle daemon across test runs (unit then instrumentation,
+    # and every later task) instead of paying JVM startup each time; see
+    # DeveloperAgent.GRADLE_FLAGS and watch-app/gradle.properties
+    GRADLE_FLAGS = (
+        "--daemon",
+        "--parallel",
+        "--configure-on-demand",
+        "--build-cache",
+    )
+
+    # Description words marking a re-test after a fix (see Task.tokens); these
+    # runs only repeat the tests that failed last time
+    RETEST_KEYWORDS = frozenset({"retest", "rerun", "recheck"})
+
+    # pytest's "run-last-failure: ..." header line, reported as cache usage
+    _RERUN_RE = re.compile(r"^run-last-failure: (.+)$", re.MULTILINE)
+
+    # Failure lines: Gradle's "SomeTest > someCase FAILED" (and "BUILD FAILED"),
+    # pytest's "FAILED ..."/"ERROR ..." short summary entries
+    _GRADLE_FAILURE_RE = re.compile(r"\bFAILED\b")
+    _PYTEST_FAILURE_RE = re.compile(r"^(?:FAILED|ERROR)\b")
+
+    # Files that make up a project's source tree for the result cache, and
+    # generated/tooling directories skipped while hashing it
+    SOURCE_EXTENSIONS = (".py", ".kt", ".kts", ".gradle")
+    SKIP_DIRS = frozenset({"build", "__pycache__", "node_modules"})
+
+    # Passing results kept in the result cache (oldest dropped first)
+    RESULT_CACHE_SIZE = 32
+
+    # Recent task results kept in test_results (oldest dropped first); older
+    # ones remain available from the context store
+    TEST_RESULTS_SIZE = 64
+
     def __init__(self, agent_id: str = "tester-1"):
         super().__init__(agent_id=agent_id, role="tester_agent")
 
         # Project paths
-        self.project_root = "/Users/vik043/Desktop/Agentic Workflow"
+        self.project_root = PROJECT_ROOT
         self.watch_app_path = os.path.join(self.project_root, "watch-app")
         self.dashboard_path = os.path.join(self.project_root, "dashboard")
 
+        # Sources the integration checks exercise: the connectors, the
+        # dashboard app (API and agents) and the watch app's main source set
+        self.integration_paths = [
+            os.path.join(self.project_root, "tools", "connectors"),
+            os.path.join(self.dashboard_path, "app"),
+            os.path.join(self.watch_app_path, "app", "src", "main"),
+        ]
+
         # Test results
         self.test_results: Dict[str, Dict] = {}
 
+        # Always run only the last failures (re-test tasks do so regardless)
+        self.fast_mode = False
+
+        # Passing results by "<project>:<source tree hash>", persisted so an
+        # unchanged tree is not retested after a restart either
+        self._result_cache_path = os.path.join(TMP_DIR, "test_result_cache.json")
+        self._result_cache: Dict[str, Dict] = self._load_result_cache()
+
     def execute_task(self, task: Task):
         """
         Execute testing task
@@ -46,7 +103,7 @@ class TesterAgent(BaseAgent):
             task: Task to execute
         """
         try:
-            print(f"[{self.agent_id}] Starting testing task: {task.description}")
+            self.log.info("Starting testing task: %s", task.description)
 
             # Parse workflow
             workflow = self.get_workflow(task.workflow)
@@ -55,48 +112,50 @@ class TesterAgent(BaseAgent):
 
             # Determine what to test
             if "watch" in task.description.lower() or "android" in task.description.lower():
-                self._test_watch_app(task)
+                self.run_async(self._test_watch_app(task))
             elif "dashboard" in task.description.lower() or "api" in task.description.lower():
-                self._test_dashboard(task)
+                self.run_async(self._test_dashboard(task))
             elif "integration" in task.description.lower():
-                self._test_integration(task)
+                self.run_async(self._test_integration(task))
             else:
                 # Run all tests
-                self._test_all(task)
+                self.run_async(self._test_all(task))
 
             self.complete_task(task.task_id)
 
         except Exception as e:
             error_msg = f"Testing task failed: {str(e)}"
-            print(f"[{self.agent_id}] {error_msg}")
+            self.log.error(error_msg)
             self.fail_task(task.task_id, error_msg)
 
-    def _test_watch_app(self, task: Task):
+    async def _test_watch_app(self, task: Task):
         """Run Android watch app tests"""
-        print(f"[{self.agent_id}] Testing watch app...")
+        self.log.info("Testing watch app...")
 
-        os.chdir(self.watch_app_path)
+        tree_hash = self._tree_hash(self.watch_app_path)
+        if self._reuse_cached_results(task.task_id, "watch-app", tree_hash):
+            return
 
         # 1. Run unit tests
-        print(f"  → Running unit tests...")
-        unit_result = self._run_gradle_tests("testDebugUnitTest")
+        self.log.info("  → Running unit tests...")
+        unit_result = await self._run_gradle_tests("testDebugUnitTest", cwd=self.watch_app_path)
 
         # 2. Run instrumentation tests (if available)
-        print(f"  → Running instrumentation tests...")
-        instrumentation_result = self._run_gradle_tests("connectedAndroidTest")
+        self.log.info("  → Running instrumentation tests...")
+        instrumentation_result = await self._run_gradle_tests("connectedAndroidTest", cwd=self.watch_app_path)
 
         # 3. Check code coverage
-        print(f"  → Checking code coverage...")
+        self.log.info("  → Checking code coverage...")
         coverage = self._check_android_coverage()
 
         # 4. Store results
-        self.test_results[task.task_id] = {
+        self._store_results(task.task_id, {
             "project": "watch-app",
             "unit_tests": unit_result,
             "instrumentation_tests": instrumentation_result,
             "coverage": coverage,
             "timestamp": time.time()
-        }
+        })
 
         # 5. Report results
         self._report_results(task.task_id)
@@ -104,29 +163,36 @@ class TesterAgent(BaseAgent):
         if not unit_result["passed"]:
             raise Exception(f"Watch app tests failed: {unit_result['failures']} failures")
 
-        print(f"[{self.agent_id}] ✓ Watch app tests passed")
+        # Only a run where every suite passed may stand in for a later one
+        if instrumentation_result["passed"]:
+            self._cache_results("watch-app", tree_hash, self.test_results[task.task_id])
 
-    def _test_dashboard(self, task: Task):
+        self.log.info("✓ Watch app tests passed")
+
+    async def _test_dashboard(self, task: Task):
         """Run dashboard tests"""
-        print(f"[{self.agent_id}] Testing dashboard...")
+        self.log.info("Testing dashboard...")
 
-        os.chdir(self.dashboard_path)
+        tree_hash = self._tree_hash(self.dashboard_path)
+        if self._reuse_cached_results(task.task_id, "dashboard", tree_hash):
+            return
 
         # 1. Run pytest
-        print(f"  → Running pytest...")
-        pytest_result = self._run_pytest()
+        self.log.info("  → Running pytest...")
+        fast = self.fast_mode or not self.RETEST_KEYWORDS.isdisjoint(task.tokens)
+        pytest_result = await self._run_pytest(cwd=self.dashboard_path, fast=fast)
 
         # 2. Check coverage
-        print(f"  → Checking coverage...")
+        self.log.info("  → Checking coverage...")
         coverage = self._check_python_coverage()
 
         # 3. Store results
-        self.test_results[task.task_id] = {
+        self._store_results(task.task_id, {
             "project": "dashboard",
             "pytest": pytest_result,
             "coverage": coverage,
             "timestamp": time.time()
-        }
+        })
 
         # 4. Report results
         self._report_results(task.task_id)
@@ -134,105 +200,245 @@ class TesterAgent(BaseAgent):
         if not pytest_result["passed"]:
             raise Exception(f"Dashboard tests failed: {pytest_result['failures']} failures")
 
-        print(f"[{self.agent_id}] ✓ Dashboard tests passed")
+        # A fast run only retried earlier failures, so it is no full green run
+        if not fast:
+            self._cache_results("dashboard", tree_hash, self.test_results[task.task_id])
 
-    def _test_integration(self, task: Task):
-        """Run integration tests (watch ↔ dashboard ↔ connectors)"""
-        print(f"[{self.agent_id}] Running integration tests...")
+        self.log.info("✓ Dashboard tests passed")
 
-        # 1. Test watch → dashboard communication
-        print(f"  → Testing watch → dashboard...")
-        watch_comm = self._test_watch_dashboard_comm()
+    async def _test_integration(self, task: Task):
+        """Run integration tests (watch ↔ dashboard ↔ connectors)"""
+        self.log.info("Running integration tests...")
 
-        # 2. Test dashboard → connectors
-        print(f"  → Testing dashboard → connectors...")
-        connector_test = self._test_connectors()
+        tree_hash = "-".join(self._tree_hash(path) for path in self.integration_paths)
+        if self._reuse_cached_results(task.task_id, "integration", tree_hash):
+            return
 
-        # 3. Test end-to-end flow
-        print(f"  → Testing end-to-end flow...")
-        e2e_result = self._test_end_to_end()
+        # 1. Run watch → dashboard, connector and end-to-end checks in one batch
+        checks = self._run_integration_checks()
 
-        # 4. Store results
-        self.test_results[task.task_id] = {
+        # 2. Store results
+        self._store_results(task.task_id, {
             "project": "integration",
-            "watch_communication": watch_comm,
-            "connectors": connector_test,
-            "end_to_end": e2e_result,
+            **checks,
             "timestamp": time.time()
-        }
+        })
 
         self._report_results(task.task_id)
 
-        print(f"[{self.agent_id}] ✓ Integration tests complete")
+        if all(result.get("passed") for result in checks.values()):
+            self._cache_results("integration", tree_hash, self.test_results[task.task_id])
+
+        self.log.info("✓ Integration tests complete")
+
+    async def _test_all(self, task: Task):
+        """
+        Run all test suites
 
-    def _test_all(self, task: Task):
-        """Run all test suites"""
-        print(f"[{self.agent_id}] Running all tests...")
+        The suites target different projects and share no state, so they run
+        concurrently; the first failure is raised once all of them finish.
+        """
+        self.log.info("Running all tests...")
 
-        # Test watch app
-        print(f"\n--- Watch App Tests ---")
         watch_task = Task(
             task_id=f"{task.task_id}-watch",
             workflow=task.workflow,
             description="Test watch app",
-            priority=task.priority
+            priority=task.priority,
+            assigned_at=time.time()
         )
-        self._test_watch_app(watch_task)
-
-        # Test dashboard
-        print(f"\n--- Dashboard Tests ---")
         dashboard_task = Task(
             task_id=f"{task.task_id}-dashboard",
             workflow=task.workflow,
             description="Test dashboard",
-            priority=task.priority
+            priority=task.priority,
+            assigned_at=time.time()
         )
-        self._test_dashboard(dashboard_task)
-
-        # Integration tests
-        print(f"\n--- Integration Tests ---")
         integration_task = Task(
             task_id=f"{task.task_id}-integration",
             workflow=task.workflow,
             description="Integration tests",
-            priority=task.priority
+            priority=task.priority,
+            assigned_at=time.time()
         )
-        self._test_integration(integration_task)
 
-        print(f"[{self.agent_id}] ✓ All tests complete")
+        self.log.info("--- Watch App, Dashboard and Integration Tests ---")
+        outcomes = await asyncio.gather(
+            self._test_watch_app(watch_task),
+            self._test_dashboard(dashboard_task),
+            self._test_integration(integration_task),
+            return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        self.log.info("✓ All tests complete")
+
+    def _store_results(self, task_id: str, results: Dict):
+        """Record a task's results as the newest entry, dropping the oldest past TEST_RESULTS_SIZE"""
+        self.test_results.pop(task_id, None)
+        self.test_results[task_id] = results
+        while len(self.test_results) > self.TEST_RESULTS_SIZE:
+            self.test_results.pop(next(iter(self.test_results)))
+
+    def _tree_hash(self, root: str) -> str:
+        """
+        Hash a project's source tree by file path, size and mtime
+
+        Any edit changes a file's mtime (and usually its size), so this is a
+        cheap stand-in for hashing contents: only one stat per source file.
+
+        Args:
+            root: Project directory
+
+        Returns:
+            Hex digest identifying the current state of the tree
+        """
+        entries = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in self.SKIP_DIRS]
+            for filename in filenames:
+                if filename.endswith(self.SOURCE_EXTENSIONS):
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append(f"{os.path.relpath(path, root)}\0{st.st_size}\0{st.st_mtime_ns}")
+
+        digest = hashlib.blake2b(digest_size=16)
+        for entry in sorted(entries):
+            digest.update(entry.encode())
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def _reuse_cached_results(self, task_id: str, project: str, tree_hash: str) -> bool:
+        """
+        Report a previous passing run's results if the source tree is unchanged
+
+        Returns:
+            True if cached results were reported (the suite need not run)
+        """
+        cached = self._result_cache.get(f"{project}:{tree_hash}")
+        if cached is None:
+            return False
+
+        self.log.info("  → Sources unchanged since a passing run, reusing its results")
+        self._store_results(task_id, {**cached, "cached": True, "timestamp": time.time()})
+        self._report_results(task_id)
+        return True
+
+    def _cache_results(self, project: str, tree_hash: str, results: Dict):
+        """Remember a passing run's results for this source tree and persist them"""
+        key = f"{project}:{tree_hash}"
+        self._result_cache.pop(key, None)
+        self._result_cache[key] = results
+        while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.pop(next(iter(self._result_cache)))
 
-    def _run_gradle_tests(self, test_task: str) -> Dict:
-        """Run Gradle test task"""
         try:
-            result = subprocess.run(
-                ["./gradlew", test_task],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
+            os.makedirs(TMP_DIR, exist_ok=True)
+            temp_path = f"{self._result_cache_path}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(dumps(self._result_cache))
+            os.replace(temp_path, self._result_cache_path)
+        except OSError as e:
+            self.log.warning("Could not save test result cache: %s", e)
+
+    def _load_result_cache(self) -> Dict[str, Dict]:
+        """Load the persisted result cache (empty if missing or unreadable)"""
+        try:
+            with open(self._result_cache_path, 'rb') as f:
+                return loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    async def _run_gradle_tests(self, test_task: str, cwd: str) -> Dict:
+        """
+        Run Gradle test task
+
+        Output is streamed: failures are counted (and the first one logged) as
+        they appear, and only the tail of the log is kept for the report.
+
+        Args:
+            test_task: Gradle task name
+            cwd: Gradle project directory
+        """
+        failures = 0
+
+        def on_line(line: str):
+            nonlocal failures
+            if self._is_gradle_failure(line):
+                if not failures:
+                    self.log.warning("  → First failure in %s: %s", test_task, line.strip())
+                failures += 1
+
+        try:
+            result = await self.stream_subprocess_async(
+                ["./gradlew", *self.GRADLE_FLAGS, test_task],
+                cwd=cwd,
+                timeout=300,  # 5 minute timeout
+                on_line=on_line
             )
 
             # Parse output for test results
             passed = result.returncode == 0
-            output_lines = result.stdout.split('\n')
 
             return {
                 "passed": passed,
                 "output": result.stdout,
-                "failures": 0 if passed else self._count_failures(result.stdout)
+                "failures": 0 if passed else failures
             }
         except subprocess.TimeoutExpired:
             return {"passed": False, "output": "Tests timed out", "failures": 1}
         except Exception as e:
             return {"passed": False, "output": str(e), "failures": 1}
 
-    def _run_pytest(self) -> Dict:
-        """Run pytest on dashboard"""
+    async def _run_pytest(self, cwd: str, fast: bool = False) -> Dict:
+        """
+        Run pytest on dashboard
+
+        Tests that failed last run go first (pytest keeps that in
+        .pytest_cache), so regressions surface early. Output is streamed as in
+        _run_gradle_tests().
+
+        Args:
+            cwd: Project directory to run pytest in
+            fast: Only rerun last run's failures (everything if there were none)
+        """
+        if fast:
+            selection = ["--last-failed", "--last-failed-no-failures=all"]
+        else:
+            selection = ["--failed-first"]
+
+        failures = 0
+        rerun: Optional[str] = None
+
+        def on_line(line: str):
+            nonlocal failures, rerun
+            if self._is_pytest_failure(line):
+                if not failures:
+                    self.log.warning("  → First pytest failure: %s", line.strip())
+                failures += 1
+            elif rerun is None:
+                match = self._RERUN_RE.match(line)
+                if match:
+                    rerun = match.group(1)
+
         try:
-            result = subprocess.run(
-                ["pytest", "--cov=app", "--cov-report=term"],
-                capture_output=True,
-                text=True,
-                timeout=300
+            result = await self.stream_subprocess_async(
+                [
+                    "pytest",
+                    *selection,
+                    "-n", str(self.PYTEST_WORKERS),
+                    "--dist=loadfile",  # Keep each module's tests (and fixtures) on one worker
+                    "--cov=app",
+                    "--cov-report=term",
+                ],
+                cwd=cwd,
+                timeout=300,
+                on_line=on_line
             )
 
             passed = result.returncode == 0
@@ -240,7 +446,8 @@ class TesterAgent(BaseAgent):
             return {
                 "passed": passed,
                 "output": result.stdout,
-                "failures": 0 if passed else self._count_pytest_failures(result.stdout)
+                "failures": 0 if passed else failures,
+                "rerun": rerun
             }
         except Exception as e:
             return {"passed": False, "output": str(e), "failures": 1}
@@ -257,41 +464,47 @@ class TesterAgent(BaseAgent):
         # For now, return a mock value
         return 82.5
 
-    def _count_failures(self, output: str) -> int:
-        """Count test failures from Gradle output"""
-        # Parse Gradle test output for failure count
-        failures = 0
-        for line in output.split('\n'):
-            if 'FAILED' in line:
-                failures += 1
-        return failures
+    def _is_gradle_failure(self, line: str) -> bool:
+        """Whether a line of Gradle output reports a test failure"""
+        return self._GRADLE_FAILURE_RE.search(line) is not None
 
-    def _count_pytest_failures(self, output: str) -> int:
-        """Count test failures from pytest output"""
-        # Parse pytest output for failure count
-        failures = 0
-        for line in output.split('\n'):
-            if 'FAILED' in line or 'ERROR' in line:
-                failures += 1
-        return failures
+    def _is_pytest_failure(self, line: str) -> bool:
+        """Whether a line of pytest output reports a failure or error"""
+        return self._PYTEST_FAILURE_RE.match(line) is not None
 
-    def _test_watch_dashboard_comm(self) -> Dict:
-        """Test watch ↔ dashboard communication"""
-        # Simulate API call from watch to dashboard
-        print(f"     Simulating watch message to dashboard...")
-        return {"passed": True, "latency_ms": 150}
+    def _run_integration_checks(self) -> Dict[str, Dict]:
+        """
+        Run the integration checks as a single batch
 
-    def _test_connectors(self) -> Dict:
-        """Test connector integrations"""
-        print(f"     Testing Slack connector...")
-        print(f"     Testing Email connector...")
-        print(f"     Testing Google Sheets connector...")
-        return {"passed": True, "connectors_tested": 3}
+        The checks share one setup (and, once wired to real harnesses, one set
+        of connector clients) instead of each paying for its own.
 
-    def _test_end_to_end(self) -> Dict:
-        """Test full end-to-end flow"""
-        print(f"     Testing watch → dashboard → Slack flow...")
-        return {"passed": True, "total_latency_ms": 450}
+        Returns:
+            Results keyed by "watch_communication", "connectors" and "end_to_end"
+        """
+        # Test watch ↔ dashboard communication
+        self.log.info("  → Testing watch → dashboard...")
+        # Simulate API call from watch to dashboard
+        self.log.info("     Simulating watch message to dashboard...")
+        watch_comm = {"passed": True, "latency_ms": 150}
+
+        # Test connector integrations
+        self.log.info("  → Testing dashboard → connectors...")
+        self.log.info("     Testing Slack connector...")
+        self.log.info("     Testing Email connector...")
+        self.log.info("     Testing Google Sheets connector...")
+        connector_test = {"passed": True, "connectors_tested": 3}
+
+        # Test full end-to-end flow
+        self.log.info("  → Testing end-to-end flow...")
+        self.log.info("     Testing watch → dashboard → Slack flow...")
+        e2e_result = {"passed": True, "total_latency_ms": 450}
+
+        return {
+            "watch_communication": watch_comm,
+            "connectors": connector_test,
+            "end_to_end": e2e_result
+        }
 
     def _report_results(self, task_id: str):
         """Report test results to context store and coordinator"""
@@ -299,12 +512,12 @@ class TesterAgent(BaseAgent):
         if not results:
             return
 
-        print(f"\n[{self.agent_id}] === Test Results ===")
-        print(f"Project: {results.get('project', 'N/A')}")
+        self.log.info("=== Test Results ===")
+        self.log.info("Project: %s", results.get('project', 'N/A'))
 
         # Report coverage if available
         if 'coverage' in results:
-            print(f"Coverage: {results['coverage']:.1f}%")
+            self.log.info("Coverage: %.1f%%", results['coverage'])
 
         # Report to context store
         self.context_store.set_context(
@@ -312,6 +525,16 @@ class TesterAgent(BaseAgent):
             results
         )
 
+        # Publish as the project's latest results and tell every agent, so
+        # caches of "no results yet" (see DeployerAgent) are dropped
+        project = results.get('project')
+        if project:
+            self.context_store.set_context(f"test_results.latest.{project}", results)
+            self.broadcast(
+                message_type=MessageType.BROADCAST,
+                payload={"status": "tests_complete", "task_id": task_id, "project": project}
+            )
+
         # Notify coordinator
         self.send_message(
             to_agent="coordinator-1",
@@ -4,20 +4,38 @@ FastAPI Dashboard - API for agent swarm interaction
 This is the backend that your Lovable dashboard will communicate with.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Dict, List
 import asyncio
+import functools
+import hashlib
+import itertools
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime
+from itertools import islice
 import json
+import re
 import anthropic
+import httpx
+
+# Render endpoint responses with orjson when it is installed
+try:
+    import orjson  # noqa: F401 - required by ORJSONResponse
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
 
 # Import agents
 # Using absolute imports for Railway compatibility
 try:
     from dashboard.app.agents.coordinator import CoordinatorAgent
-    from dashboard.app.agents.gemini_agent import GeminiAgent
+    from dashboard.app.agents.gemini_agent import GeminiAgent, clear_gemini_agents, get_gemini_agent
     # from dashboard.app.agents.developer_agent import DeveloperAgent
     # from dashboard.app.agents.tester_agent import TesterAgent
     # from dashboard.app.agents.deployer_agent import DeployerAgent
@@ -25,7 +43,7 @@ try:
 except ImportError:
     # Fallback for local development
     from app.agents.coordinator import CoordinatorAgent
-    from app.agents.gemini_agent import GeminiAgent
+    from app.agents.gemini_agent import GeminiAgent, clear_gemini_agents, get_gemini_agent
     # from app.agents.developer_agent import DeveloperAgent
     # from app.agents.tester_agent import TesterAgent
     # from app.agents.deployer_agent import DeployerAgent
@@ -40,8 +58,21 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools'))
 from connectors.google_calendar import get_calendar_client, parse_calendar_command
 from connectors.slack_client import get_slack_client
 from core.agent_registry import Task
+from core.logging_setup import get_logger
+from core.serialization import dumps, strip_code_fence
+
+log = get_logger("api")
+
 
-app = FastAPI(title="Agent Swarm Dashboard API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the swarm before the first request and shut it down on exit"""
+    await startup_event()
+    yield
+    await shutdown_event()
+
+
+app = FastAPI(title="Agent Swarm Dashboard API", default_response_class=DefaultResponse, lifespan=lifespan)
 
 # CORS for Lovable dashboard
 app.add_middleware(
@@ -55,9 +86,118 @@ app.add_middleware(
 # Global agent instances (initialized on startup)
 coordinator: Optional[CoordinatorAgent] = None
 gemini_agent: Optional[GeminiAgent] = None
-claude_client: Optional[anthropic.Anthropic] = None
+claude_client: Optional[anthropic.AsyncAnthropic] = None
 agents: Dict[str, any] = {}
 
+# Saved contexts as returned by /api/saved-contexts, newest first; built from
+# the store on first read, then kept current by handle_context_intent
+saved_contexts_index: Optional[deque] = None
+
+# (watch_config_version, serialized body, ETag) of the /functions/v1/watch-config
+# response; every write through set_watch_config() bumps the version
+watch_config_cache: Optional[tuple] = None
+watch_config_version = 0
+watch_config_lock = threading.Lock()  # Serializes writers (some run in worker threads)
+
+# Serialized /api/agents response and the registry snapshot it was built from
+agents_response_cache: Optional[tuple] = None
+
+# (time.monotonic() when built, serialized body) of /api/system/stats, rebuilt
+# once it is older than STATS_MAX_AGE seconds
+STATS_MAX_AGE = 2.0
+stats_response_cache: Optional[tuple] = None
+
+# Ingress queue in front of the coordinator: /api/tasks and /api/watch-message
+# only enqueue, and INGRESS_WORKERS background tasks route what is queued.
+# Entries are (rank, sequence, description, priority), so urgent work goes
+# first and equal priorities keep arrival order. Once INGRESS_QUEUE_LIMIT
+# tasks are waiting, new ones are refused with 503 instead of piling up
+INGRESS_QUEUE_LIMIT = 1024
+INGRESS_WORKERS = 4
+
+# A worker that picks up a task waits INGRESS_BATCH_WINDOW seconds for more to
+# arrive, then routes up to INGRESS_BATCH_SIZE of them in one coordinator call
+INGRESS_BATCH_WINDOW = 0.05
+INGRESS_BATCH_SIZE = 32
+INGRESS_RANK = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
+ingress_queue: Optional[asyncio.PriorityQueue] = None
+ingress_workers: List[asyncio.Task] = []
+_ingress_seq = itertools.count()
+
+# Task IDs: a per-process random prefix plus a counter, unique without
+# reading the clock (and free of the "." a float timestamp put in them)
+_id_prefix = secrets.token_hex(3)
+_id_counter = itertools.count(1)
+
+
+def next_task_id(kind: str) -> str:
+    """New ID such as "task_1a2b3c_7" for a task of the given kind"""
+    return f"{kind}_{_id_prefix}_{next(_id_counter)}"
+
+
+# (second, formatted) for now_iso(); swapped as one tuple so readers on other
+# threads never see a second paired with another second's string
+_now_iso_cache = (0, "")
+
+
+def now_iso() -> str:
+    """
+    Current local time in ISO 8601, to the second, for response timestamps
+
+    Formatted once per second rather than on every request.
+    """
+    global _now_iso_cache
+    second = int(time.time())
+    cached = _now_iso_cache
+    if cached[0] != second:
+        cached = _now_iso_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return cached[1]
+
+
+def enqueue_task(description: str, priority: str = "normal") -> bool:
+    """
+    Queue a task for routing by the ingress workers
+
+    Args:
+        description: Task description
+        priority: Task priority (urgent, high, normal, low)
+
+    Returns:
+        False if the ingress queue is full (or not started yet)
+    """
+    if ingress_queue is None:
+        return False
+    try:
+        ingress_queue.put_nowait((INGRESS_RANK.get(priority, 2), next(_ingress_seq), description, priority))
+    except asyncio.QueueFull:
+        log.warning("⚠️  Ingress queue full, refusing task: %s", description)
+        return False
+    return True
+
+
+async def ingress_worker():
+    """Route queued tasks through the coordinator in micro-batches"""
+    while True:
+        batch = [await ingress_queue.get()]
+        await asyncio.sleep(INGRESS_BATCH_WINDOW)
+        while len(batch) < INGRESS_BATCH_SIZE:
+            try:
+                batch.append(ingress_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        try:
+            # Routing reads and writes the context store, so it runs in a thread
+            await asyncio.to_thread(
+                coordinator.route_batch,
+                [{"description": description, "priority": priority} for _, _, description, priority in batch]
+            )
+        except Exception as e:
+            log.error("Error routing queued tasks: %s", e)
+        finally:
+            for _ in batch:
+                ingress_queue.task_done()
+
 
 # Request/Response Models
 class TaskRequest(BaseModel):
@@ -87,6 +227,14 @@ class WatchMessageRequest(BaseModel):
 
 
 # Watch App Data Models (for Supabase-compatible endpoints)
+class ConnectorPostRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    connector: str = "twitter"
+    content: str = ""
+    media: Optional[List[str]] = None
+
+
 class WatchConfig(BaseModel):
     status: str
     animation_url: str
@@ -102,68 +250,145 @@ class ChatResponse(BaseModel):
     action: Optional[str] = None
 
 
+def set_watch_config(path: str, value):
+    """
+    Write the watch config (or a field of it, e.g. "watch.config.status")
+
+    Also invalidates the cached watch-config response, so the watch sees the
+    change on its next poll. Writing the whole config replaces the cached
+    response outright, sparing that poll the store read and rebuild.
+    """
+    global watch_config_cache, watch_config_version
+    with watch_config_lock:
+        coordinator.context_store.set_context(path, value)
+        watch_config_version += 1
+        if path == "watch.config":
+            watch_config_cache = _watch_config_entry(watch_config_version, value)
+
+
+def _watch_config_entry(version: int, config: Dict) -> tuple:
+    """
+    Build a watch_config_cache entry for a config
+
+    The ETag hashes the body rather than using the version, which restarts
+    from zero with the process and could match a stale client copy.
+    """
+    body = dumps(WatchConfig(**config).dict())
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    return (version, body, etag)
+
+
 def get_or_create_gemini_agent():
     """Lazy initialization of Gemini agent to avoid startup hang"""
     global gemini_agent
     if gemini_agent is None and os.getenv("GOOGLE_API_KEY"):
         try:
-            print("⚙️  Initializing Gemini agent on first use...")
-            gemini_agent = GeminiAgent()
-            gemini_agent.startup()
+            log.info("⚙️  Initializing Gemini agent on first use...")
+            gemini_agent = get_gemini_agent()
             agents["gemini_deployer"] = gemini_agent
-            print("✓ Gemini deployment agent ready")
+            log.info("✓ Gemini deployment agent ready")
         except Exception as e:
-            print(f"⚠️  Gemini agent initialization failed: {e}")
+            log.warning("⚠️  Gemini agent initialization failed: %s", e)
             return None
     return gemini_agent
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize all agents on startup"""
-    global coordinator, gemini_agent, claude_client, agents
+def start_coordinator():
+    """Create and start the coordinator, then seed the default watch config"""
+    global coordinator
 
-    print("🚀 Starting Agent Swarm...")
-
-    # Start coordinator
     coordinator = CoordinatorAgent()
     coordinator.startup()
     agents["coordinator"] = coordinator
 
+    # Initialize default watch config
+    set_watch_config("watch.config", {
+        "status": "Agent Swarm Online",
+        "animation_url": "https://lottie.host/4e6fbdae-9e0c-4b6f-915d-d3e9b8b8c8a8/TbWqGjFQCE.json",  # Default Lottie animation
+        "primary_color": "#9333EA"  # Purple
+    })
+
+
+def prewarm_slack_client():
+    """
+    Create the Slack client now rather than on the first watch request
+
+    The calendar client stays lazy: without a saved token it would start an
+    interactive OAuth flow.
+    """
+    if not os.getenv("SLACK_BOT_TOKEN"):
+        return
+    try:
+        get_slack_client()
+        log.info("✓ Slack client initialized")
+    except Exception as e:
+        log.warning("⚠️  Slack client initialization failed: %s", e)
+
+
+async def startup_event():
+    """Initialize all agents on startup"""
+    global gemini_agent, claude_client, ingress_queue
+
+    log.info("🚀 Starting Agent Swarm...")
+
     # Initialize Claude API client for enhanced reasoning
     try:
         claude_api_key = os.getenv("ANTHROPIC_API_KEY")
         if claude_api_key:
-            claude_client = anthropic.Anthropic(api_key=claude_api_key)
-            print("✓ Claude API client initialized")
+            # Async, so Claude calls don't block the event loop; one pooled
+            # HTTP client keeps connections to the API alive between requests
+            claude_client = anthropic.AsyncAnthropic(
+                api_key=claude_api_key,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    timeout=httpx.Timeout(60.0, connect=5.0)
+                )
+            )
+            log.info("✓ Claude API client initialized")
         else:
-            print("⚠️  ANTHROPIC_API_KEY not set - advanced reasoning disabled")
+            log.warning("⚠️  ANTHROPIC_API_KEY not set - advanced reasoning disabled")
     except Exception as e:
-        print(f"⚠️  Claude API initialization failed: {e}")
+        log.warning("⚠️  Claude API initialization failed: %s", e)
 
     # Initialize Gemini deployment agent (lazy initialization to avoid blocking)
     try:
         if os.getenv("GOOGLE_API_KEY"):
-            print("⚙️  Gemini agent will initialize on first use...")
+            log.info("⚙️  Gemini agent will initialize on first use...")
             # Don't initialize now - will be created on-demand to avoid startup hang
             gemini_agent = None  # Lazy initialization
         else:
-            print("⚠️  GOOGLE_API_KEY not set - deployment agent disabled")
+            log.warning("⚠️  GOOGLE_API_KEY not set - deployment agent disabled")
             gemini_agent = None
     except Exception as e:
-        print(f"⚠️  Gemini agent initialization failed: {e}")
+        log.warning("⚠️  Gemini agent initialization failed: %s", e)
         gemini_agent = None
 
-    # Initialize default watch config
-    coordinator.context_store.set_context("watch.config", {
-        "status": "Agent Swarm Online",
-        "animation_url": "https://lottie.host/4e6fbdae-9e0c-4b6f-915d-d3e9b8b8c8a8/TbWqGjFQCE.json",  # Default Lottie animation
-        "primary_color": "#9333EA"  # Purple
-    })
+    # Coordinator and Slack client are independent, so they start side by
+    # side in worker threads instead of one after the other
+    await asyncio.gather(
+        asyncio.to_thread(start_coordinator),
+        asyncio.to_thread(prewarm_slack_client)
+    )
+
+    # Start the workers that feed the coordinator from the ingress queue
+    ingress_queue = asyncio.PriorityQueue(maxsize=INGRESS_QUEUE_LIMIT)
+    ingress_workers.extend(asyncio.create_task(ingress_worker()) for _ in range(INGRESS_WORKERS))
+
+    log.info("✓ Coordinator ready")
+    log.info("✓ Watch config initialized")
+    log.info("🤖 Agent Swarm Online!")
+
 
-    print("✓ Coordinator ready")
-    print("✓ Watch config initialized")
-    print("🤖 Agent Swarm Online!")
+async def shutdown_event():
+    """Stop the ingress workers and Gemini agents, and close the Claude API client's pooled connections"""
+    for worker in ingress_workers:
+        worker.cancel()
+    ingress_workers.clear()
+
+    clear_gemini_agents()
+
+    if claude_client is not None:
+        await claude_client.close()
 
 
 @app.get("/")
@@ -172,7 +397,7 @@ async def root():
     return {
         "status": "online",
         "service": "Agent Swarm Dashboard API",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "agents": len(agents)
     }
 
@@ -195,60 +420,62 @@ async def health_check():
     }
 
 
-@app.post("/api/tasks", response_model=TaskResponse)
+@app.post("/api/tasks", response_model=TaskResponse, status_code=202)
 async def create_task(task: TaskRequest):
     """
     Create a new task for the agent swarm
 
-    This is the main endpoint your Lovable dashboard will call!
+    This is the main endpoint your Lovable dashboard will call! The task is
+    queued and routed by the ingress workers after the reply is sent.
     """
     if not coordinator:
         raise HTTPException(status_code=503, detail="Coordinator not initialized")
 
-    print(f"📋 New task received: {task.description}")
-
-    # Route task through coordinator
-    success = coordinator.route_incoming_task(
-        task_description=task.description,
-        priority=task.priority
-    )
+    log.info("📋 New task received: %s", task.description)
 
-    if success:
-        return TaskResponse(
-            task_id=f"task_{datetime.now().timestamp()}",
-            status="assigned",
-            message=f"Task routed successfully to agent swarm"
-        )
-    else:
+    if not enqueue_task(task.description, task.priority):
         raise HTTPException(
             status_code=503,
-            detail="No agents available. Task queued for later."
+            detail="Task queue full. Try again later."
         )
 
+    # Serialized directly; the response model only documents the shape
+    return Response(content=dumps({
+        "task_id": next_task_id("task"),
+        "status": "queued",
+        "message": "Task queued for the agent swarm"
+    }), status_code=202, media_type="application/json")
+
 
 @app.get("/api/agents")
 async def list_agents():
     """Get all active agents and their status"""
+    global agents_response_cache
+
     if not coordinator:
         raise HTTPException(status_code=503, detail="Coordinator not initialized")
 
-    agents_list = coordinator.registry.get_active_agents()
-
-    return {
-        "total": len(agents_list),
-        "agents": [
-            {
-                "agent_id": agent.agent_id,
-                "role": agent.role,
-                "status": agent.status.value,
-                "current_tasks": len(agent.current_tasks),
-                "completed_tasks": agent.completed_tasks,
-                "failed_tasks": agent.failed_tasks,
-                "capabilities": agent.capabilities
-            }
-            for agent in agents_list
-        ]
-    }
+    # The registry publishes a new snapshot on every change, so the response
+    # is rebuilt only when the snapshot object differs from the cached one
+    agents_list = coordinator.registry.get_snapshot()
+    if agents_response_cache is None or agents_response_cache[0] is not agents_list:
+        agents_response_cache = (agents_list, dumps({
+            "total": len(agents_list),
+            "agents": [
+                {
+                    "agent_id": agent.agent_id,
+                    "role": agent.role,
+                    "status": agent.status.value,
+                    "current_tasks": len(agent.current_tasks),
+                    "completed_tasks": agent.completed_tasks,
+                    "failed_tasks": agent.failed_tasks,
+                    "capabilities": agent.capabilities
+                }
+                for agent in agents_list
+            ]
+        }))
+
+    return Response(content=agents_response_cache[1], media_type="application/json")
 
 
 @app.get("/api/agents/{agent_id}")
@@ -265,33 +492,31 @@ async def get_agent_status(agent_id: str):
     return status
 
 
-@app.post("/api/watch-message")
+@app.post("/api/watch-message", status_code=202)
 async def receive_watch_message(message: WatchMessageRequest):
     """
     Receive message from Galaxy Watch
 
-    This is called when your watch sends a voice message
+    This is called when your watch sends a voice message. The reply does not
+    wait for routing: the message is queued ahead of normal-priority tasks.
     """
-    print(f"⌚ Watch message: {message.message}")
+    log.info("⌚ Watch message: %s", message.message)
 
     # Create task to process the message
-    if coordinator:
-        coordinator.route_incoming_task(
-            task_description=f"Process watch message: {message.message}",
-            priority="high"
-        )
+    if coordinator and not enqueue_task(f"Process watch message: {message.message}", "high"):
+        raise HTTPException(status_code=503, detail="Task queue full. Try again later.")
 
     return {
         "status": "received",
         "message": "Watch message queued for processing",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 
-@app.post("/api/connectors/post")
-async def post_to_connector(data: Dict):
+@app.post("/api/connectors/post", status_code=202)
+async def post_to_connector(data: ConnectorPostRequest, background_tasks: BackgroundTasks):
     """
-    Post to social media or other connectors
+    Post to social media or other connectors (routed in the background)
 
     Example:
     {
@@ -300,14 +525,15 @@ async def post_to_connector(data: Dict):
         "media": []
     }
     """
-    connector = data.get("connector", "twitter")
-    content = data.get("content", "")
+    connector = data.connector
+    content = data.content
 
-    print(f"📱 Posting to {connector}: {content}")
+    log.info("📱 Posting to %s: %s", connector, content)
 
     # Route to data processor agent
     if coordinator:
-        coordinator.route_incoming_task(
+        background_tasks.add_task(
+            coordinator.route_incoming_task,
             task_description=f"Post to {connector}: {content}",
             priority="normal"
         )
@@ -315,25 +541,41 @@ async def post_to_connector(data: Dict):
     return {
         "status": "posted",
         "connector": connector,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 
 @app.get("/api/system/stats")
 async def get_system_stats():
-    """Get system-wide statistics"""
+    """
+    Get system-wide statistics
+
+    Served from a cache up to STATS_MAX_AGE seconds old; a stale cache is
+    rebuilt in a worker thread, since snapshotting the context store copies
+    all of it.
+    """
+    global stats_response_cache
+
     if not coordinator:
         raise HTTPException(status_code=503, detail="Coordinator not initialized")
 
+    if stats_response_cache is None or time.monotonic() - stats_response_cache[0] > STATS_MAX_AGE:
+        stats_response_cache = (time.monotonic(), await asyncio.to_thread(_build_system_stats))
+
+    return Response(content=stats_response_cache[1], media_type="application/json")
+
+
+def _build_system_stats() -> bytes:
+    """Collect and serialize the /api/system/stats response"""
     stats = coordinator.registry.get_system_stats()
     context = coordinator.context_store.snapshot_context()
 
-    return {
+    return dumps({
         "agents": stats,
         "projects": context.get("projects", {}),
         "workflows": context.get("workflows", {}),
         "metrics": context.get("metrics", {})
-    }
+    })
 
 
 # ============================================================================
@@ -341,61 +583,82 @@ async def get_system_stats():
 # ============================================================================
 
 @app.get("/functions/v1/watch-config")
-async def get_watch_config():
+async def get_watch_config(if_none_match: Optional[str] = Header(None)):
     """
     Polled by watch app every 3 seconds to get current configuration
     Agents can update this to change watch appearance/status
+
+    Responses carry an ETag. A poll sending it back in If-None-Match gets an
+    empty 304 until the config changes; "Cache-Control: no-cache" makes HTTP
+    caches (browser, OkHttp) revalidate on every poll this way.
     """
+    global watch_config_cache
+
     if not coordinator:
         raise HTTPException(status_code=503, detail="Coordinator not initialized")
 
-    # Get current config from context store
-    config = coordinator.context_store.get_context("watch.config", {
-        "status": "Connecting...",
-        "animation_url": "",
-        "primary_color": "#FFFFFF"
-    })
+    # Serve the cached response until the config is written again
+    if watch_config_cache is None or watch_config_cache[0] != watch_config_version:
+        version = watch_config_version
 
-    return WatchConfig(**config)
+        # Get current config from context store
+        config = coordinator.context_store.get_context("watch.config", {
+            "status": "Connecting...",
+            "animation_url": "",
+            "primary_color": "#FFFFFF"
+        })
+
+        watch_config_cache = _watch_config_entry(version, config)
+
+    _, body, etag = watch_config_cache
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match is not None and etag in if_none_match:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 # ============================================================================
 # INTENT PARSING & DEMO HANDLERS
 # ============================================================================
 
-def parse_intent(message: str) -> dict:
-    """Simple keyword-based intent parser for demo features"""
-    message_lower = message.lower()
+# Intent keywords, matched anywhere in the message (substrings, as before) in
+# a single pass; one named group per intent
+_INTENT_RE = re.compile(
+    r"(?=(?P<deploy_code>deploy|build|push|release|update code|modify|add feature|fix bug)"
+    r"|(?P<calendar>schedule|meeting|calendar|book|appointment)"
+    r"|(?P<slack>slack|brief|summary|report)"
+    r"|(?P<save_context>save context|remember|note|record))",
+    re.IGNORECASE
+)
 
-    # Deployment intent (NEW - for Gemini agent)
-    if any(word in message_lower for word in ["deploy", "build", "push", "release", "update code", "modify", "add feature", "fix bug"]):
-        return {
-            "intent": "deploy_code",
-            "original_message": message
-        }
+# When a message matches several intents, the first of these wins
+_INTENT_PRIORITY = ("deploy_code", "calendar", "slack", "save_context")
 
-    # Calendar intent
-    if any(word in message_lower for word in ["schedule", "meeting", "calendar", "book", "appointment"]):
-        return {
-            "intent": "calendar",
-            "original_message": message
-        }
 
-    # Slack intent
-    if any(word in message_lower for word in ["slack", "brief", "summary", "report"]):
-        return {
-            "intent": "slack",
-            "original_message": message
-        }
+@functools.lru_cache(maxsize=1024)
+def _match_intent(message: str) -> str:
+    """
+    Name the intent a message's keywords select ("unknown" if none)
 
-    # Context saving intent
-    if any(word in message_lower for word in ["save context", "remember", "note", "record"]):
-        return {
-            "intent": "save_context",
-            "original_message": message
-        }
+    Cached: watch commands repeat often ("send daily brief"), and the result
+    depends on the message alone.
+    """
+    intents = {match.lastgroup for match in _INTENT_RE.finditer(message)}
 
-    return {"intent": "unknown", "original_message": message}
+    # Deployment intent (NEW - for Gemini agent) first, then calendar, Slack
+    # and context saving
+    for intent in _INTENT_PRIORITY:
+        if intent in intents:
+            return intent
+
+    return "unknown"
+
+
+def parse_intent(message: str) -> dict:
+    """Simple keyword-based intent parser for demo features"""
+    # A fresh dict per call, so a caller modifying it cannot corrupt the cache
+    return {"intent": _match_intent(message), "original_message": message}
 
 
 async def process_with_claude_api(message: str, context: dict) -> dict:
@@ -420,7 +683,7 @@ Available capabilities:
 - Web scraping and data processing
 
 Current system context:
-- Recent deployments: {len(context.get('deployments', []))}
+- Recent deployments: {context.get('deployment_count', 0)}
 - Saved contexts: {len(context.get('saved_contexts', {}))}
 - Active agents: {context.get('active_agents', [])}
 
@@ -433,7 +696,7 @@ Analyze the user's command and return a JSON action plan with:
   "reasoning": "why you chose this interpretation"
 }}"""
 
-        response = claude_client.messages.create(
+        response = await claude_client.messages.create(
             model="claude-sonnet-4-5-20250929",
             max_tokens=1024,
             system=system_prompt,
@@ -447,20 +710,17 @@ Analyze the user's command and return a JSON action plan with:
         response_text = response.content[0].text
 
         # Extract JSON (handle markdown code blocks)
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
+        response_text = strip_code_fence(response_text)
 
         action_plan = json.loads(response_text)
         action_plan["original_message"] = message
 
-        print(f"🤖 Claude API reasoning: {action_plan.get('reasoning', 'N/A')}")
+        log.info("🤖 Claude API reasoning: %s", action_plan.get('reasoning', 'N/A'))
 
         return action_plan
 
     except Exception as e:
-        print(f"⚠️  Claude API error: {e}")
+        log.warning("⚠️  Claude API error: %s", e)
         # Fallback to simple intent parsing
         return parse_intent(message)
 
@@ -468,31 +728,37 @@ Analyze the user's command and return a JSON action plan with:
 async def handle_calendar_intent(message: str):
     """Handle calendar booking from voice command"""
     try:
-        print(f"📅 Calendar intent: {message}")
+        log.info("📅 Calendar intent: %s", message)
 
         # Parse the command
         event_details = parse_calendar_command(message)
 
         # Create the event
-        calendar_client = get_calendar_client()
-        event_link = calendar_client.create_event(
+        # Client construction and the API call block on the network (and the
+        # store write on disk), so they run in a worker thread
+        calendar_client = await asyncio.to_thread(get_calendar_client)
+        event_link = await asyncio.to_thread(
+            calendar_client.create_event,
             summary=event_details["title"],
             start_time=event_details["start_time"],
             duration_minutes=event_details["duration"]
         )
 
         # Update watch status
-        coordinator.context_store.set_context("watch.config.status", f"✓ Event created: {event_details['title']}")
+        await asyncio.to_thread(
+            set_watch_config,
+            "watch.config.status", f"✓ Event created: {event_details['title']}"
+        )
 
-        print(f"✅ Calendar event created: {event_details['title']} at {event_details['start_time']}")
+        log.info("✅ Calendar event created: %s at %s", event_details['title'], event_details['start_time'])
 
         return {
             "reply_text": f"Calendar event created: {event_details['title']}",
             "action": "calendar_created"
         }
     except Exception as e:
-        print(f"❌ Calendar error: {e}")
-        coordinator.context_store.set_context("watch.config.status", "✗ Calendar error")
+        log.error("❌ Calendar error: %s", e)
+        await asyncio.to_thread(set_watch_config, "watch.config.status", "✗ Calendar error")
         return {
             "reply_text": "Failed to create calendar event. Check Google Calendar setup.",
             "action": "calendar_error"
@@ -502,24 +768,25 @@ async def handle_calendar_intent(message: str):
 async def handle_slack_intent(message: str):
     """Handle Slack posting from voice command"""
     try:
-        print(f"💬 Slack intent: {message}")
+        log.info("💬 Slack intent: %s", message)
 
         # Send daily brief
+        # Off the event loop, like the calendar call above
         slack_client = get_slack_client()
-        slack_client.send_daily_brief()
+        await asyncio.to_thread(slack_client.send_daily_brief)
 
         # Update watch status
-        coordinator.context_store.set_context("watch.config.status", "✓ Slack brief sent")
+        await asyncio.to_thread(set_watch_config, "watch.config.status", "✓ Slack brief sent")
 
-        print(f"✅ Slack brief sent successfully")
+        log.info("✅ Slack brief sent successfully")
 
         return {
             "reply_text": "Daily brief sent to Slack!",
             "action": "slack_posted"
         }
     except Exception as e:
-        print(f"❌ Slack error: {e}")
-        coordinator.context_store.set_context("watch.config.status", "✗ Slack error")
+        log.error("❌ Slack error: %s", e)
+        await asyncio.to_thread(set_watch_config, "watch.config.status", "✗ Slack error")
         return {
             "reply_text": "Failed to send Slack message. Check SLACK_BOT_TOKEN.",
             "action": "slack_error"
@@ -533,24 +800,30 @@ async def handle_context_intent(message: str):
         context_text = message.replace("save context:", "").replace("Save context:", "").strip()
 
         # Store in context store with timestamp
-        context_id = f"context_{datetime.now().timestamp()}"
-        coordinator.context_store.set_context(f"saved_contexts.{context_id}", {
+        # No "." in the ID: it is a segment of the dot-notation context path
+        context_id = f"context_{time.time_ns()}"
+        context_data = {
             "text": context_text,
             "timestamp": datetime.now().isoformat(),
             "source": "watch_voice_command"
-        })
+        }
+        coordinator.context_store.set_context(f"saved_contexts.{context_id}", context_data)
+
+        # Contexts are only ever added, and each is the newest so far
+        if saved_contexts_index is not None:
+            saved_contexts_index.appendleft({"id": context_id, **context_data})
 
         # Update watch status
-        coordinator.context_store.set_context("watch.config.status", "✓ Context saved")
+        set_watch_config("watch.config.status", "✓ Context saved")
 
-        print(f"💾 Context saved: {context_text[:50]}...")
+        log.info("💾 Context saved: %s...", context_text[:50])
 
         return {
             "reply_text": "Context saved successfully!",
             "action": "context_saved"
         }
     except Exception as e:
-        print(f"Context save error: {e}")
+        log.error("Context save error: %s", e)
         return {
             "reply_text": "Failed to save context",
             "action": "context_error"
@@ -572,27 +845,27 @@ async def handle_deployment_intent(message: str, action_plan: dict = None):
                 "action": "deployment_unavailable"
             }
 
-        print(f"🚀 Deployment intent: {message}")
+        log.info("🚀 Deployment intent: %s", message)
 
         # Update watch status
-        coordinator.context_store.set_context("watch.config.status", "🚀 Planning deployment...")
+        set_watch_config("watch.config.status", "🚀 Planning deployment...")
 
         # Create deployment task
         task = Task(
-            task_id=f"deploy_{datetime.now().timestamp()}",
+            task_id=next_task_id("deploy"),
             workflow="deployment/autonomous_deploy.md",
             description=action_plan.get('task_description', message) if action_plan else message,
             priority="high",
-            assigned_at=datetime.now().isoformat()
+            assigned_at=time.time()
         )
 
         # Execute via Gemini agent (async)
         agent.execute_task(task)
 
         # Update watch status
-        coordinator.context_store.set_context("watch.config.status", "⚙️ Deploying...")
+        set_watch_config("watch.config.status", "⚙️ Deploying...")
 
-        print(f"✅ Deployment task submitted to Gemini agent")
+        log.info("✅ Deployment task submitted to Gemini agent")
 
         return {
             "reply_text": "Deployment started! Gemini agent is analyzing and deploying.",
@@ -601,8 +874,8 @@ async def handle_deployment_intent(message: str, action_plan: dict = None):
         }
 
     except Exception as e:
-        print(f"❌ Deployment error: {e}")
-        coordinator.context_store.set_context("watch.config.status", "✗ Deployment error")
+        log.error("❌ Deployment error: %s", e)
+        set_watch_config("watch.config.status", "✗ Deployment error")
         return {
             "reply_text": f"Deployment failed: {str(e)}",
             "action": "deployment_error"
@@ -621,26 +894,26 @@ async def receive_chat(request: ChatRequest):
     if not coordinator:
         raise HTTPException(status_code=503, detail="Coordinator not initialized")
 
-    print(f"⌚ Watch message: {request.message}")
+    log.info("⌚ Watch message: %s", request.message)
 
     # Get system context for Claude API
     context = {
-        "deployments": coordinator.context_store.get_context("deployments", []),
+        "deployment_count": coordinator.context_store.log_length("deployments"),
         "saved_contexts": coordinator.context_store.get_context("saved_contexts", {}),
         "active_agents": [a for a in agents.keys()]
     }
 
     # Use Claude API for enhanced reasoning (if available)
     if claude_client:
-        print("🤖 Using Claude API for intent analysis...")
+        log.info("🤖 Using Claude API for intent analysis...")
         intent_data = await process_with_claude_api(request.message, context)
     else:
         # Fallback to simple keyword matching
-        print("🔍 Using keyword-based intent parsing...")
+        log.info("🔍 Using keyword-based intent parsing...")
         intent_data = parse_intent(request.message)
 
     intent = intent_data["intent"]
-    print(f"🎯 Detected intent: {intent} (confidence: {intent_data.get('confidence', 'N/A')})")
+    log.info("🎯 Detected intent: %s (confidence: %s)", intent, intent_data.get('confidence', 'N/A'))
 
     # Route to appropriate handler
     if intent == "deploy_code":
@@ -655,7 +928,8 @@ async def receive_chat(request: ChatRequest):
     else:
         # Unknown intent - fallback to coordinator routing
         coordinator.context_store.update_context("watch.config.status", "Processing message...")
-        success = coordinator.route_incoming_task(
+        success = await asyncio.to_thread(
+            coordinator.route_incoming_task,
             task_description=f"Process watch message: {request.message}",
             priority="high"
         )
@@ -675,26 +949,40 @@ async def receive_chat(request: ChatRequest):
 
 
 @app.get("/api/saved-contexts")
-async def get_saved_contexts():
-    """Get all saved contexts for display in dashboard"""
+async def get_saved_contexts(limit: Optional[int] = None, offset: int = 0):
+    """
+    Get saved contexts (newest first) for display in dashboard
+
+    Args:
+        limit: Maximum number of contexts to return (all by default)
+        offset: Number of newest contexts to skip
+    """
+    global saved_contexts_index
+
     if not coordinator:
         raise HTTPException(status_code=503, detail="Coordinator not initialized")
 
-    contexts_data = coordinator.context_store.get_context("saved_contexts", {})
+    if saved_contexts_index is None:
+        contexts_data = coordinator.context_store.get_context("saved_contexts", {})
 
-    # Convert to list format
-    contexts = [
-        {
-            "id": context_id,
-            **context_data
-        }
-        for context_id, context_data in contexts_data.items()
-    ]
+        # Convert to list format
+        contexts = [
+            {
+                "id": context_id,
+                **context_data
+            }
+            for context_id, context_data in contexts_data.items()
+        ]
 
-    # Sort by timestamp (newest first)
-    contexts.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        # Sort by timestamp (newest first), once
+        contexts.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        saved_contexts_index = deque(contexts)
+
+    start = max(offset, 0)
+    stop = None if limit is None else start + max(limit, 0)
+    contexts = list(islice(saved_contexts_index, start, stop))
 
-    return {"contexts": contexts, "total": len(contexts)}
+    return {"contexts": contexts, "total": len(saved_contexts_index)}
 
 
 @app.post("/api/update-watch-config")
@@ -706,12 +994,12 @@ async def update_watch_config(config: WatchConfig):
     if not coordinator:
         raise HTTPException(status_code=503, detail="Coordinator not initialized")
 
-    coordinator.context_store.set_context("watch.config", config.dict())
+    set_watch_config("watch.config", config.dict())
 
     return {
         "status": "updated",
         "config": config,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 
@@ -725,7 +1013,7 @@ async def get_deployments():
     if not coordinator:
         raise HTTPException(status_code=503, detail="Coordinator not initialized")
 
-    deployments = coordinator.context_store.get_context("deployments", [])
+    deployments = coordinator.context_store.read_log("deployments")
 
     # Sort by timestamp (newest first)
     deployments.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
@@ -752,12 +1040,12 @@ async def get_deployment_details(task_id: str):
         return {
             "task_id": task_id,
             "result": task_result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
     # Check in deployments
-    deployments = coordinator.context_store.get_context("deployments", [])
-    for deployment in deployments:
+    deployments = coordinator.context_store.read_log("deployments")
+    for deployment in reversed(deployments):
         if deployment.get("task_id") == task_id:
             return deployment
 
@@ -806,7 +1094,7 @@ async def refresh_codebase_context():
     return {
         "status": "refreshed",
         "codebase": context,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 
@@ -12,11 +12,24 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, Dict, List
+from contextlib import asynccontextmanager
 from datetime import datetime
+import itertools
 import os
+import secrets
+import time
 import anthropic
 
-app = FastAPI(title="Agent Swarm API - Hybrid Mode")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    print("🚀 Agent Swarm (Hybrid Mode) - Starting...")
+    print("✓ No complex agent initialization")
+    print("✓ Real message storage enabled")
+    print("✓ Intent parsing enabled")
+    print("🤖 Hybrid Mode Online!")
+    yield
+
+app = FastAPI(title="Agent Swarm API - Hybrid Mode", lifespan=lifespan)
 
 # CORS
 app.add_middleware(
@@ -37,6 +50,26 @@ watch_config = {
     "primary_color": "#9333EA"
 }
 
+# IDs: a per-process random prefix plus a counter, unique without reading the clock
+_id_prefix = secrets.token_hex(3)
+_id_counter = itertools.count(1)
+
+# (second, formatted) for now_iso(), swapped as one tuple
+_now_iso_cache = (0, "")
+
+def next_id(kind: str) -> str:
+    """New ID such as "task_1a2b3c_7" for a record of the given kind"""
+    return f"{kind}_{_id_prefix}_{next(_id_counter)}"
+
+def now_iso() -> str:
+    """Current local time in ISO 8601, to the second, formatted once per second"""
+    global _now_iso_cache
+    second = int(time.time())
+    cached = _now_iso_cache
+    if cached[0] != second:
+        cached = _now_iso_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return cached[1]
+
 # Claude API client (optional)
 claude_client = None
 try:
@@ -58,21 +91,13 @@ class WatchConfig(BaseModel):
     animation_url: str
     primary_color: str
 
-@app.on_event("startup")
-async def startup():
-    print("🚀 Agent Swarm (Hybrid Mode) - Starting...")
-    print("✓ No complex agent initialization")
-    print("✓ Real message storage enabled")
-    print("✓ Intent parsing enabled")
-    print("🤖 Hybrid Mode Online!")
-
 @app.get("/")
 def root():
     return {
         "status": "online",
         "service": "Agent Swarm API (Hybrid)",
         "mode": "hybrid",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 @app.get("/health")
@@ -117,7 +142,7 @@ def get_agent_detail(agent_id: str):
             "capabilities": ["message_storage", "intent_parsing", "claude_api"],
             "workflows": ["watch_message_processing", "task_routing"],
             "uptime": "active",
-            "last_heartbeat": datetime.now().isoformat()
+            "last_heartbeat": now_iso()
         }
     else:
         raise HTTPException(status_code=404, detail="Agent not found")
@@ -164,7 +189,7 @@ def get_codebase_context():
             "watch": "Galaxy Watch 4 (40mm, 396x396px AMOLED)",
             "deployment": "Railway (backend), Vercel (dashboard)"
         },
-        "last_updated": datetime.now().isoformat()
+        "last_updated": now_iso()
     }
     return {"codebase": context}
 
@@ -175,7 +200,7 @@ async def refresh_codebase_context():
     context_data = get_codebase_context()
     return {
         "status": "refreshed",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "message": "Codebase context updated",
         **context_data
     }
@@ -218,7 +243,7 @@ def update_watch_config(config: WatchConfig):
     return {
         "status": "updated",
         "config": config,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 class WatchMessageRequest(BaseModel):
@@ -265,7 +290,7 @@ async def send_watch_message(request: WatchMessageRequest):
     return {
         "status": "success",
         "reply": reply_text,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "message": "Response sent to watch via config update"
     }
 
@@ -278,7 +303,7 @@ async def create_task(request: TaskRequest):
     """Task submission endpoint for Lovable dashboard"""
     global tasks
 
-    task_id = f"task_{datetime.now().timestamp()}"
+    task_id = next_id("task")
     task = {
         "task_id": task_id,
         "description": request.description,
@@ -322,7 +347,7 @@ async def send_test_message(request: TestMessageRequest):
     return {
         "status": "success",
         "message": "Test message sent to watch",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 class ConnectorPostRequest(BaseModel):
@@ -336,7 +361,7 @@ async def post_to_connector(request: ConnectorPostRequest):
     print(f"📢 Connector post: {request.connector} - {request.content[:50]}...")
 
     post_record = {
-        "post_id": f"post_{datetime.now().timestamp()}",
+        "post_id": next_id("post"),
         "connector": request.connector,
         "content": request.content,
         "status": "posted",
@@ -424,7 +449,7 @@ async def chat(request: ChatRequest):
 
     # ALWAYS save the message to saved_contexts (not just for certain intents)
     context_text = request.message.replace("save context:", "").replace("Save context:", "").strip()
-    context_id = f"context_{datetime.now().timestamp()}"
+    context_id = next_id("context")
 
     saved_contexts[context_id] = {
         "text": context_text,
@@ -11,6 +11,7 @@ import os.path
 import pickle
 from datetime import datetime, timedelta
 import re
+import threading
 
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
@@ -20,6 +21,10 @@ class GoogleCalendarClient:
         self.credentials_path = credentials_path
         self.token_path = token_path
         self.creds = None
+        self._service = None
+        # httplib2 (under the API client) is not thread-safe, and requests
+        # come in from worker threads
+        self._lock = threading.Lock()
         self._authenticate()
 
     def _authenticate(self):
@@ -42,10 +47,14 @@ class GoogleCalendarClient:
             with open(self.token_path, 'wb') as token:
                 pickle.dump(self.creds, token)
 
+    def _get_service(self):
+        """Build the Calendar API service once; the credentials refresh themselves on expiry"""
+        if self._service is None:
+            self._service = build('calendar', 'v3', credentials=self.creds)
+        return self._service
+
     def create_event(self, summary: str, start_time: datetime, duration_minutes: int = 60, attendees: list = None):
         """Create a calendar event"""
-        service = build('calendar', 'v3', credentials=self.creds)
-
         end_time = start_time + timedelta(minutes=duration_minutes)
 
         event = {
@@ -63,7 +72,9 @@ class GoogleCalendarClient:
         if attendees:
             event['attendees'] = [{'email': email} for email in attendees]
 
-        event_result = service.events().insert(calendarId='primary', body=event).execute()
+        with self._lock:
+            service = self._get_service()
+            event_result = service.events().insert(calendarId='primary', body=event).execute()
         return event_result.get('htmlLink')
 
 
@@ -111,11 +122,13 @@ def parse_calendar_command(message: str) -> dict:
 
 # Singleton instance
 _calendar_client = None
+_calendar_client_lock = threading.Lock()
 
 
 def get_calendar_client():
     """Get or create calendar client singleton"""
     global _calendar_client
-    if _calendar_client is None:
-        _calendar_client = GoogleCalendarClient()
+    with _calendar_client_lock:
+        if _calendar_client is None:
+            _calendar_client = GoogleCalendarClient()
     return _calendar_client
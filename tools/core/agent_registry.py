@@ -5,14 +5,48 @@ Maintains a registry of all active agents in the swarm, their capabilities,
 current tasks, and health status.
 """
 
+import os
+import re
+import time
+from array import array
+import functools
+import threading
 import yaml
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional
+from typing import List, Dict, FrozenSet, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime: float) -> Dict:
+    """Parse a YAML file once per (path, mtime)"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
+def load_agent_config(config_path) -> Dict:
+    """
+    Load agent_roles.yaml, sharing one parsed copy across all agents
+
+    The file is re-parsed only when its mtime changes. The returned dict is
+    shared, so callers must treat it as read-only.
+
+    Args:
+        config_path: Path to agent_roles.yaml
+
+    Returns:
+        Parsed configuration
+    """
+    path = os.fspath(config_path)
+    return _load_yaml_cached(path, os.path.getmtime(path))
+
+
 class AgentStatus(Enum):
     """Status of an agent"""
     STARTING = "starting"
@@ -22,18 +56,29 @@ class AgentStatus(Enum):
     OFFLINE = "offline"
 
 
-@dataclass
+# Words of a task description, matched against the lowercased text
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a task assigned to an agent"""
     task_id: str
     workflow: str
     description: str
     priority: str
-    assigned_at: str
-    started_at: Optional[str] = None
+    assigned_at: float  # time.time() seconds since epoch
+    started_at: Optional[float] = None  # time.time() when execution began
     completed_at: Optional[str] = None
     status: str = "pending"  # pending, in_progress, completed, failed
 
+    # Lowercased description words, computed once so agents test keywords by
+    # set membership; derived, so never serialized (see Agent.to_dict)
+    tokens: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.tokens = frozenset(_WORD_RE.findall((self.description or "").lower()))
+
 
 @dataclass
 class Agent:
@@ -55,11 +100,14 @@ class Agent:
         """Convert agent to dictionary"""
         data = asdict(self)
         data['status'] = self.status.value
+        for task in data['current_tasks']:
+            task.pop('tokens', None)
         return data
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Agent':
         """Create agent from dictionary"""
+        data = dict(data)  # Don't mutate the caller's (possibly stored) dict
         data['status'] = AgentStatus(data['status'])
         data['current_tasks'] = [
             Task(**task) if isinstance(task, dict) else task
@@ -72,9 +120,23 @@ class AgentRegistry:
     """
     Registry for tracking active agents
 
-    Uses context store as backend for persistent storage.
+    Uses context store as backend for persistent storage. With a Redis-backed
+    store, liveness is an expiring agent:<id>:alive key instead of a rewrite
+    of the whole agent record on every heartbeat.
+
+    Reads (routing, monitoring, stats) iterate an immutable snapshot of the
+    active agents that is republished on every write made through this
+    registry, so readers never lock or touch the store. The snapshot is also
+    rebuilt from the store once it is older than SNAPSHOT_MAX_AGE, which
+    picks up changes made by agents in other processes.
     """
 
+    # Seconds an agent stays alive without a heartbeat (Redis stores only)
+    HEARTBEAT_TTL = 90
+
+    # Seconds before a read rebuilds the snapshot from the context store
+    SNAPSHOT_MAX_AGE = 1.0
+
     def __init__(self, context_store, config_path: str = None):
         """
         Initialize agent registry
@@ -91,13 +153,24 @@ class AgentRegistry:
         self.config_path = Path(config_path)
         self.config = self._load_config()
 
+        # Redis client when the context store is Redis-backed
+        self._redis = getattr(context_store, "redis", None)
+
+        # Copy-on-write view of active agents (see class docstring)
+        self._lock = threading.Lock()
+        self._agents: Dict[str, Agent] = {}
+        self._snapshot: tuple = ()
+        self._by_role: Dict[str, tuple] = {}
+        # role -> (agents with spare capacity, their current task counts)
+        self._available_by_role: Dict[str, Tuple[Tuple[Agent, ...], array]] = {}
+        self._snapshot_at: float = 0.0
+
     def _load_config(self) -> Dict:
         """Load agent configuration from YAML"""
         if not self.config_path.exists():
             return {"agents": {}}
 
-        with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return load_agent_config(self.config_path)
 
     def register_agent(self, agent_id: str, role: str, capabilities: List[str] = None,
                       workflows: List[str] = None, metadata: Dict = None) -> bool:
@@ -146,6 +219,7 @@ class AgentRegistry:
 
         # Store in context
         self._save_agent(agent)
+        self._mark_alive(agent_id)
 
         # Add to active agents list
         active_agents = self.context_store.get_context("system.active_agents", [])
@@ -175,6 +249,12 @@ class AgentRegistry:
 
         # Delete agent data
         self.context_store.delete_context(f"agents.{agent_id}")
+        if self._redis is not None:
+            self._redis.delete(f"agent:{agent_id}:alive")
+
+        with self._lock:
+            self._agents.pop(agent_id, None)
+            self._publish_snapshot()
 
         return True
 
@@ -198,9 +278,31 @@ class AgentRegistry:
         Get all active agents
 
         Returns:
-            List of Agent objects
+            List of Agent objects (shared with the snapshot; treat as read-only)
+        """
+        return list(self._current_snapshot())
+
+    def get_snapshot(self) -> tuple:
+        """
+        Get the active agent snapshot itself
+
+        Every change publishes a new tuple, while a periodic refresh that finds
+        nothing changed keeps the old one, so callers can cache anything
+        derived from it for as long as the tuple they get back is the same
+        object (compare with "is").
+
+        Returns:
+            Immutable tuple of Agent objects (treat the agents as read-only)
         """
-        agent_ids = self.context_store.get_context("system.active_agents", [])
+        return self._current_snapshot()
+
+    def refresh_snapshot(self):
+        """Rebuild the active agent snapshot from the context store"""
+        if self._redis is not None:
+            # Agents whose liveness key expired have stopped heartbeating
+            agent_ids = [key.split(":")[1] for key in self._redis.scan_iter("agent:*:alive")]
+        else:
+            agent_ids = self.context_store.get_context("system.active_agents", [])
         agents = []
 
         for agent_id in agent_ids:
@@ -208,12 +310,83 @@ class AgentRegistry:
             if agent:
                 agents.append(agent)
 
-        return agents
+        agents_by_id = {agent.agent_id: agent for agent in agents}
+        with self._lock:
+            if agents_by_id == self._agents and self._snapshot_at:
+                # Nothing changed: keep the published snapshot, so anything
+                # cached against it (see get_snapshot) stays valid
+                self._snapshot_at = time.monotonic()
+                return
+            self._agents = agents_by_id
+            self._publish_snapshot()
+
+    def _current_snapshot(self) -> tuple:
+        """Return the snapshot, rebuilding it first if it is stale"""
+        if time.monotonic() - self._snapshot_at > self.SNAPSHOT_MAX_AGE:
+            self.refresh_snapshot()
+        return self._snapshot
+
+    def _publish_snapshot(self):
+        """Publish a new immutable snapshot (caller holds self._lock)"""
+        by_role: Dict[str, list] = {}
+        available_by_role: Dict[str, tuple] = {}
+        for agent in self._agents.values():
+            by_role.setdefault(agent.role, []).append(agent)
+
+            load = len(agent.current_tasks)
+            if agent.status in (AgentStatus.IDLE, AgentStatus.BUSY) and load < agent.max_concurrent_tasks:
+                agents, loads = available_by_role.setdefault(agent.role, ([], array('i')))
+                agents.append(agent)
+                loads.append(load)
+
+        # Plain attribute assignment is atomic, so readers need no lock
+        self._snapshot = tuple(self._agents.values())
+        self._by_role = {role: tuple(agents) for role, agents in by_role.items()}
+        self._available_by_role = {
+            role: (tuple(agents), loads) for role, (agents, loads) in available_by_role.items()
+        }
+        self._snapshot_at = time.monotonic()
 
     def get_agents_by_role(self, role: str) -> List[Agent]:
         """Get all agents with a specific role"""
-        all_agents = self.get_active_agents()
-        return [agent for agent in all_agents if agent.role == role]
+        self._current_snapshot()
+        return list(self._by_role.get(role, ()))
+
+    def get_available_agents_by_role(self, role: str) -> List[Agent]:
+        """Get agents of a role that can take on another task"""
+        self._current_snapshot()
+        agents, _ = self._available_by_role.get(role, ((), None))
+        return list(agents)
+
+    def get_least_loaded_agent(self, role: str, planned: Optional[Dict[str, int]] = None) -> Optional[Agent]:
+        """
+        Get the available agent of a role with the fewest current tasks
+
+        Args:
+            role: Agent role to pick from
+            planned: Tasks already assigned per agent ID that the snapshot does
+                not count yet (e.g. earlier tasks of the same batch)
+
+        Returns:
+            Agent or None if no agent of that role has spare capacity
+        """
+        self._current_snapshot()
+        agents: Tuple[Agent, ...]
+        loads: array
+        agents, loads = self._available_by_role.get(role, ((), array('i')))
+        if not agents:
+            return None
+        if not planned:
+            # Integer compares over the packed load array, no per-agent attribute access
+            return agents[min(range(len(loads)), key=loads.__getitem__)]
+
+        best = None
+        best_load = 0
+        for agent, load in zip(agents, loads):
+            load += planned.get(agent.agent_id, 0)
+            if load < agent.max_concurrent_tasks and (best is None or load < best_load):
+                best, best_load = agent, load
+        return best
 
     def get_agents_by_capability(self, capability: str) -> List[Agent]:
         """Get all agents with a specific capability"""
@@ -241,6 +414,9 @@ class AgentRegistry:
         Returns:
             True if successful
         """
+        if self._redis is not None:
+            return self._mark_alive(agent_id)
+
         agent = self.get_agent(agent_id)
         if not agent:
             return False
@@ -269,7 +445,7 @@ class AgentRegistry:
             return False
 
         # Add task to agent's current tasks
-        task.assigned_at = datetime.now().isoformat()
+        task.assigned_at = time.time()
         task.status = "pending"
         agent.current_tasks.append(task)
         agent.status = AgentStatus.BUSY
@@ -286,7 +462,7 @@ class AgentRegistry:
         for task in agent.current_tasks:
             if task.task_id == task_id:
                 task.status = "in_progress"
-                task.started_at = datetime.now().isoformat()
+                task.started_at = time.time()
                 self._save_agent(agent)
                 return True
 
@@ -396,10 +572,9 @@ class AgentRegistry:
         Returns:
             List of available agents
         """
-        all_agents = self.get_active_agents()
         available = []
 
-        for agent in all_agents:
+        for agent in self._current_snapshot():
             # Check if agent has capacity
             if len(agent.current_tasks) < agent.max_concurrent_tasks:
                 # Check status
@@ -414,13 +589,28 @@ class AgentRegistry:
         """Check if an agent is registered"""
         return self.context_store.get_context(f"agents.{agent_id}") is not None
 
+    def _mark_alive(self, agent_id: str) -> bool:
+        """Refresh the agent's expiring liveness key (Redis stores only)"""
+        if self._redis is None:
+            return False
+        self._redis.set(f"agent:{agent_id}:alive", "1", ex=self.HEARTBEAT_TTL)
+        return True
+
     def _save_agent(self, agent: Agent):
-        """Save agent to context store"""
+        """Save agent to context store and republish the snapshot"""
         self.context_store.set_context(f"agents.{agent.agent_id}", agent.to_dict())
 
+        # Seed the snapshot from the store before the first local write
+        if not self._snapshot_at:
+            self.refresh_snapshot()
+
+        with self._lock:
+            self._agents[agent.agent_id] = agent
+            self._publish_snapshot()
+
     def get_system_stats(self) -> Dict:
         """Get overall system statistics"""
-        agents = self.get_active_agents()
+        agents = self._current_snapshot()
 
         total_tasks = 0
         total_completed = 0
@@ -8,11 +8,14 @@ Supports both Redis and JSON file backends.
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Dict, Callable
+from collections import deque
+from typing import Any, Optional, Dict, Callable, List
 from pathlib import Path
 from datetime import datetime
 import threading
 
+from .serialization import dumps, loads
+
 
 class ContextStoreInterface(ABC):
     """Abstract interface for context store implementations"""
@@ -74,6 +77,42 @@ class ContextStoreInterface(ABC):
         """Watch for changes at a specific path (optional feature)"""
         pass
 
+    @abstractmethod
+    def append_log(self, name: str, record: Any) -> bool:
+        """
+        Append a record to an append-only log (e.g. "deployments")
+
+        Logs live beside the context tree rather than in it, so appending is
+        O(1) instead of rewriting the whole history on every record.
+
+        Args:
+            name: Log name
+            record: JSON-compatible record
+
+        Returns:
+            True if successful
+        """
+        pass
+
+    @abstractmethod
+    def read_log(self, name: str, limit: Optional[int] = None) -> List[Any]:
+        """
+        Read records from an append-only log
+
+        Args:
+            name: Log name
+            limit: Only return the newest `limit` records
+
+        Returns:
+            Records, oldest first
+        """
+        pass
+
+    @abstractmethod
+    def log_length(self, name: str) -> int:
+        """Number of records in an append-only log"""
+        pass
+
 
 class JSONFileContextStore(ContextStoreInterface):
     """
@@ -100,7 +139,7 @@ class JSONFileContextStore(ContextStoreInterface):
         self.auto_save = auto_save
         self.context: Dict = {}
         self.watchers: Dict[str, list] = {}  # path -> list of callbacks
-        self.lock = threading.Lock()
+        self.lock = threading.RLock()  # _save() re-acquires it inside set_context
 
         # Create parent directory if needed
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -258,6 +297,40 @@ class JSONFileContextStore(ContextStoreInterface):
                 except Exception as e:
                     print(f"Error in watcher callback: {e}")
 
+    def _log_path(self, name: str) -> Path:
+        """JSONL file backing the log `name`, next to the context file"""
+        return self.file_path.parent / f"{name}.jsonl"
+
+    def append_log(self, name: str, record: Any) -> bool:
+        """Append one JSON line to the log file"""
+        line = dumps(record) + b"\n"
+        with self.lock:
+            try:
+                with open(self._log_path(name), 'ab') as f:
+                    f.write(line)
+                return True
+            except OSError as e:
+                print(f"Error appending to log {name}: {e}")
+                return False
+
+    def read_log(self, name: str, limit: Optional[int] = None) -> List[Any]:
+        """Read the log file, decoding only the lines that are returned"""
+        try:
+            with open(self._log_path(name), 'rb') as f:
+                lines = deque(f, maxlen=limit) if limit else f.readlines()
+        except FileNotFoundError:
+            return []
+
+        return [loads(line) for line in lines if line.strip()]
+
+    def log_length(self, name: str) -> int:
+        """Count the lines in the log file without decoding them"""
+        try:
+            with open(self._log_path(name), 'rb') as f:
+                return sum(1 for line in f if line.strip())
+        except FileNotFoundError:
+            return 0
+
     def append_to_list(self, path: str, item: Any) -> bool:
         """Convenience method to append item to a list at path"""
         current_list = self.get_context(path, [])
@@ -268,6 +341,16 @@ class JSONFileContextStore(ContextStoreInterface):
         current_list.append(item)
         return self.set_context(path, current_list)
 
+    def extend_list(self, path: str, items: list) -> bool:
+        """Append several items to a list at path with a single save"""
+        current_list = self.get_context(path, [])
+
+        if not isinstance(current_list, list):
+            return False
+
+        current_list.extend(items)
+        return self.set_context(path, current_list)
+
     def remove_from_list(self, path: str, item: Any) -> bool:
         """Convenience method to remove item from a list at path"""
         current_list = self.get_context(path, [])
@@ -404,6 +487,57 @@ class RedisContextStore(ContextStoreInterface):
                 except Exception as e:
                     print(f"Error in watcher callback: {e}")
 
+    # Appends server-side so concurrent agents never overwrite each other's items
+    _APPEND_SCRIPT = """
+    local current = redis.call('GET', KEYS[1])
+    local items = {}
+    if current then items = cjson.decode(current) end
+    for _, item in ipairs(cjson.decode(ARGV[1])) do
+        table.insert(items, item)
+    end
+    local encoded = cjson.encode(items)
+    redis.call('SET', KEYS[1], encoded)
+    redis.call('PUBLISH', ARGV[2], encoded)
+    return #items
+    """
+
+    def _log_key(self, name: str) -> str:
+        """Redis list backing the log `name`"""
+        return f"{self.prefix}:log:{name}"
+
+    def append_log(self, name: str, record: Any) -> bool:
+        """RPUSH the record onto the log's Redis list"""
+        self.redis.rpush(self._log_key(name), dumps(record))
+        return True
+
+    def read_log(self, name: str, limit: Optional[int] = None) -> List[Any]:
+        """LRANGE over the newest `limit` entries (or all of them)"""
+        start = -limit if limit else 0
+        return [loads(item) for item in self.redis.lrange(self._log_key(name), start, -1)]
+
+    def log_length(self, name: str) -> int:
+        """LLEN of the log's Redis list"""
+        return self.redis.llen(self._log_key(name))
+
+    def append_to_list(self, path: str, item: Any) -> bool:
+        """Append item to the list at path atomically inside Redis"""
+        return self.extend_list(path, [item])
+
+    def extend_list(self, path: str, items: list) -> bool:
+        """Append several items to the list at path in one round trip"""
+        if not hasattr(self, "_append"):
+            self._append = self.redis.register_script(self._APPEND_SCRIPT)
+
+        try:
+            self._append(
+                keys=[self._make_key(path)],
+                args=[json.dumps(items), f"{self.prefix}:watch:{path}"]
+            )
+            return True
+        except Exception as e:
+            print(f"Error appending to {path}: {e}")
+            return False
+
 
 class ContextStore:
     """Factory class for creating context store implementations"""
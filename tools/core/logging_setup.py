@@ -0,0 +1,129 @@
+"""
+Logging Setup - Queue-backed logging for agents
+
+Agent threads only enqueue log records; a single QueueListener thread formats
+them and writes to stdout. This keeps stdout I/O (and its lock) off the task
+path when many agents log at once. All swarm loggers live under the "swarm"
+namespace and the level comes from the LOG_LEVEL environment variable.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+ROOT_LOGGER = "swarm"
+
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+class _BatchingStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the listener instead of every record"""
+
+    def flush(self):
+        pass
+
+    def flush_stream(self):
+        """Flush the underlying stream"""
+        super().flush()
+
+
+class _BatchingQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers only once the queue is drained
+
+    A burst of records becomes one buffered write plus one flush, rather than
+    a flush (and a write syscall) per record. On a terminal, stdout is still
+    line buffered, so batching mainly applies when output goes to a pipe or file.
+    """
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            self._flush_handlers()
+            return self.queue.get(block)
+
+    def stop(self):
+        super().stop()
+        self._flush_handlers()
+
+    def _flush_handlers(self):
+        for handler in self.handlers:
+            if isinstance(handler, _BatchingStreamHandler):
+                handler.flush_stream()
+
+
+class AgentLogAdapter(logging.LoggerAdapter):
+    """Prefixes every message with the agent ID, matching the "[agent-id] ..." console style"""
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['agent_id']}] {msg}", kwargs
+
+
+def configure_logging(level: Optional[str] = None) -> logging.Logger:
+    """
+    Attach the queue handler and start the listener thread (once per process)
+
+    Args:
+        level: Log level name (defaults to $LOG_LEVEL, then INFO)
+
+    Returns:
+        The root "swarm" logger
+    """
+    global _listener
+
+    root = logging.getLogger(ROOT_LOGGER)
+    with _lock:
+        if _listener is not None:
+            return root
+
+        stream_handler = _BatchingStreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+        log_queue: queue.Queue = queue.Queue(-1)
+        root.addHandler(QueueHandler(log_queue))
+        root.setLevel(level or os.getenv("LOG_LEVEL", "INFO").upper())
+        root.propagate = False
+
+        _listener = _BatchingQueueListener(log_queue, stream_handler)
+        _listener.start()
+
+        # Flush queued records on interpreter exit
+        atexit.register(_listener.stop)
+
+    return root
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger under the "swarm" namespace
+
+    Args:
+        name: Dotted suffix, e.g. "api" for "swarm.api"
+
+    Returns:
+        Logger writing through the shared queue
+    """
+    configure_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def get_agent_logger(agent_id: str, role: str) -> AgentLogAdapter:
+    """
+    Get the logger for an agent instance
+
+    Args:
+        agent_id: Agent ID, prefixed to every message
+        role: Agent role, used as the logger name (e.g. "swarm.agent.deployer_agent")
+
+    Returns:
+        Logger adapter for the agent
+    """
+    return AgentLogAdapter(get_logger(f"agent.{role}"), {"agent_id": agent_id})
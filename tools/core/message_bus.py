@@ -1,18 +1,20 @@
 """
 Message Bus - Inter-agent communication system
 
-Provides event-driven communication between agents using either Redis Streams
-or an in-memory queue for testing.
+Provides event-driven communication between agents using Redis Streams,
+Redis pub/sub, or an in-memory queue for testing.
 """
 
-import json
+import sys
 import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, asdict
 from typing import List, Optional, Callable, Dict
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
+
+from .serialization import dumps, loads
 
 
 class MessageType(Enum):
@@ -27,7 +29,25 @@ class MessageType(Enum):
     ESCALATION = "escalation"
 
 
-@dataclass
+class Priority(IntEnum):
+    """Message/task priority; lower values are handled first"""
+    URGENT = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+    @classmethod
+    def parse(cls, value) -> 'Priority':
+        """Map a priority name (or Priority) to its enum, defaulting to NORMAL"""
+        if isinstance(value, Priority):
+            return value
+        return _PRIORITY_BY_NAME.get(value, Priority.NORMAL)
+
+
+_PRIORITY_BY_NAME: Dict[str, Priority] = {p.name.lower(): p for p in Priority}
+
+
+@dataclass(slots=True)
 class Message:
     """Structure for messages passed between agents"""
     id: str
@@ -50,9 +70,30 @@ class Message:
     def from_dict(cls, data: Dict) -> 'Message':
         """Create message from dictionary"""
         data['message_type'] = MessageType(data['message_type'])
+        # Agent IDs and priorities repeat across every message; intern them so
+        # lookups keyed on them compare by identity
+        data['from_agent'] = sys.intern(data['from_agent'])
+        data['to_agent'] = sys.intern(data['to_agent'])
+        data['priority'] = sys.intern(data.get('priority', 'normal'))
         return cls(**data)
 
 
+def _new_message(from_agent: str, to_agent: str, message_type: MessageType,
+                 payload: Dict, priority: str = "normal",
+                 requires_response: bool = False) -> Message:
+    """Create a new message with a fresh ID and timestamp"""
+    return Message(
+        id=f"msg_{uuid.uuid4().hex[:16]}",
+        timestamp=datetime.now().isoformat(),
+        from_agent=from_agent,
+        to_agent=to_agent,
+        message_type=message_type,
+        payload=payload,
+        priority=sys.intern(priority),
+        requires_response=requires_response
+    )
+
+
 class MessageBusInterface(ABC):
     """Abstract interface for message bus implementations"""
 
@@ -69,6 +110,18 @@ class MessageBusInterface(ABC):
         """Broadcast a message to all agents"""
         pass
 
+    def publish_many(self, messages: List[Dict]) -> List[str]:
+        """
+        Publish several messages in one submission
+
+        Args:
+            messages: List of publish_message keyword-argument dicts
+
+        Returns:
+            Message IDs in the same order
+        """
+        return [self.publish_message(**message) for message in messages]
+
     @abstractmethod
     def subscribe_to_messages(self, agent_id: str, callback: Callable[[Message], None]) -> None:
         """Subscribe to messages for a specific agent"""
@@ -108,16 +161,8 @@ class InMemoryMessageBus(MessageBusInterface):
                        payload: Dict, priority: str = "normal",
                        requires_response: bool = False) -> str:
         """Publish a message to a specific agent"""
-        message = Message(
-            id=f"msg_{uuid.uuid4().hex[:16]}",
-            timestamp=datetime.now().isoformat(),
-            from_agent=from_agent,
-            to_agent=to_agent,
-            message_type=message_type,
-            payload=payload,
-            priority=priority,
-            requires_response=requires_response
-        )
+        message = _new_message(from_agent, to_agent, message_type, payload,
+                               priority, requires_response)
 
         # Store message
         self.message_store[message.id] = message
@@ -209,10 +254,7 @@ class InMemoryMessageBus(MessageBusInterface):
 
     def _sort_queue(self, agent_id: str):
         """Sort message queue by priority"""
-        priority_order = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
-        self.messages[agent_id].sort(
-            key=lambda m: priority_order.get(m.priority, 2)
-        )
+        self.messages[agent_id].sort(key=lambda m: Priority.parse(m.priority))
 
 
 class RedisMessageBus(MessageBusInterface):
@@ -239,50 +281,71 @@ class RedisMessageBus(MessageBusInterface):
         except Exception as e:
             raise ConnectionError(f"Could not connect to Redis: {e}")
 
+        # Surfaced as the builtin ConnectionError so callers can retry
+        self._connection_errors = (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)
+
     def publish_message(self, from_agent: str, to_agent: str, message_type: MessageType,
                        payload: Dict, priority: str = "normal",
                        requires_response: bool = False) -> str:
         """Publish a message using Redis Streams"""
-        message = Message(
-            id=f"msg_{uuid.uuid4().hex[:16]}",
-            timestamp=datetime.now().isoformat(),
-            from_agent=from_agent,
-            to_agent=to_agent,
-            message_type=message_type,
-            payload=payload,
-            priority=priority,
-            requires_response=requires_response
-        )
+        return self.publish_many([{
+            "from_agent": from_agent,
+            "to_agent": to_agent,
+            "message_type": message_type,
+            "payload": payload,
+            "priority": priority,
+            "requires_response": requires_response
+        }])[0]
+
+    def publish_many(self, messages: List[Dict]) -> List[str]:
+        """Publish several messages in a single pipeline round trip"""
+        pipe = self.redis.pipeline(transaction=False)
+        message_ids = []
+
+        for fields in messages:
+            message = _new_message(**fields)
+            self._queue_message(pipe, message)
+            message_ids.append(message.id)
+
+        self._execute(pipe)
+        return message_ids
 
+    def _queue_message(self, pipe, message: Message):
+        """Queue the stream entry and status hash for a message on a pipeline"""
         # Use Redis Stream for the target agent
-        stream_name = f"agent:{to_agent}:messages"
+        stream_name = f"agent:{message.to_agent}:messages"
 
         # Add to stream
-        self.redis.xadd(
+        pipe.xadd(
             stream_name,
             {
                 "message_id": message.id,
-                "data": json.dumps(message.to_dict())
+                "data": dumps(message.to_dict())
             }
         )
 
         # Store message details in hash for status lookup
-        self.redis.hset(
+        pipe.hset(
             f"message:{message.id}",
             mapping={
-                "from_agent": from_agent,
-                "to_agent": to_agent,
+                "from_agent": message.from_agent,
+                "to_agent": message.to_agent,
                 "timestamp": message.timestamp,
                 "acknowledged": "false"
             }
         )
 
-        return message.id
+    def _execute(self, pipe):
+        """Flush a pipeline, mapping Redis connection failures to ConnectionError"""
+        try:
+            pipe.execute()
+        except self._connection_errors as e:
+            raise ConnectionError(f"Lost connection to Redis: {e}") from e
 
     def broadcast_message(self, from_agent: str, message_type: MessageType,
                          payload: Dict, priority: str = "normal") -> List[str]:
         """Broadcast message to all registered agents"""
-        message_ids = []
+        messages = []
 
         # Get all agent streams
         agent_streams = self.redis.keys("agent:*:messages")
@@ -295,16 +358,16 @@ class RedisMessageBus(MessageBusInterface):
             if agent_id == from_agent:
                 continue
 
-            msg_id = self.publish_message(
-                from_agent=from_agent,
-                to_agent=agent_id,
-                message_type=message_type,
-                payload=payload,
-                priority=priority
-            )
-            message_ids.append(msg_id)
+            messages.append({
+                "from_agent": from_agent,
+                "to_agent": agent_id,
+                "message_type": message_type,
+                "payload": payload,
+                "priority": priority
+            })
 
-        return message_ids
+        # One pipeline for the whole fanout
+        return self.publish_many(messages) if messages else []
 
     def subscribe_to_messages(self, agent_id: str, callback: Callable[[Message], None]) -> None:
         """
@@ -333,7 +396,7 @@ class RedisMessageBus(MessageBusInterface):
             for stream, message_list in messages:
                 for msg_id, data in message_list:
                     try:
-                        message_data = json.loads(data['data'])
+                        message_data = loads(data['data'])
                         message = Message.from_dict(message_data)
                         callback(message)
 
@@ -361,7 +424,7 @@ class RedisMessageBus(MessageBusInterface):
                 msg_id = item['message_id']
                 data = self.redis.xrange(stream_name, msg_id, msg_id)
                 if data:
-                    message_data = json.loads(data[0][1]['data'])
+                    message_data = loads(data[0][1]['data'])
                     messages.append(Message.from_dict(message_data))
 
             return messages
@@ -385,6 +448,76 @@ class RedisMessageBus(MessageBusInterface):
         return self.redis.hgetall(key)
 
 
+class RedisPubSubMessageBus(RedisMessageBus):
+    """
+    Redis pub/sub message bus for low-latency fanout between processes
+
+    Each agent listens on its own channel plus a shared broadcast channel, so a
+    broadcast is a single PUBLISH and fanout happens inside Redis. Delivery is
+    fire-and-forget: agents must be subscribed to receive messages. Point
+    redis_url at a UNIX socket (unix:///tmp/redis.sock) when Redis runs on the
+    same host.
+    """
+
+    BROADCAST_CHANNEL = "agent:broadcast"
+
+    def __init__(self, redis_url: str = "redis://localhost:6379"):
+        super().__init__(redis_url)
+        self._listeners: List = []
+
+    def broadcast_message(self, from_agent: str, message_type: MessageType,
+                         payload: Dict, priority: str = "normal") -> List[str]:
+        """Broadcast a message with a single publish to the broadcast channel"""
+        message = _new_message(from_agent, "broadcast", message_type, payload, priority)
+
+        pipe = self.redis.pipeline(transaction=False)
+        self._queue_message(pipe, message)
+        self._execute(pipe)
+        return [message.id]
+
+    def _queue_message(self, pipe, message: Message):
+        """Queue the publish and status hash for a message on a pipeline"""
+        if message.to_agent == "broadcast":
+            channel = self.BROADCAST_CHANNEL
+        else:
+            channel = f"agent:{message.to_agent}"
+
+        pipe.publish(channel, dumps(message.to_dict()))
+        pipe.hset(
+            f"message:{message.id}",
+            mapping={
+                "from_agent": message.from_agent,
+                "to_agent": message.to_agent,
+                "timestamp": message.timestamp,
+                "acknowledged": "false"
+            }
+        )
+
+    def subscribe_to_messages(self, agent_id: str, callback: Callable[[Message], None]) -> None:
+        """
+        Subscribe to the agent's channel and the broadcast channel
+
+        Messages are received on a background thread, so this returns immediately.
+        """
+        def handle(raw: Dict):
+            try:
+                message = Message.from_dict(loads(raw['data']))
+                # Broadcasts are delivered to the sender too; skip our own
+                if message.to_agent == "broadcast" and message.from_agent == agent_id:
+                    return
+                callback(message)
+            except Exception as e:
+                print(f"Error processing message: {e}")
+
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{f"agent:{agent_id}": handle, self.BROADCAST_CHANNEL: handle})
+        self._listeners.append(pubsub.run_in_thread(sleep_time=0.001, daemon=True))
+
+    def get_pending_messages(self, agent_id: str, limit: int = 10) -> List[Message]:
+        """Pub/sub keeps no backlog, so there are never pending messages"""
+        return []
+
+
 class MessageBus:
     """
     Factory class for creating the appropriate message bus implementation
@@ -396,7 +529,7 @@ class MessageBus:
         Create a message bus instance
 
         Args:
-            bus_type: "in_memory" or "redis"
+            bus_type: "in_memory", "redis" (Streams) or "redis_pubsub"
             **kwargs: Additional arguments passed to the implementation
 
         Returns:
@@ -407,6 +540,9 @@ class MessageBus:
         elif bus_type == "redis":
             redis_url = kwargs.get("redis_url", "redis://localhost:6379")
             return RedisMessageBus(redis_url)
+        elif bus_type == "redis_pubsub":
+            redis_url = kwargs.get("redis_url", "redis://localhost:6379")
+            return RedisPubSubMessageBus(redis_url)
         else:
             raise ValueError(f"Unknown message bus type: {bus_type}")
 
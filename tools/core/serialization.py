@@ -0,0 +1,79 @@
+"""
+Serialization - Fast JSON encoding for messages and payloads
+
+Uses orjson (C implementation) when it is installed and falls back to the
+standard json module otherwise, so the wire format is plain JSON either way.
+"""
+
+import json
+import re
+from enum import Enum
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Body of the first markdown code block (``` or ```json); an unclosed block
+# runs to the end of the text, e.g. when a streamed response was cut short
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|\Z)", re.DOTALL)
+
+
+def _default(obj: Any) -> Any:
+    """Encode the non-JSON types payloads carry: sets as lists, enums by value"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to JSON
+
+    Args:
+        obj: JSON-compatible object (sets and enums are encoded too)
+        indent: Pretty-print with two-space indentation instead of compact output
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize JSON produced by dumps() (or any other JSON encoder)
+
+    Args:
+        data: JSON as bytes or str
+
+    Returns:
+        Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def strip_code_fence(text: str) -> str:
+    """
+    Extract the JSON from an LLM response wrapped in a markdown code block
+
+    Args:
+        text: Response text, fenced or bare
+
+    Returns:
+        The first code block's body, or the whole text if there is no fence
+    """
+    match = _FENCE_RE.search(text)
+    if match is None:
+        return text
+    return match.group(1).strip()
@@ -0,0 +1,174 @@
+"""
+Work Stealing - Per-agent task deques for in-process scheduling
+
+Every worker agent running in this process owns a deque. The coordinator pushes
+routed tasks onto the chosen agent's deque instead of sending a message, the
+owner drains its own deque, and idle agents of the same role steal from busy
+siblings. Every push also wakes the owner (and one sibling that could steal
+the work) so parked agents start immediately instead of on their next poll.
+Agents living in other processes are not registered here and keep
+receiving TASK_ASSIGNMENT messages over the message bus.
+"""
+
+import random
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+# Upper bound on how many tasks a thief takes from a victim in one steal
+MAX_STEAL = 4
+
+
+class WorkStealingDeque:
+    """
+    Double-ended task queue owned by a single agent
+
+    The owner takes tasks from the top (oldest first, so tasks run in arrival
+    order) while thieves take from the bottom, so the two rarely contend for
+    the same item. Individual deque operations are atomic in CPython, so no
+    lock is needed.
+    """
+
+    def __init__(self, owner_id: str, role: str, wake: Optional[threading.Event] = None):
+        self.owner_id = owner_id
+        self.role = role
+        self.wake = wake or threading.Event()
+        self._items: deque = deque()
+
+    def push(self, item: Any):
+        """Add an item at the bottom of the deque"""
+        self._items.append(item)
+
+    def pop(self) -> Optional[Any]:
+        """Take the oldest item (owner side)"""
+        try:
+            return self._items.popleft()
+        except IndexError:
+            return None
+
+    def steal(self, max_items: int = MAX_STEAL) -> List[Any]:
+        """
+        Take up to half of the items from the bottom (thief side)
+
+        Args:
+            max_items: Cap on the number of items taken
+
+        Returns:
+            Stolen items, oldest first
+        """
+        count = min(max(len(self._items) // 2, 1), max_items)
+        stolen = []
+        for _ in range(count):
+            try:
+                stolen.append(self._items.pop())
+            except IndexError:
+                break
+        stolen.reverse()
+        return stolen
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class WorkStealingPool:
+    """Process-wide registry of agent deques, grouped by role"""
+
+    def __init__(self):
+        self._deques: Dict[str, WorkStealingDeque] = {}
+        self._lock = threading.Lock()
+
+    def register(self, agent_id: str, role: str,
+                 wake: Optional[threading.Event] = None) -> WorkStealingDeque:
+        """
+        Create (or return) the deque owned by agent_id
+
+        Args:
+            agent_id: Owning agent
+            role: Agent role; only agents of the same role steal from each other
+            wake: Event set whenever work lands on this deque
+
+        Returns:
+            The agent's deque
+        """
+        with self._lock:
+            if agent_id not in self._deques:
+                self._deques[agent_id] = WorkStealingDeque(agent_id, role, wake)
+            return self._deques[agent_id]
+
+    def unregister(self, agent_id: str) -> List[Any]:
+        """
+        Remove an agent's deque, handing leftover items to a sibling
+
+        Returns:
+            Items that could not be handed off (no sibling of the same role)
+        """
+        with self._lock:
+            work_deque = self._deques.pop(agent_id, None)
+            if work_deque is None:
+                return []
+            siblings = [d for d in self._deques.values() if d.role == work_deque.role]
+
+        leftover = list(work_deque._items)
+        if not siblings:
+            return leftover
+
+        heir = random.choice(siblings)
+        for item in leftover:
+            heir.push(item)
+        heir.wake.set()
+        return []
+
+    def push(self, agent_id: str, item: Any) -> bool:
+        """
+        Push an item onto an agent's deque and wake it
+
+        One random sibling of the same role is woken too, so it can start
+        stealing if the owner is still busy with earlier work.
+
+        Returns:
+            False if the agent has no deque in this process
+        """
+        work_deque = self._deques.get(agent_id)
+        if work_deque is None:
+            return False
+
+        work_deque.push(item)
+        work_deque.wake.set()
+
+        siblings = [
+            d for d in list(self._deques.values())
+            if d.role == work_deque.role and d.owner_id != agent_id
+        ]
+        if siblings:
+            random.choice(siblings).wake.set()
+        return True
+
+    def steal_for(self, agent_id: str) -> List[Any]:
+        """
+        Steal work for agent_id from a random busy sibling of the same role
+
+        Returns:
+            Stolen items (empty if every sibling is idle)
+        """
+        thief = self._deques.get(agent_id)
+        if thief is None:
+            return []
+
+        victims = [
+            d for d in list(self._deques.values())
+            if d.role == thief.role and d.owner_id != agent_id and len(d) > 0
+        ]
+        if not victims:
+            return []
+
+        return random.choice(victims).steal()
+
+
+# Singleton shared by every agent in the process
+_work_pool = WorkStealingPool()
+
+
+def get_work_pool() -> WorkStealingPool:
+    """Get the process-wide work stealing pool"""
+    return _work_pool
@@ -259,12 +259,23 @@ class WorkflowParser:
             return []
 
         workflows = []
-        for md_file in search_dir.rglob("*.md"):
-            rel_path = md_file.relative_to(self.workflows_dir)
-            workflows.append(str(rel_path))
+        root = str(self.workflows_dir)
+        for md_file in self._scan_markdown(str(search_dir)):
+            workflows.append(os.path.relpath(md_file, root))
 
         return sorted(workflows)
 
+    def _scan_markdown(self, directory: str) -> List[str]:
+        """Recursively collect *.md files using os.scandir (no per-entry stat)"""
+        found = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    found.extend(self._scan_markdown(entry.path))
+                elif entry.name.endswith(".md"):
+                    found.append(entry.path)
+        return found
+
     def get_workflow_info(self, workflow_path: str) -> Dict[str, any]:
         """
         Get quick summary info about a workflow without full parsing
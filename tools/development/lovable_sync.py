@@ -97,11 +97,10 @@ class LovableSync:
             Path to synced project
         """
         try:
-            os.chdir(self.lovable_local_path)
-
             # Pull latest changes
             subprocess.run(
                 ["git", "pull", "origin", "main"],
+                cwd=self.lovable_local_path,
                 check=True,
                 capture_output=True
             )
@@ -122,14 +121,16 @@ class LovableSync:
             commit_message: Commit message
         """
         try:
-            os.chdir(self.lovable_local_path)
+            # Git runs in the project via cwd= rather than os.chdir(), which
+            # would move every other thread in the process along with it
 
             # Add all changes
-            subprocess.run(["git", "add", "."], check=True)
+            subprocess.run(["git", "add", "."], cwd=self.lovable_local_path, check=True)
 
             # Commit
             subprocess.run(
                 ["git", "commit", "-m", commit_message],
+                cwd=self.lovable_local_path,
                 check=True,
                 capture_output=True
             )
@@ -137,6 +138,7 @@ class LovableSync:
             # Push
             subprocess.run(
                 ["git", "push", "origin", branch],
+                cwd=self.lovable_local_path,
                 check=True,
                 capture_output=True
             )
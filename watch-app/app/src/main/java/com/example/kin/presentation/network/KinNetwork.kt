@@ -1,5 +1,7 @@
 package com.example.kin.presentation.network
 
+import java.io.File
+import okhttp3.Cache
 import okhttp3.OkHttpClient
 import retrofit2.Retrofit
 import retrofit2.converter.gson.GsonConverterFactory
@@ -48,6 +50,10 @@ object KinClient {
     private const val DEVICE_TOKEN = "uPzTmdc37OJLre1H3pXJvkDNesVmLcuk"
 
     private val client = OkHttpClient.Builder()
+        // HTTP cache: config polls revalidate with the server's ETag and get an
+        // empty 304 back while the config is unchanged (java.io.tmpdir is the
+        // app's cache directory on Android)
+        .cache(Cache(File(System.getProperty("java.io.tmpdir"), "http-cache"), 256L * 1024))
         .addInterceptor { chain ->
             val request = chain.request().newBuilder()
                 // Custom device authentication